@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compares decode and hydrate time of the recorded fixtures for every
+installed json decoder and every model module.
+
+    python benchmarks/decode_hydrate.py [--number 200]
+
+Times are the best of --repeat runs, in microseconds per response. Record
+new fixtures with benchmarks/record_fixtures.py.
+"""
+
+from __future__ import print_function
+
+import argparse
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyriot import api_classes, decoders, lazy_classes, slotted_classes
+
+from record_fixtures import FIXTURES_DIR, load_fixtures
+
+# builds what the wrapper function returns from the decoded json
+HYDRATORS = {
+    'recent_games': lambda models, content: [models.Game(**game) for game in content['games']],
+    'leagues': lambda models, content: dict((key, models.League(**league)) for key, league in content.items()),
+    'stats_summary': lambda models, content: [models.PlayerStatsSummary(**summary) for summary in content['playerStatSummaries']],
+    'stats_ranked': lambda models, content: models.PlayerRankedStats(**content),
+    'teams': lambda models, content: [models.Team(**team) for team in content],
+}
+
+MODELS = (api_classes, lazy_classes, slotted_classes)
+
+def _hydrate_all(result):
+    # lazy objects are only comparable once every attribute is built
+    if isinstance(result, dict):
+        result = list(result.values())
+    if not isinstance(result, list):
+        result = [result]
+    for item in result:
+        if hasattr(item, 'hydrate'):
+            item.hydrate()
+
+def _best(function, number, repeat):
+    return min(timeit.repeat(function, number=number, repeat=repeat)) / number * 1e6
+
+def run(number, repeat, directory=FIXTURES_DIR):
+    fixtures = sorted(load_fixtures(HYDRATORS, directory).items())
+    available = decoders.available_decoders()
+
+    print('decode (us per response)')
+    print('{0:<16} {1:>9}'.format('fixture', 'bytes') + ''.join('{0:>12}'.format(name) for name in available))
+    for endpoint, body in fixtures:
+        row = '{0:<16} {1:>9}'.format(endpoint, len(body))
+        for decoder in available.values():
+            row += '{0:>12.1f}'.format(_best(lambda: decoder(body), number, repeat))
+        print(row)
+
+    print()
+    print('hydrate (us per response, lazy_classes fully hydrated)')
+    print('{0:<16}'.format('fixture') + ''.join('{0:>18}'.format(models.__name__.split('.')[-1]) for models in MODELS))
+    for endpoint, body in fixtures:
+        content = decoders.stdlib_decoder(body)
+        hydrate = HYDRATORS[endpoint]
+        row = '{0:<16}'.format(endpoint)
+        for models in MODELS:
+            row += '{0:>18.1f}'.format(_best(lambda: _hydrate_all(hydrate(models, content)), number, repeat))
+        print(row)
+
+    print()
+    print('decode + hydrate with api_classes (us per response)')
+    print('{0:<16}'.format('fixture') + ''.join('{0:>12}'.format(name) for name in available))
+    for endpoint, body in fixtures:
+        hydrate = HYDRATORS[endpoint]
+        row = '{0:<16}'.format(endpoint)
+        for decoder in available.values():
+            row += '{0:>12.1f}'.format(_best(lambda: hydrate(api_classes, decoder(body)), number, repeat))
+        print(row)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--number', type=int, default=200, help='calls per timing run')
+    parser.add_argument('--repeat', type=int, default=5, help='timing runs, the best is reported')
+    parser.add_argument('--directory', default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    run(args.number, args.repeat, args.directory)
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+"""
+Records response bodies used by the benchmarks into benchmarks/fixtures,
+one per wrapper function.
+
+By default they are recorded from pyriot.testing.FakeRiotServer, sized like
+a heavy ranked player. Pass an api key to record real responses instead:
+
+    python benchmarks/record_fixtures.py --api-key KEY --region na --summoner-id 24915110 --summoner-name NAME
+"""
+
+from __future__ import print_function
+
+import argparse
+import collections
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyriot import testing
+from pyriot.wrapper import NORTH_AMERICA, RAW_BYTES, SUMMONER_CHUNK_SIZE, PyRiot
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+DEFAULT_SUMMONER_ID = 24915110
+
+def calls(summoner_id=DEFAULT_SUMMONER_ID, summoner_name=None):
+    """
+    Arguments after region of the recorded call of every wrapper function.
+    """
+    summoner_name = summoner_name or 'summoner{0}'.format(summoner_id)
+    summoner_ids = [summoner_id + index for index in range(SUMMONER_CHUNK_SIZE)]
+    # the bulk wrapper functions are recorded with several summoners, as they
+    # are called, so their urls hold a comma separated list
+    summoner_names = [summoner_name] + ['summoner{0}'.format(summoner) for summoner in summoner_ids[1:]]
+
+    return collections.OrderedDict([
+        ('champions', ()),
+        ('recent_games', (summoner_id,)),
+        ('leagues', (summoner_id,)),
+        ('stats_summary', (summoner_id,)),
+        ('stats_ranked', (summoner_id,)),
+        ('summoner_masteries', (summoner_id,)),
+        ('summoner_runes', (summoner_id,)),
+        ('summoner_get_by_name', (summoner_name,)),
+        ('summoner_get_by_id', (summoner_id,)),
+        ('summoner_get_names_for_ids', (','.join('{0}'.format(summoner) for summoner in summoner_ids),)),
+        ('summoners_by_ids', (summoner_ids,)),
+        ('summoners_by_names', (summoner_names,)),
+        ('teams', (summoner_id,)),
+    ])
+
+ENDPOINTS = tuple(calls())
+
+def load_fixtures(endpoints, directory=FIXTURES_DIR):
+    """
+    Recorded response bodies of endpoints, as a dictionary of wrapper function
+    name to bytes. Endpoints without a fixture are left out.
+    """
+    fixtures = dict()
+    for endpoint in endpoints:
+        path = os.path.join(directory, endpoint + '.json')
+        if os.path.exists(path):
+            with open(path, 'rb') as fixture:
+                fixtures[endpoint] = fixture.read()
+    return fixtures
+
+def record(priot, region, summoner_id, directory=FIXTURES_DIR, summoner_name=None):
+    if not os.path.isdir(directory):
+        os.makedirs(directory)
+
+    for endpoint, args in calls(summoner_id, summoner_name).items():
+        body = getattr(priot, endpoint)(region, *args, raw=RAW_BYTES)
+        if isinstance(body, list):
+            # bulk wrapper functions return the body of every request
+            body = body[0]
+        path = os.path.join(directory, endpoint + '.json')
+        with open(path, 'wb') as fixture:
+            fixture.write(body)
+        print('{0:<28} {1:>9} bytes  {2}'.format(endpoint, len(body), path))
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--api-key', help='record from the riot api instead of FakeRiotServer')
+    parser.add_argument('--region', default=NORTH_AMERICA)
+    parser.add_argument('--summoner-id', type=int, default=DEFAULT_SUMMONER_ID)
+    parser.add_argument('--summoner-name', help='name of the summoner, for the by name wrapper functions')
+    parser.add_argument('--directory', default=FIXTURES_DIR)
+    args = parser.parse_args()
+
+    if args.api_key:
+        with PyRiot(args.api_key) as priot:
+            record(priot, args.region, args.summoner_id, args.directory, args.summoner_name)
+        return
+
+    with testing.FakeRiotServer() as server:
+        server.add_route(r'/stats/by-summoner/(?P<id>\d+)/ranked$',
+                         lambda match, query: testing.stats_ranked_payload(int(match.group('id')), champion_count=120))
+        server.add_route(r'/team/by-summoner/(?P<id>\d+)$',
+                         lambda match, query: testing.teams_payload(int(match.group('id')), count=5))
+        with PyRiot('fixture_key', base_url=server.base_url, rate_limits=()) as priot:
+            record(priot, args.region, args.summoner_id, args.directory, args.summoner_name)
+
+if __name__ == '__main__':
+    main()
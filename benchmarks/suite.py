@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+"""
+End to end benchmark of every wrapper function against a local stand-in for
+the api replaying the recorded fixtures.
+
+    python benchmarks/suite.py [--calls 1000] [--workers 8] [--latency 0.02] [--throttle-rate 0.01]
+                               [--output report.json] [--baseline previous.json]
+
+For every wrapper function it reports calls per second, p50 and p99 call
+latency, mean stage times and the peak memory of one call, and for every
+model class the time to build one object. The report is written as json.
+With --baseline, the exit status is 1 when calls per second dropped or p99
+latency grew by more than --tolerance against the baseline report.
+"""
+
+from __future__ import print_function
+
+import argparse
+import json
+import math
+import os
+import platform
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+try:
+    import tracemalloc
+except ImportError:
+    tracemalloc = None
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..'))
+
+from pyriot import api_classes, decoders, lazy_classes, slotted_classes, testing
+from pyriot.metrics import STAGES, MetricsRegistry, timer
+from pyriot.resilience import RetryPolicy
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+from record_fixtures import FIXTURES_DIR, calls, load_fixtures
+
+MODELS = dict((models.__name__.split('.')[-1], models) for models in (api_classes, lazy_classes, slotted_classes))
+
+# paths answered with the fixture of each wrapper function
+PATTERNS = {
+    'champions': r'/champion$',
+    'recent_games': r'/game/by-summoner/\d+/recent$',
+    'leagues': r'/league/by-summoner/\d+$',
+    'stats_summary': r'/stats/by-summoner/\d+/summary$',
+    'stats_ranked': r'/stats/by-summoner/\d+/ranked$',
+    'summoner_masteries': r'/summoner/\d+/masteries$',
+    'summoner_runes': r'/summoner/\d+/runes$',
+    'summoner_get_by_name': r'/summoner/by-name/[^/,]+$',
+    'summoner_get_by_id': r'/summoner/\d+$',
+    'summoner_get_names_for_ids': r'/summoner/[\d,]+/name$',
+    'summoners_by_ids': r'/summoner/\d+,[\d,]+$',
+    'summoners_by_names': r'/summoner/by-name/[^/]*,[^/]*$',
+    'teams': r'/team/by-summoner/\d+$',
+}
+
+def _fixture_route(body):
+    return lambda match, query: body
+
+def _percentile(values, percent):
+    # nearest rank
+    if not values:
+        return None
+    index = max(0, min(len(values) - 1, int(math.ceil(percent / 100.0 * len(values))) - 1))
+    return values[index]
+
+def _milliseconds(seconds):
+    if seconds is None:
+        return None
+    return round(seconds * 1000, 3)
+
+def _peak_memory(function):
+    if tracemalloc is None:
+        return None
+    tracemalloc.start()
+    try:
+        result = function()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+    del result
+    return peak
+
+def _max_rss():
+    if resource is None:
+        return None
+    # kilobytes on linux, bytes on mac os
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return max_rss if sys.platform == 'darwin' else max_rss * 1024
+
+def bench_endpoint(priot, server, metrics, endpoint, args, number, workers, response_bytes):
+    latencies = []
+    errors = []
+
+    def call(_):
+        started = timer()
+        try:
+            getattr(priot, endpoint)(NORTH_AMERICA, *args)
+        except Exception as error:
+            errors.append(type(error).__name__)
+            return
+        latencies.append(timer() - started)
+
+    requests_before = server.request_count
+    throttled_before = server.throttled_count
+
+    started = timer()
+    with ThreadPoolExecutor(workers) as executor:
+        list(executor.map(call, range(number)))
+    elapsed = timer() - started
+
+    latencies.sort()
+    stages = dict()
+    for stage in STAGES:
+        histogram = metrics.stages.get((endpoint, NORTH_AMERICA, stage))
+        if histogram is not None and histogram.count:
+            stages[stage] = _milliseconds(histogram.sum / histogram.count)
+
+    return {
+        'calls': number,
+        'errors': len(errors),
+        'calls_per_second': round(len(latencies) / elapsed, 1),
+        'p50_ms': _milliseconds(_percentile(latencies, 50)),
+        'p99_ms': _milliseconds(_percentile(latencies, 99)),
+        'requests': server.request_count - requests_before,
+        'throttled': server.throttled_count - throttled_before,
+        'stage_mean_ms': stages,
+        'response_bytes': response_bytes,
+        'peak_memory_bytes': _peak_memory(lambda: getattr(priot, endpoint)(NORTH_AMERICA, *args)),
+    }
+
+def run(number=1000, workers=8, latency=0, throttle_rate=0, retry_after=0.05, models='api_classes',
+        decoder=None, endpoints=None, directory=FIXTURES_DIR):
+    fixtures = load_fixtures(PATTERNS, directory)
+    endpoint_args = calls()
+    endpoints = [endpoint for endpoint in (endpoints or endpoint_args) if endpoint in fixtures]
+
+    metrics = MetricsRegistry()
+    report = {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'platform': platform.platform(),
+        'time': time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime()),
+        'options': {
+            'calls': number,
+            'workers': workers,
+            'latency': latency,
+            'throttle_rate': throttle_rate,
+            'retry_after': retry_after,
+            'models': models,
+        },
+        'endpoints': dict(),
+    }
+
+    with testing.FakeRiotServer(latency=latency, throttle_rate=throttle_rate, retry_after=retry_after) as server:
+        for endpoint in endpoints:
+            server.add_route(PATTERNS[endpoint], _fixture_route(fixtures[endpoint]))
+
+        # coalescing would merge the identical calls, and throttled calls
+        # retry until they get through
+        with PyRiot('benchmark_key', base_url=server.base_url, rate_limits=(), pool_size=workers,
+                    coalesce=False, models=MODELS[models], decoder=decoder, metrics=metrics,
+                    retry=RetryPolicy(max_attempts=20, jitter=False)) as priot:
+            names = [name for name, function in decoders.available_decoders().items() if function is priot.decoder]
+            report['decoder'] = names[0] if names else repr(priot.decoder)
+            for endpoint in endpoints:
+                report['endpoints'][endpoint] = bench_endpoint(
+                        priot, server, metrics, endpoint, endpoint_args[endpoint], number, workers, len(fixtures[endpoint]))
+
+    report['hydration_us_per_object'] = dict(
+            (model, round(seconds / count * 1e6, 3)) for model, (seconds, count) in metrics.hydration.items() if count)
+    report['max_rss_bytes'] = _max_rss()
+    return report
+
+def regressions(report, baseline, tolerance):
+    """
+    Descriptions of the wrapper functions slower than in baseline by more than tolerance.
+    """
+    found = []
+    for endpoint, result in sorted(report['endpoints'].items()):
+        previous = baseline.get('endpoints', dict()).get(endpoint)
+        if previous is None:
+            continue
+
+        if result['calls_per_second'] < previous['calls_per_second'] * (1 - tolerance):
+            found.append('{0}: {1} calls/s, was {2}'.format(
+                    endpoint, result['calls_per_second'], previous['calls_per_second']))
+        if previous['p99_ms'] and result['p99_ms'] > previous['p99_ms'] * (1 + tolerance):
+            found.append('{0}: p99 {1} ms, was {2}'.format(endpoint, result['p99_ms'], previous['p99_ms']))
+    return found
+
+def print_report(report, output=sys.stdout):
+    print('{0:<28} {1:>9} {2:>9} {3:>9} {4:>9} {5:>12}'.format(
+            'endpoint', 'calls/s', 'p50 ms', 'p99 ms', '429s', 'peak bytes'), file=output)
+    for endpoint, result in sorted(report['endpoints'].items()):
+        print('{0:<28} {1:>9} {2:>9} {3:>9} {4:>9} {5:>12}'.format(
+                endpoint, result['calls_per_second'], result['p50_ms'], result['p99_ms'],
+                result['throttled'], result['peak_memory_bytes']), file=output)
+
+    print(file=output)
+    print('{0:<28} {1:>9}'.format('model', 'us/object'), file=output)
+    for model, cost in sorted(report['hydration_us_per_object'].items()):
+        print('{0:<28} {1:>9}'.format(model, cost), file=output)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--calls', type=int, default=1000, help='calls per wrapper function')
+    parser.add_argument('--workers', type=int, default=8, help='calls running at the same time')
+    parser.add_argument('--latency', type=float, default=0, help='seconds the stand-in delays every answer')
+    parser.add_argument('--throttle-rate', type=float, default=0, help='share of requests answered with 429')
+    parser.add_argument('--retry-after', type=float, default=0.05, help='Retry-After of the 429 answers')
+    parser.add_argument('--models', default='api_classes', choices=sorted(MODELS))
+    parser.add_argument('--decoder', help='json decoder, by default the fastest installed')
+    parser.add_argument('--endpoint', action='append', dest='endpoints', help='only this wrapper function, repeatable')
+    parser.add_argument('--directory', default=FIXTURES_DIR)
+    parser.add_argument('--output', help='json report path, printed when left out')
+    parser.add_argument('--baseline', help='json report to compare against')
+    parser.add_argument('--tolerance', type=float, default=0.1, help='allowed slowdown against the baseline')
+    args = parser.parse_args()
+
+    report = run(args.calls, args.workers, args.latency, args.throttle_rate, args.retry_after,
+                 args.models, args.decoder, args.endpoints, args.directory)
+
+    if args.output:
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2, sort_keys=True, separators=(',', ': '))
+        print_report(report)
+    else:
+        print(json.dumps(report, indent=2, sort_keys=True, separators=(',', ': ')))
+
+    if args.baseline:
+        with open(args.baseline) as baseline:
+            found = regressions(report, json.load(baseline), args.tolerance)
+        for regression in found:
+            print('regression: ' + regression, file=sys.stderr)
+        if found:
+            sys.exit(1)
+
+if __name__ == '__main__':
+    main()
@@ -1,6 +1,7 @@
 # -*- coding: utf-8 -*-
 
-import utils
+from . import schema
+from . import utils
 
 class Summoner(object):
     """
@@ -10,12 +11,7 @@ class Summoner(object):
     revisionDate    long        Date summoner was last modified specified as epoch milliseconds.
     summonerLevel   long        Summoner level associated with the summoner.
     """
-    def __init__(self, **kwargs):
-        self.id = kwargs['id']
-        self.name = kwargs['name']
-        self.profile_icon_id = kwargs['profileIconId']
-        self.revision_date = utils.convert_epoch_millis_to_datetime(kwargs['revisionDate'])
-        self.summoner_level = kwargs['summonerLevel']
+    __init__, _from_raw = schema.constructors(schema.SUMMONER, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -49,18 +45,7 @@ class Champion(object):
     name                string      Champion name.
     rankedPlayEnabled   boolean     Ranked play enabled flag.
     """
-    def __init__(self, **kwargs):
-        self.active = kwargs['active']
-        self.attack_rank = kwargs['attackRank']
-        self.bot_enabled = kwargs['botEnabled']
-        self.bot_mm_enabled = kwargs['botMmEnabled']
-        self.defense_rank = kwargs['defenseRank']
-        self.difficulty_rank = kwargs['difficultyRank']
-        self.free_to_play = kwargs['freeToPlay']
-        self.id = kwargs['id']
-        self.magic_rank = kwargs['magicRank']
-        self.name = kwargs['name']
-        self.ranked_play_enabled = kwargs['rankedPlayEnabled']
+    __init__, _from_raw = schema.constructors(schema.CHAMPION, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -97,31 +82,7 @@ class Game(object):
     subType         string              Game sub-type.
     teamId          int                 Team ID associated with game.
     """
-    def __init__(self, **kwargs):
-        self.champion_id = kwargs['championId']
-        self.create_date = utils.convert_epoch_millis_to_datetime(kwargs['createDate'])
-
-        players = []
-        for player in kwargs['fellowPlayers']:
-            players.append(Player(**player))
-        self.fellow_players = players
-
-        self.game_id = kwargs['gameId']
-        self.game_mode = kwargs['gameMode']
-        self.game_type = kwargs['gameType']
-        self.invalid = kwargs['invalid']
-        self.level = kwargs['level']
-        self.map_id = kwargs['mapId']
-        self.spell1 = kwargs['spell1']
-        self.spell2 = kwargs['spell2']
-
-        stats = []
-        for stat in kwargs['statistics']:
-            stats.append(RawStat(**stat))
-        self.statistics = stats
-
-        self.sub_type = kwargs['subType']
-        self.team_id = kwargs['teamId']
+    __init__, _from_raw = schema.constructors(schema.GAME, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -147,10 +108,7 @@ class Player(object):
     summonerId  long    Summoner id associated with player.
     teamId      int     Team id associated with player.
     """
-    def __init__(self, **kwargs):
-        self.champion_id = kwargs['championId']
-        self.summoner_id = kwargs['summonerId']
-        self.team_id = kwargs['teamId']
+    __init__, _from_raw = schema.constructors(schema.PLAYER, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -176,10 +134,7 @@ class RawStat(object):
     name    string      Raw stat name.
     value   int Raw     stat value.
     """
-    def __init__(self, **kwargs):
-        self.id = kwargs['id']
-        self.name = kwargs['name']
-        self.value = kwargs['value']
+    __init__, _from_raw = schema.constructors(schema.RAW_STAT, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -206,15 +161,7 @@ class League(object):
     queue       string                  (legal values: RANKED_SOLO_5x5, RANKED_TEAM_3x3, RANKED_TEAM_5x5)
     tier        string                  (legal values: CHALLENGER, DIAMOND, PLATINUM, GOLD, SILVER, BRONZE)
     """
-    def __init__(self, **kwargs):
-        entries = []
-        for entry in kwargs['entries']:
-            entries.append(LeagueItem(**entry))
-        self.entries = entries
-
-        self.name = kwargs['name']
-        self.queue = kwargs['queue']
-        self.tier = kwargs['tier']
+    __init__, _from_raw = schema.constructors(schema.LEAGUE, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -251,24 +198,7 @@ class LeagueItem(object):
     tier                string  
     wins                int
     """
-    def __init__(self, **kwargs):
-        self.is_fresh_blood = kwargs['isFreshBlood']
-        self.is_hot_streak = kwargs['isHotStreak']
-        self.is_inactive = kwargs['isInactive']
-        self.is_veteran = kwargs['isVeteran']
-        self.last_played = kwargs['lastPlayed']
-        self.league_name = kwargs['leagueName']
-        self.league_points = kwargs['leaguePoints']
-
-        if 'miniSeries' in kwargs:
-            self.mini_series = MiniSeries(**kwargs['miniSeries'])
-
-        self.player_or_team_id = kwargs['playerOrTeamId']
-        self.player_or_team_name = kwargs['playerOrTeamName']
-        self.queue_type = kwargs['queueType']
-        self.rank = kwargs['rank']
-        self.tier = kwargs['tier']
-        self.wins = kwargs['wins']
+    __init__, _from_raw = schema.constructors(schema.LEAGUE_ITEM, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -296,12 +226,7 @@ class MiniSeries(object):
     timeLeftToPlayMillis    long    
     wins                    int
     """
-    def __init__(self, **kwargs):
-        self.losses = kwargs['losses']
-        self.progress = kwargs['progress']
-        self.target = kwargs['target']
-        self.time_left_to_play_millis = kwargs['timeLeftToPlayMillis']
-        self.wins = kwargs['wins']
+    __init__, _from_raw = schema.constructors(schema.MINI_SERIES, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -329,12 +254,7 @@ class PlayerStatsSummary(object):
     playerStatSummaryType   string                  Player stats summary type. (legal values: AramUnranked5x5, CoopVsAI, OdinUnranked, RankedPremade3x3, RankedPremade5x5, RankedSolo5x5, RankedTeam3x3, RankedTeam5x5, Unranked, Unranked3x3, OneForAll5x5, FirstBlood1x1, FirstBlood2x2)
     wins                    int                     Number of wins for this queue type.
     """
-    def __init__(self, **kwargs):
-        self.aggregated_stats = AggregatedStats(**kwargs['aggregatedStats'])
-        self.losses = kwargs['losses']
-        self.modify_date = utils.convert_epoch_millis_to_datetime(kwargs['modifyDate'])
-        self.player_stat_summary_type = kwargs['playerStatSummaryType']
-        self.wins = kwargs['wins']
+    __init__, _from_raw = schema.constructors(schema.PLAYER_STATS_SUMMARY, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -360,14 +280,7 @@ class PlayerRankedStats(object):
     modifyDate      long                        Date stats were last modified specified as epoch milliseconds.
     summonerId      long                        Summoner ID.
     """
-    def __init__(self, **kwargs):
-        champions = []
-        for champion in kwargs['champions']:
-            champions.append(ChampionStats(**champion))
-        self.champions = champions
-
-        self.modify_date = utils.convert_epoch_millis_to_datetime(kwargs['modifyDate'])
-        self.summoner_id = kwargs['summonerId']
+    __init__, _from_raw = schema.constructors(schema.PLAYER_RANKED_STATS, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -393,10 +306,7 @@ class ChampionStats(object):
     name        string                  Champion name.
     stats       AggregatedStatsDto      Aggregated stats associated with the champion.
     """
-    def __init__(self, **kwargs):
-        self.id = kwargs['id']
-        self.name = kwargs['name']
-        self.stats = AggregatedStats(**kwargs['stats'])
+    __init__, _from_raw = schema.constructors(schema.CHAMPION_STATS, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -473,115 +383,7 @@ class AggregatedStats(object):
     totalTurretsKilled              int 
     totalUnrealKills                int
     """
-    def __init__(self, **kwargs):
-        if 'averageAssists' in kwargs:
-            self.average_assists = kwargs['averageAssists']
-        if 'averageChampionsKilled' in kwargs:
-            self.average_champions_killed = kwargs['averageChampionsKilled']
-        if 'averageCombatPlayerScore' in kwargs:
-            self.average_combat_player_score = kwargs['averageCombatPlayerScore']
-        if 'averageNodeCapture' in kwargs:
-            self.average_node_capture = kwargs['averageNodeCapture']
-        if 'averageNodeCaptureAssist' in kwargs:
-            self.average_node_capture_assist = kwargs['averageNodeCaptureAssist']
-        if 'averageNodeNeutralize' in kwargs:
-            self.average_node_neutralize = kwargs['averageNodeNeutralize']
-        if 'averageNodeNeutralizeAssist' in kwargs:
-            self.average_node_neutralize_assist = kwargs['averageNodeNeutralizeAssist']
-        if 'averageNumDeaths' in kwargs:
-            self.average_num_deaths = kwargs['averageNumDeaths']
-        if 'averageObjectivePlayerScore' in kwargs:
-            self.average_objective_player_score = kwargs['averageObjectivePlayerScore']
-        if 'averageTeamObjective' in kwargs:
-            self.average_team_objective = kwargs['averageTeamObjective']
-        if 'averageTotalPlayerScore' in kwargs:
-            self.average_total_player_score = kwargs['averageTotalPlayerScore']
-        if 'botGamesPlayed' in kwargs:
-            self.bot_games_played = kwargs['botGamesPlayed']
-        if 'killingSpree' in kwargs:
-            self.killing_spree = kwargs['killingSpree']
-        if 'maxAssists' in kwargs:
-            self.max_assists = kwargs['maxAssists']
-        if 'maxChampionsKilled' in kwargs:
-            self.max_champions_killed = kwargs['maxChampionsKilled']
-        if 'maxCombatPlayerScore' in kwargs:
-            self.max_combat_player_score = kwargs['maxCombatPlayerScore']
-        if 'maxLargestCriticalStrike' in kwargs:
-            self.max_largest_critical_strike = kwargs['maxLargestCriticalStrike']
-        if 'maxLargestKillingSpree' in kwargs:
-            self.max_largest_killing_spree = kwargs['maxLargestKillingSpree']
-        if 'maxNodeCapture' in kwargs:
-            self.max_node_capture = kwargs['maxNodeCapture']
-        if 'maxNodeCaptureAssist' in kwargs:
-            self.max_node_capture_assist = kwargs['maxNodeCaptureAssist']
-        if 'maxNodeNeutralize' in kwargs:
-            self.max_node_neutralize = kwargs['maxNodeNeutralize']
-        if 'maxNodeNeutralizeAssist' in kwargs:
-            self.max_node_neutralize_assist = kwargs['maxNodeNeutralizeAssist']
-        if 'maxObjectivePlayerScore' in kwargs:
-            self.max_objective_player_score = kwargs['maxObjectivePlayerScore']
-        if 'maxTeamObjective' in kwargs:
-            self.max_team_objective = kwargs['maxTeamObjective']
-        if 'maxTimePlayed' in kwargs:
-            self.max_time_played = kwargs['maxTimePlayed']
-        if 'maxTimeSpentLiving' in kwargs:
-            self.max_time_spent_living = kwargs['maxTimeSpentLiving']
-        if 'maxTotalPlayerScore' in kwargs:
-            self.max_total_player_score = kwargs['maxTotalPlayerScore']
-        if 'mostChampionKillsPerSession' in kwargs:
-            self.most_champion_kills_per_session = kwargs['mostChampionKillsPerSession']
-        if 'mostSpellsCast' in kwargs:
-            self.most_spells_cast = kwargs['mostSpellsCast']
-        if 'normalGamesPlayed' in kwargs:
-            self.normal_games_played = kwargs['normalGamesPlayed']
-        if 'rankedPremadeGamesPlayed' in kwargs:
-            self.ranked_premade_games_played = kwargs['rankedPremadeGamesPlayed']
-        if 'rankedSoloGamesPlayed' in kwargs:
-            self.ranked_solo_games_played = kwargs['rankedSoloGamesPlayed']
-        if 'totalAssists' in kwargs:
-            self.total_assists = kwargs['totalAssists']
-        if 'totalChampionKills' in kwargs:
-            self.total_champion_kills = kwargs['totalChampionKills']
-        if 'totalDamageDealt' in kwargs:
-            self.total_damage_dealt = kwargs['totalDamageDealt']
-        if 'totalDamageTaken' in kwargs:
-            self.total_damage_taken = kwargs['totalDamageTaken']
-        if 'totalDoubleKills' in kwargs:
-            self.total_double_kills = kwargs['totalDoubleKills']
-        if 'totalFirstBlood' in kwargs:
-            self.total_first_blood = kwargs['totalFirstBlood']
-        if 'totalGoldEarned' in kwargs:
-            self.total_gold_earned = kwargs['totalGoldEarned']
-        if 'totalHeal' in kwargs:
-            self.total_heal = kwargs['totalHeal']
-        if 'totalMagicDamageDealt' in kwargs:
-            self.total_magic_damage_dealt = kwargs['totalMagicDamageDealt']
-        if 'totalMinionKills' in kwargs:
-            self.total_minion_kills = kwargs['totalMinionKills']
-        if 'totalNeutralMinionsKilled' in kwargs:
-            self.total_neutral_minions_killed = kwargs['totalNeutralMinionsKilled']
-        if 'totalNodeCapture' in kwargs:
-            self.total_node_capture = kwargs['totalNodeCapture']
-        if 'totalNodeNeutralize' in kwargs:
-            self.total_node_neutralize = kwargs['totalNodeNeutralize']
-        if 'totalPentaKills' in kwargs:
-            self.total_penta_kills = kwargs['totalPentaKills']
-        if 'totalPhysicalDamageDealt' in kwargs:
-            self.total_physical_damage_dealt = kwargs['totalPhysicalDamageDealt']
-        if 'totalQuadraKills' in kwargs:
-            self.total_quadra_kills = kwargs['totalQuadraKills']
-        if 'totalSessionsLost' in kwargs:
-            self.total_sessions_lost = kwargs['totalSessionsLost']
-        if 'totalSessionsPlayed' in kwargs:
-            self.total_sessions_played = kwargs['totalSessionsPlayed']
-        if 'totalSessionsWon' in kwargs:
-            self.total_sessions_won = kwargs['totalSessionsWon']
-        if 'totalTripleKills' in kwargs:
-            self.total_triple_kills = kwargs['totalTripleKills']
-        if 'totalTurretsKilled' in kwargs:
-            self.total_turrets_killed = kwargs['totalTurretsKilled']
-        if 'totalUnrealKills' in kwargs:
-            self.total_unreal_kills = kwargs['totalUnrealKills']
+    __init__, _from_raw = schema.constructors(schema.AGGREGATED_STATS, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -608,16 +410,7 @@ class MasteryPage(object):
     name        string              Mastery page name.
     talents     List[TalentDto]     List of mastery page talents associated with the mastery page.
     """
-    def __init__(self, **kwargs):
-        self.current = kwargs['current']
-        self.id = kwargs['id']
-        self.name = kwargs['name']
-
-        if 'talents' in kwargs:
-            talents = []
-            for talent in kwargs['talents']:
-                talents.append(Talent(**talent))
-            self.talents = talents
+    __init__, _from_raw = schema.constructors(schema.MASTERY_PAGE, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -643,10 +436,7 @@ class Talent(object):
     name    string      Talent name.
     rank    int         Talent rank.
     """
-    def __init__(self, **kwargs):
-        self.id = kwargs['id']
-        self.name = kwargs['name']
-        self.rank = kwargs['rank']
+    __init__, _from_raw = schema.constructors(schema.TALENT, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -673,16 +463,7 @@ class RunePage(object):
     name        string              Rune page name.
     slots       List[RuneSlotDto]   List of rune slots associated with the rune page.
     """
-    def __init__(self, **kwargs):
-        self.current = kwargs['current']
-        self.id = kwargs['id']
-        self.name = kwargs['name']
-
-        if 'slots' in kwargs:
-            slots = []
-            for slot in kwargs['slots']:
-                slots.append(RuneSlot(**slot))
-            self.slots = slots
+    __init__, _from_raw = schema.constructors(schema.RUNE_PAGE, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -707,9 +488,7 @@ class RuneSlot(object):
     rune            RuneDto     Rune associated with the rune slot.
     runeSlotId      int         Rune slot ID.
     """
-    def __init__(self, **kwargs):
-        self.rune = Rune(**kwargs['rune'])
-        self.id = kwargs['runeSlotId']
+    __init__, _from_raw = schema.constructors(schema.RUNE_SLOT, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -736,11 +515,7 @@ class Rune(object):
     name            string      Rune name.
     tier            int         Rune tier.
     """
-    def __init__(self, **kwargs):
-        self.description = kwargs['description']
-        self.id = kwargs['id']
-        self.name = kwargs['name']
-        self.tier = kwargs['tier']
+    __init__, _from_raw = schema.constructors(schema.RUNE, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -778,28 +553,7 @@ class Team(object):
     teamStatSummary                 TeamStatSummaryDto  
     thirdLastJoinDate               Date
     """
-    def __init__(self, **kwargs):
-        self.create_date = utils.convert_epoch_millis_to_datetime(kwargs['createDate'])
-        self.full_id = kwargs['fullId']
-        self.last_game_date = utils.convert_epoch_millis_to_datetime(kwargs['lastGameDate'])
-        self.last_join_date = utils.convert_epoch_millis_to_datetime(kwargs['lastJoinDate'])
-        self.last_joined_ranked_team_queue_date = utils.convert_epoch_millis_to_datetime(kwargs['lastJoinedRankedTeamQueueDate'])
-        
-        match_history = []
-        for match in kwargs['matchHistory']:
-            match_history.append(MatchHistorySummary(**match))
-        self.match_history = match_history
-
-        if 'messageOfDay' in kwargs:
-            self.message_of_day = MessageOfDay(**kwargs['messageOfDay'])
-        self.modify_date = utils.convert_epoch_millis_to_datetime(kwargs['modifyDate'])
-        self.name = kwargs['name']
-        self.roster = Roster(**kwargs['roster'])
-        self.second_last_join_date = utils.convert_epoch_millis_to_datetime(kwargs['secondLastJoinDate'])
-        self.status = kwargs['status']
-        self.tag = kwargs['tag']
-        self.team_stat_summary = TeamStatSummary(**kwargs['teamStatSummary'])
-        self.third_last_join_date = utils.convert_epoch_millis_to_datetime(kwargs['thirdLastJoinDate'])
+    __init__, _from_raw = schema.constructors(schema.TEAM, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -832,17 +586,7 @@ class MatchHistorySummary(object):
     opposingTeamName    string  
     win                 boolean
     """
-    def __init__(self, **kwargs):
-        self.assists = kwargs['assists']
-        self.deaths = kwargs['deaths']
-        self.game_id = kwargs['gameId']
-        self.game_mode = kwargs['gameMode']
-        self.invalid = kwargs['invalid']
-        self.kills = kwargs['kills']
-        self.map_id = kwargs['mapId']
-        self.opposing_team_kills = kwargs['opposingTeamKills']
-        self.opposing_team_name = kwargs['opposingTeamName']
-        self.win = kwargs['win']
+    __init__, _from_raw = schema.constructors(schema.MATCH_HISTORY_SUMMARY, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -868,10 +612,7 @@ class MessageOfDay(object):
     message         string  
     version         int
     """
-    def __init__(self, **kwargs):
-        self.create_date = utils.convert_epoch_millis_to_datetime(kwargs['createDate'])
-        self.message = kwargs['message']
-        self.version = kwargs['version']
+    __init__, _from_raw = schema.constructors(schema.MESSAGE_OF_DAY, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -896,13 +637,7 @@ class Roster(object):
     memberList      List[TeamMemberInfoDto] 
     ownerId         long
     """
-    def __init__(self, **kwargs):
-        member_list = []
-        for member in kwargs['memberList']:
-            member_list.append(TeamMemberInfo(**member))
-        self.member_list = member_list
-
-        self.owner_id = kwargs['ownerId']
+    __init__, _from_raw = schema.constructors(schema.ROSTER, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -927,13 +662,7 @@ class TeamStatSummary(object):
     fullId              string  
     teamStatDetails     Set[TeamStatDetailDto]
     """
-    def __init__(self, **kwargs):
-        self.full_id = kwargs['fullId']
-
-        team_stat_details = []
-        for team_stat_detail in kwargs['teamStatDetails']:
-            team_stat_details.append(TeamStatDetail(**team_stat_detail))
-        self.team_stat_details = team_stat_details
+    __init__, _from_raw = schema.constructors(schema.TEAM_STAT_SUMMARY, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -960,11 +689,7 @@ class TeamMemberInfo(object):
     playerId        long    
     status          string
     """
-    def __init__(self, **kwargs):
-        self.invite_date = utils.convert_epoch_millis_to_datetime(kwargs['inviteDate'])
-        self.join_date = utils.convert_epoch_millis_to_datetime(kwargs['joinDate'])
-        self.player_id = kwargs['playerId']
-        self.status = kwargs['status']
+    __init__, _from_raw = schema.constructors(schema.TEAM_MEMBER_INFO, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -992,12 +717,7 @@ class TeamStatDetail(object):
     teamStatType            string  
     wins                    int
     """
-    def __init__(self, **kwargs):
-        self.average_games_played = kwargs['averageGamesPlayed']
-        self.full_id = kwargs['fullId']
-        self.losses = kwargs['losses']
-        self.team_stat_type = kwargs['teamStatType']
-        self.wins = kwargs['wins']
+    __init__, _from_raw = schema.constructors(schema.TEAM_STAT_DETAIL, globals())
 
     def __object_string(self):
         objdict = self.__dict__
@@ -0,0 +1,674 @@
+# -*- coding: utf-8 -*-
+
+# Requires Python 3.5+ and aiohttp.
+
+import asyncio
+import functools
+import inspect
+import time
+
+import aiohttp
+import requests
+
+from . import api_classes
+from . import cache as response_cache
+from . import decoders
+from . import executor
+from . import metrics as request_metrics
+from . import ratelimit
+from . import resilience
+from . import utils
+from .wrapper import (BASE_URL, CHAMPION_VERSION, GAME_VERSION, LEAGUE_VERSION, RAW_BYTES, RAW_JSON,
+                      STATS_VERSION, SUMMONER_CHUNK_SIZE, SUMMONER_VERSION, TEAM_VERSION,
+                      _merge_raw, check_raw_mode)
+
+DEFAULT_CONCURRENCY = 50
+
+class _SharedRequest(object):
+    """
+    Request in flight and the number of callers waiting for it.
+    """
+    def __init__(self, task):
+        self.task = task
+        self.waiters = 0
+
+class AsyncPyRiot:
+    """
+    Coroutine counterpart of PyRiot. Every wrapper function has the same name,
+    arguments and return value as in PyRiot, but must be awaited.
+
+        async with AsyncPyRiot('your_riot_api_key') as priot:
+            games = await priot.recent_games(NORTH_AMERICA, 24915110)
+
+    Requests run concurrently on one event loop, with at most concurrency
+    requests in flight per region. They are sent with aiohttp, or with the
+    given transport, see transport.py.
+    """
+    def __init__(self, api_key, concurrency=DEFAULT_CONCURRENCY, timeout=None, base_url=BASE_URL,
+                 rate_limits=ratelimit.DEFAULT_RATE_LIMITS, rate_limiter=None, cache=None,
+                 coalesce=True, models=api_classes, raw=None, decoder=None,
+                 retry=resilience.DEFAULT_RETRY_POLICY, circuit_breaker=None, metrics=None, transport=None):
+        """
+        api_key: Riot API key.
+        concurrency: Maximum number of requests in flight per region.
+        timeout: Timeout in seconds for every request.
+        base_url: Root url of the api, override to point at a proxy or pyriot.testing.FakeRiotServer.
+        rate_limits: Sequence of (requests, seconds) windows allowed for the api key per region, empty to disable.
+        rate_limiter: RateLimiter to share with other clients, replaces rate_limits.
+        cache: Optional ResponseCache serving repeated calls without a request.
+        coalesce: Let concurrent identical calls share one request instead of sending duplicates.
+        models: Module providing the returned classes, api_classes or lazy_classes.
+        raw: RAW_BYTES or RAW_JSON to have every wrapper function return the response body instead of objects.
+        decoder: Json decoder for response bodies, a callable or a name from decoders.DECODERS. Defaults to the fastest installed.
+        retry: RetryPolicy for failed requests, None to raise on the first failure.
+        circuit_breaker: Optional CircuitBreaker failing calls at once while a region is down.
+        metrics: Optional MetricsRegistry recording requests, stage timings and object building.
+        transport: Sends the requests instead of aiohttp, see transport.py. A get() coroutine function is
+                   awaited, a blocking get() runs on the event loop's default executor. Failed requests
+                   then raise requests.HTTPError instead of aiohttp.ClientResponseError.
+        """
+        self.api_key = api_key
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter or ratelimit.RateLimiter(rate_limits)
+        self.cache = cache
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.coalesce = coalesce
+        self.metrics = metrics
+        self.models = metrics.timed_models(models) if metrics is not None else models
+        self.raw = check_raw_mode(raw)
+        self.decoder = decoders.resolve(decoder)
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+        self.transport = transport
+
+        self._session = None
+        self._semaphores = dict()
+        self._in_flight = dict()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def close(self):
+        """
+        Closes the underlying connection pool, or the transport.
+        """
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        if self.transport is not None:
+            closed = self.transport.close()
+            if inspect.isawaitable(closed):
+                await closed
+
+    def _get_session(self):
+        if self._session is None:
+            connector = aiohttp.TCPConnector(limit=0)
+            timeout = aiohttp.ClientTimeout(total=self.timeout)
+            self._session = aiohttp.ClientSession(connector=connector, timeout=timeout)
+        return self._session
+
+    async def _transport_get(self, region, url, options):
+        get = self.transport.get
+        if asyncio.iscoroutinefunction(get):
+            return await get(region, url, **options)
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(None, functools.partial(get, region, url, **options))
+
+    def _semaphore(self, region):
+        semaphore = self._semaphores.get(region)
+        if semaphore is None:
+            semaphore = asyncio.BoundedSemaphore(self.concurrency)
+            self._semaphores[region] = semaphore
+        return semaphore
+
+    async def request(self, endpoint, region, url, raw=RAW_JSON, fresh=False):
+        """
+        See PyRiot.request
+
+        throws aiohttp.ClientResponseError
+        """
+        if raw not in (RAW_BYTES, RAW_JSON):
+            raise ValueError('raw must be RAW_BYTES or RAW_JSON, got {0!r}'.format(raw))
+        return await self._get(endpoint, region, url, raw, fresh)
+
+    def submit_batch(self, calls):
+        """
+        Schedules every call as a task on the running event loop. Requests
+        still go through the rate limiter and the per region concurrency.
+
+        calls: (endpoint, region, *args) tuples such as ('leagues', region, summoner_id),
+               or executor.Call descriptions.
+
+        returns list of asyncio tasks of the calls' return values, in order
+
+        throws ValueError for unknown wrapper functions, before any call is scheduled
+        """
+        calls = [executor.as_call(spec) for spec in calls]
+        functions = [executor.wrapper_function(self, pending.endpoint) for pending in calls]
+        return [asyncio.ensure_future(function(pending.region, *pending.args, **pending.kwargs))
+                for function, pending in zip(functions, calls)]
+
+    async def batch(self, calls):
+        """
+        Runs every call concurrently and waits for all of them.
+
+            summoner, leagues, teams = await priot.batch([
+                    ('summoner_get_by_id', NORTH_AMERICA, summoner_id),
+                    ('leagues', NORTH_AMERICA, summoner_id),
+                    ('teams', NORTH_AMERICA, summoner_id)])
+
+        returns list of the calls' return values in order, holding the
+        exception instead for calls that failed
+
+        throws ValueError for unknown wrapper functions, before any call is scheduled
+        """
+        return await asyncio.gather(*self.submit_batch(calls), return_exceptions=True)
+
+    def _raw_mode(self, raw):
+        if raw is None:
+            return self.raw
+        return check_raw_mode(raw)
+
+    async def _get(self, endpoint, region, url, raw=None, fresh=False):
+        body = await self._fetch(endpoint, region, url, fresh)
+        if raw == RAW_BYTES:
+            return body
+        if self.metrics is None:
+            return self.decoder(body)
+
+        started = request_metrics.timer()
+        content = self.decoder(body)
+        self.metrics.record_decode(endpoint, region, request_metrics.timer() - started)
+        return content
+
+    async def _fetch(self, endpoint, region, url, fresh=False):
+        params = response_cache.request_params(url, self.base_url)
+        if self.cache is not None and not fresh:
+            body = self.cache.get(endpoint, region, params)
+            if body is not None:
+                return body
+
+        if not self.coalesce:
+            return await self._send(endpoint, region, params, url)
+
+        key = (endpoint, region, params)
+        shared = self._in_flight.get(key)
+        if shared is None:
+            # the request runs in its own task, so a cancelled caller does
+            # not cancel it for the others waiting on it
+            shared = _SharedRequest(asyncio.ensure_future(self._send(endpoint, region, params, url)))
+            self._in_flight[key] = shared
+            shared.task.add_done_callback(functools.partial(self._shared_done, key, shared))
+
+        shared.waiters += 1
+        try:
+            return await asyncio.shield(shared.task)
+        finally:
+            shared.waiters -= 1
+            if not shared.waiters and not shared.task.done():
+                # every caller gave up, callers from now on send a new request
+                self._shared_done(key, shared)
+                shared.task.cancel()
+
+    def _shared_done(self, key, shared, task=None):
+        if self._in_flight.get(key) is shared:
+            del self._in_flight[key]
+
+    async def _send(self, endpoint, region, params, url):
+        started = time.time()
+        attempt = 0
+        probe = None
+        try:
+            while True:
+                attempt += 1
+                if self.circuit_breaker is not None:
+                    probe = self.circuit_breaker.before_request(region)
+
+                waiting = request_metrics.timer()
+                delay = self.rate_limiter.reserve(self.api_key, region)
+                if delay > 0:
+                    await asyncio.sleep(delay)
+
+                options = dict()
+                if self.retry is not None and self.retry.deadline is not None:
+                    if self.transport is None:
+                        options['timeout'] = aiohttp.ClientTimeout(total=self.retry.timeout(started, self.timeout))
+                    else:
+                        options['timeout'] = self.retry.timeout(started, getattr(self.transport, 'timeout', None))
+
+                try:
+                    sent = None
+                    async with self._semaphore(region):
+                        sent = request_metrics.timer()
+                        if self.transport is None:
+                            async with self._get_session().get(url, **options) as response:
+                                headers_received = request_metrics.timer()
+                                self.rate_limiter.update(self.api_key, region, response.headers)
+                                status = response.status
+                                headers = response.headers
+                                size = 0
+                                if status < 400:
+                                    body = await response.read()
+                                    size = len(body)
+                                else:
+                                    response.release()
+                                self._record_request(endpoint, region, status, size, waiting, sent, headers_received)
+                        else:
+                            response = await self._transport_get(region, url, options)
+                            # the body is already read, elapsed tells when the headers arrived
+                            headers_received = min(request_metrics.timer(), sent + response.elapsed.total_seconds())
+                            self.rate_limiter.update(self.api_key, region, response.headers)
+                            status = response.status_code
+                            headers = response.headers
+                            size = 0
+                            if status < 400:
+                                body = response.content
+                                size = len(body)
+                            self._record_request(endpoint, region, status, size, waiting, sent, headers_received)
+                except (asyncio.TimeoutError, aiohttp.ClientConnectionError, requests.Timeout, requests.ConnectionError):
+                    self._record_error(endpoint, region, waiting, sent)
+                    self._record_outcome(region, False)
+                    delay = self._retry_delay(attempt, started)
+                    if delay is None:
+                        raise
+                    await asyncio.sleep(delay)
+                    continue
+                except Exception:
+                    self._record_error(endpoint, region, waiting, sent)
+                    self._record_outcome(region, False)
+                    raise
+
+                self._record_outcome(region, status < 500)
+
+                if status >= 400:
+                    delay = self._retry_delay(attempt, started, status, headers)
+                    if delay is not None:
+                        if status == 429:
+                            self.rate_limiter.block(self.api_key, region, delay)
+                        else:
+                            await asyncio.sleep(delay)
+                        continue
+
+                    response.raise_for_status()
+
+                break
+        finally:
+            # a probe ending without an outcome, such as a cancelled call,
+            # must not keep the circuit half open
+            if probe is not None:
+                self.circuit_breaker.end_probe(region, probe)
+
+        if self.cache is not None:
+            self.cache.set(endpoint, region, params, body)
+
+        return body
+
+    def _retry_delay(self, attempt, started, status=None, headers=None):
+        if self.retry is None:
+            return None
+        return self.retry.retry_delay(attempt, started, status, headers)
+
+    def _record_outcome(self, region, success):
+        if self.circuit_breaker is None:
+            return
+        if success:
+            self.circuit_breaker.record_success(region)
+        else:
+            self.circuit_breaker.record_failure(region)
+
+    def _record_request(self, endpoint, region, status, size, waiting, sent, headers_received):
+        if self.metrics is None:
+            return
+        self.metrics.record_request(endpoint, region, status, size, sent - waiting,
+                                    headers_received - sent, request_metrics.timer() - headers_received)
+
+    def _record_error(self, endpoint, region, waiting, sent):
+        if self.metrics is None:
+            return
+        now = request_metrics.timer()
+        if sent is None:
+            # failed before a request slot was free
+            sent = now
+        self.metrics.record_error(endpoint, region, sent - waiting, now - sent)
+
+    async def champions(self, region, free_to_play=False, raw=None, fresh=False):
+        """
+        See PyRiot.champions
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/champion?freeToPlay={3}&api_key={4}'.format(
+                self.base_url,
+                region,
+                CHAMPION_VERSION,
+                free_to_play,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('champions', region, url, raw, fresh)
+        if raw:
+            return content
+
+        champions = dict()
+        for champion in content['champions']:
+            champions[champion['id']] = self.models.Champion(**champion)
+
+        return champions
+
+    async def recent_games(self, region, summoner_id, raw=None, fresh=False):
+        """
+        See PyRiot.recent_games
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/game/by-summoner/{3}/recent?api_key={4}'.format(
+                self.base_url,
+                region,
+                GAME_VERSION,
+                summoner_id,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('recent_games', region, url, raw, fresh)
+        if raw:
+            return content
+
+        games = []
+        for game in content['games']:
+            games.append(self.models.Game(**game))
+
+        return games
+
+    async def leagues(self, region, summoner_id, raw=None, fresh=False):
+        """
+        See PyRiot.leagues
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/league/by-summoner/{3}?api_key={4}'.format(
+                self.base_url,
+                region,
+                LEAGUE_VERSION,
+                summoner_id,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('leagues', region, url, raw, fresh)
+        if raw:
+            return content
+
+        leagues = dict()
+        for league_id in content:
+            leagues[league_id] = self.models.League(**content[league_id])
+
+        return leagues
+
+    async def stats_summary(self, region, summoner_id, season=None, raw=None, fresh=False):
+        """
+        See PyRiot.stats_summary
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/stats/by-summoner/{3}/summary?api_key={4}'.format(
+                self.base_url,
+                region,
+                STATS_VERSION,
+                summoner_id,
+                self.api_key)
+
+        if season:
+            url += '&season=SEASON{0}'.format(season)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('stats_summary', region, url, raw, fresh)
+        if raw:
+            return content
+
+        player_stat_summaries = []
+        for stat_summary in content['playerStatSummaries']:
+            player_stat_summaries.append(self.models.PlayerStatsSummary(**stat_summary))
+
+        return player_stat_summaries
+
+    async def stats_ranked(self, region, summoner_id, season=None, raw=None, fresh=False):
+        """
+        See PyRiot.stats_ranked
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/stats/by-summoner/{3}/ranked?api_key={4}'.format(
+                self.base_url,
+                region,
+                STATS_VERSION,
+                summoner_id,
+                self.api_key)
+
+        if season:
+            url += '&season=SEASON{0}'.format(season)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('stats_ranked', region, url, raw, fresh)
+        if raw:
+            return content
+
+        return self.models.PlayerRankedStats(**content)
+
+    async def summoner_masteries(self, region, summoner_id, raw=None, fresh=False):
+        """
+        See PyRiot.summoner_masteries
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/summoner/{3}/masteries?api_key={4}'.format(
+                self.base_url,
+                region,
+                SUMMONER_VERSION,
+                summoner_id,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('summoner_masteries', region, url, raw, fresh)
+        if raw:
+            return content
+
+        mastery_pages = []
+        for page in content['pages']:
+            mastery_pages.append(self.models.MasteryPage(**page))
+
+        return mastery_pages
+
+    async def summoner_runes(self, region, summoner_id, raw=None, fresh=False):
+        """
+        See PyRiot.summoner_runes
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/summoner/{3}/runes?api_key={4}'.format(
+                self.base_url,
+                region,
+                SUMMONER_VERSION,
+                summoner_id,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('summoner_runes', region, url, raw, fresh)
+        if raw:
+            return content
+
+        rune_pages = []
+        for page in content['pages']:
+            rune_pages.append(self.models.RunePage(**page))
+
+        return rune_pages
+
+    async def summoner_get_by_name(self, region, summoner_name, raw=None, fresh=False):
+        """
+        See PyRiot.summoner_get_by_name
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/summoner/by-name/{3}?api_key={4}'.format(
+                self.base_url,
+                region,
+                SUMMONER_VERSION,
+                summoner_name,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('summoner_get_by_name', region, url, raw, fresh)
+        if raw:
+            return content
+
+        return self.models.Summoner(**content.get(summoner_name))
+
+    async def summoner_get_by_id(self, region, summoner_id, raw=None, fresh=False):
+        """
+        See PyRiot.summoner_get_by_id
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/summoner/{3}?api_key={4}'.format(
+                self.base_url,
+                region,
+                SUMMONER_VERSION,
+                summoner_id,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('summoner_get_by_id', region, url, raw, fresh)
+        if raw:
+            return content
+
+        return self.models.Summoner(**content.get('{0}'.format(summoner_id)))
+
+    async def summoner_get_names_for_ids(self, region, summoner_ids, raw=None, fresh=False):
+        """
+        See PyRiot.summoner_get_names_for_ids
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/summoner/{3}/name?api_key={4}'.format(
+                self.base_url,
+                region,
+                SUMMONER_VERSION,
+                summoner_ids,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('summoner_get_names_for_ids', region, url, raw, fresh)
+        if raw:
+            return content
+
+        summoners = dict()
+        for summoner in content['summoners']:
+            summoners[summoner['id']] = summoner['name']
+
+        return summoners
+
+    async def summoners_by_ids(self, region, summoner_ids, raw=None, fresh=False):
+        """
+        See PyRiot.summoners_by_ids
+
+        throws aiohttp.ClientResponseError
+        """
+
+        async def fetch(chunk):
+            url = '{0}/{1}/{2}/summoner/{3}?api_key={4}'.format(
+                    self.base_url,
+                    region,
+                    SUMMONER_VERSION,
+                    ','.join('{0}'.format(summoner_id) for summoner_id in chunk),
+                    self.api_key)
+
+            return await self._get_summoners('summoners_by_ids', region, url, raw, fresh)
+
+        raw = self._raw_mode(raw)
+        ids = utils.unique(int(summoner_id) for summoner_id in summoner_ids)
+        contents = await asyncio.gather(*[fetch(chunk) for chunk in utils.chunks(ids, SUMMONER_CHUNK_SIZE)])
+        if raw:
+            return _merge_raw(contents, raw)
+
+        summoners = dict()
+        for content in contents:
+            for summoner in content.values():
+                summoners[summoner['id']] = self.models.Summoner(**summoner)
+
+        return summoners
+
+    async def summoners_by_names(self, region, summoner_names, raw=None, fresh=False):
+        """
+        See PyRiot.summoners_by_names
+
+        throws aiohttp.ClientResponseError
+        """
+
+        async def fetch(chunk):
+            url = '{0}/{1}/{2}/summoner/by-name/{3}?api_key={4}'.format(
+                    self.base_url,
+                    region,
+                    SUMMONER_VERSION,
+                    ','.join(chunk),
+                    self.api_key)
+
+            return await self._get_summoners('summoners_by_names', region, url, raw, fresh)
+
+        raw = self._raw_mode(raw)
+        names = utils.unique(summoner_names)
+        contents = await asyncio.gather(*[fetch(chunk) for chunk in utils.chunks(names, SUMMONER_CHUNK_SIZE)])
+        if raw:
+            return _merge_raw(contents, raw)
+
+        summoners = dict()
+        for content in contents:
+            for name in content:
+                summoners[name] = self.models.Summoner(**content[name])
+
+        return summoners
+
+    async def _get_summoners(self, endpoint, region, url, raw=None, fresh=False):
+        # the api answers 404 when none of the requested summoners exist
+        try:
+            return await self._get(endpoint, region, url, raw, fresh)
+        except aiohttp.ClientResponseError as error:
+            if error.status == 404:
+                return None if raw == RAW_BYTES else dict()
+            raise
+
+    async def teams(self, region, summoner_id, raw=None, fresh=False):
+        """
+        See PyRiot.teams
+
+        throws aiohttp.ClientResponseError
+        """
+
+        url = '{0}/{1}/{2}/team/by-summoner/{3}?api_key={4}'.format(
+                self.base_url,
+                region,
+                TEAM_VERSION,
+                summoner_id,
+                self.api_key)
+
+        raw = self._raw_mode(raw)
+        content = await self._get('teams', region, url, raw, fresh)
+        if raw:
+            return content
+
+        teams = []
+        for team in content:
+            teams.append(self.models.Team(**team))
+
+        return teams
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import re
+import sqlite3
+import threading
+import time
+import zlib
+
+MINUTE = 60
+HOUR = 60 * MINUTE
+
+# Seconds a response stays fresh, keyed on wrapper function name.
+# Endpoints missing from the policy are not cached.
+DEFAULT_TTLS = {
+    'champions': 3 * HOUR,
+    'recent_games': MINUTE,
+    'leagues': 5 * MINUTE,
+    'stats_summary': 30 * MINUTE,
+    'stats_ranked': 30 * MINUTE,
+    'summoner_masteries': HOUR,
+    'summoner_runes': HOUR,
+    'summoner_get_by_name': HOUR,
+    'summoner_get_by_id': HOUR,
+    'summoner_get_names_for_ids': HOUR,
+    'summoners_by_ids': HOUR,
+    'summoners_by_names': HOUR,
+    'teams': 30 * MINUTE,
+}
+
+DEFAULT_MAX_ENTRIES = 10000
+
+_API_KEY_PATTERN = re.compile(r'api_key=[^&]*&?')
+
+def request_params(url, base_url=''):
+    """
+    Part of a request url identifying the request, without base url and api key.
+    """
+    if base_url and url.startswith(base_url):
+        url = url[len(base_url):]
+    return _API_KEY_PATTERN.sub('', url).rstrip('?&')
+
+class MemoryBackend(object):
+    """
+    Cache storage in process memory, evicting the least recently used entry
+    once max_entries is reached.
+    """
+    def __init__(self, max_entries=DEFAULT_MAX_ENTRIES):
+        self.max_entries = max_entries
+        self.evictions = 0
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """
+        Returns (fetched_at, body) for key, or None.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry
+            return entry
+
+    def set(self, key, fetched_at, body):
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (fetched_at, body)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def delete(self, endpoint=None, region=None):
+        with self._lock:
+            for key in list(self._entries):
+                if (endpoint is None or key[0] == endpoint) and (region is None or key[1] == region):
+                    del self._entries[key]
+
+    def __len__(self):
+        return len(self._entries)
+
+class _SQLiteDatabase(object):
+    """
+    SQLite database in WAL mode, so readers do not wait for writers, with
+    one connection per thread.
+
+    path: Database file, created if missing.
+    timeout: Seconds to wait for another process holding the database lock.
+    """
+    def __init__(self, path, timeout=30):
+        self.path = path
+        self.timeout = timeout
+
+        self._local = threading.local()
+        self._connection().execute('PRAGMA journal_mode=WAL')
+
+    def _connection(self):
+        # sqlite connections may not be shared between threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = sqlite3.connect(self.path, timeout=self.timeout)
+            self._local.connection = connection
+        return connection
+
+    def close(self):
+        """
+        Closes the connection of the calling thread.
+        """
+        connection = getattr(self._local, 'connection', None)
+        if connection is not None:
+            connection.close()
+            self._local.connection = None
+
+class SQLiteBackend(_SQLiteDatabase):
+    """
+    Cache storage in a SQLite database, kept across restarts and shared by
+    every process on the host that opens the same path. Bodies are stored
+    zlib compressed along with the time they were fetched.
+
+    path: Database file, created if missing.
+    timeout: Seconds to wait for another process holding the database lock.
+    """
+    def __init__(self, path, timeout=30):
+        _SQLiteDatabase.__init__(self, path, timeout)
+
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                    'CREATE TABLE IF NOT EXISTS responses ('
+                    'endpoint TEXT NOT NULL, '
+                    'region TEXT NOT NULL, '
+                    'params TEXT NOT NULL, '
+                    'fetched_at REAL NOT NULL, '
+                    'body BLOB NOT NULL, '
+                    'PRIMARY KEY (endpoint, region, params))')
+
+    def get(self, key):
+        """
+        Returns (fetched_at, body) for key, or None.
+        """
+        row = self._connection().execute(
+                'SELECT fetched_at, body FROM responses WHERE endpoint = ? AND region = ? AND params = ?',
+                key).fetchone()
+        if row is None:
+            return None
+
+        return row[0], zlib.decompress(row[1])
+
+    def set(self, key, fetched_at, body):
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                    'INSERT OR REPLACE INTO responses (endpoint, region, params, fetched_at, body) VALUES (?, ?, ?, ?, ?)',
+                    tuple(key) + (fetched_at, sqlite3.Binary(zlib.compress(body))))
+
+    def delete(self, endpoint=None, region=None):
+        clauses = []
+        args = []
+        if endpoint is not None:
+            clauses.append('endpoint = ?')
+            args.append(endpoint)
+        if region is not None:
+            clauses.append('region = ?')
+            args.append(region)
+
+        query = 'DELETE FROM responses'
+        if clauses:
+            query += ' WHERE ' + ' AND '.join(clauses)
+
+        connection = self._connection()
+        with connection:
+            connection.execute(query, args)
+
+    def purge(self, max_age):
+        """
+        Deletes responses fetched more than max_age seconds ago.
+        """
+        connection = self._connection()
+        with connection:
+            connection.execute('DELETE FROM responses WHERE fetched_at < ?', (time.time() - max_age,))
+
+    def __len__(self):
+        return self._connection().execute('SELECT COUNT(*) FROM responses').fetchone()[0]
+
+class ResponseCache(object):
+    """
+    Cache of raw response bodies keyed on (endpoint, region, params), with a
+    ttl per endpoint. Entries are kept by a backend, in memory by default.
+
+    ttls: Dictionary of endpoint name to seconds, defaults to DEFAULT_TTLS.
+    max_entries: Size of the default MemoryBackend.
+    backend: Storage such as MemoryBackend or SQLiteBackend.
+
+    hits and misses count lookups per endpoint.
+    """
+    def __init__(self, ttls=None, max_entries=DEFAULT_MAX_ENTRIES, backend=None):
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.backend = backend if backend is not None else MemoryBackend(max_entries)
+
+        self.hits = collections.Counter()
+        self.misses = collections.Counter()
+        self._lock = threading.Lock()
+
+    def ttl(self, endpoint):
+        return self.ttls.get(endpoint)
+
+    def get(self, endpoint, region, params):
+        """
+        Returns the cached body, or None when missing or expired.
+        """
+        ttl = self.ttl(endpoint)
+        if not ttl:
+            return None
+
+        entry = self.backend.get((endpoint, region, params))
+        if entry is None or entry[0] + ttl <= time.time():
+            with self._lock:
+                self.misses[endpoint] += 1
+            return None
+
+        with self._lock:
+            self.hits[endpoint] += 1
+        return entry[1]
+
+    def set(self, endpoint, region, params, body):
+        if not self.ttl(endpoint):
+            return
+
+        self.backend.set((endpoint, region, params), time.time(), body)
+
+    def invalidate(self, endpoint=None, region=None):
+        """
+        Drops cached responses, optionally only those of one endpoint and/or region.
+        """
+        self.backend.delete(endpoint, region)
+
+    def clear(self):
+        self.backend.delete()
+
+    def hit_ratio(self):
+        with self._lock:
+            hits = sum(self.hits.values())
+            lookups = hits + sum(self.misses.values())
+        if not lookups:
+            return 0.0
+        return float(hits) / lookups
+
+    def __len__(self):
+        return len(self.backend)
@@ -0,0 +1,234 @@
+# -*- coding: utf-8 -*-
+
+# Requires numpy.
+
+"""
+Columnar export of AggregatedStats for analytics over many summoners.
+
+ranked_stats_table and stats_summary_table turn stats_ranked and
+stats_summary results into a StatsTable holding one numpy array per column.
+Aggregates across summoners are then vectorized operations:
+
+    table = ranked_stats_table(all_ranked_stats)
+    win_rate = table['total_sessions_won'] / table['total_sessions_played']
+
+Results from api_classes, lazy_classes and slotted_classes are all accepted,
+as are the dictionaries returned with raw=RAW_JSON, which skips building
+objects altogether.
+"""
+
+import collections
+
+import numpy
+
+from . import schema
+from . import slotted_classes
+from .utils import MISSING
+
+STAT_FIELDS = tuple(field.name for field in schema.AGGREGATED_STATS)
+
+_STAT_KEYS = tuple(field.key for field in schema.AGGREGATED_STATS)
+
+# marks missing values while rows are collected, as in packed slotted stats
+_NULL = slotted_classes._NULL
+
+def _stat_values(stats):
+    """
+    Values of an AggregatedStats in STAT_FIELDS order, _NULL where missing.
+    """
+    if isinstance(stats, slotted_classes._PackedModel):
+        if stats._extra is None:
+            return stats._values
+        # values that did not fit the packed array are kept beside it
+        values = list(stats._values)
+        for index, value in stats._extra.items():
+            values[index] = value
+        return values
+
+    if isinstance(stats, dict):
+        raw = stats
+    else:
+        # lazy_classes keep the api dictionary
+        raw = getattr(stats, '_raw', None)
+
+    if raw is not None:
+        return [raw.get(key, _NULL) for key in _STAT_KEYS]
+
+    values = stats.__dict__
+    return [values.get(name, _NULL) for name in STAT_FIELDS]
+
+def _value(model, name):
+    value = getattr(model, name, _NULL)
+    if value is MISSING:
+        return _NULL
+    return value
+
+def _masked(values, dtype=numpy.int64):
+    """
+    Column of values masked where _NULL or None.
+
+    With an integer dtype, a column holding fractional values is float64 and
+    one holding integers beyond 64 bits object, instead of being truncated.
+    """
+    values = numpy.array([_NULL if value is None else value for value in values])
+    if not len(values):
+        values = values.astype(dtype)
+    mask = values == _NULL
+    if numpy.issubdtype(dtype, numpy.integer) and values.dtype.kind not in 'iu':
+        dtype = numpy.float64 if values.dtype.kind == 'f' else object
+    return numpy.ma.MaskedArray(values.astype(dtype), mask=mask)
+
+class StatsTable(object):
+    """
+    Rows of AggregatedStats stored column by column.
+
+    Key columns, such as summoner_id and champion_id, are plain numpy arrays.
+    Every name in STAT_FIELDS is a numpy.ma.MaskedArray masked where the api
+    left the field out, so missing fields such as the Dominion only stats
+    drop out of sums and means instead of counting as zeros.
+
+    keys: Sequence of (name, values) key columns.
+    stats: Sequence of rows, each holding the values of STAT_FIELDS with _NULL for missing.
+    dtype: Numpy type of the stat columns.
+
+    Null values are masked like missing ones. With an integer dtype, columns
+    holding fractional values are float64 and columns holding integers
+    beyond 64 bits object, instead of being truncated.
+    """
+    def __init__(self, keys, stats, dtype=numpy.int64):
+        self.columns = collections.OrderedDict()
+        for name, values in keys:
+            self.columns[name] = values if isinstance(values, numpy.ndarray) else numpy.array(values)
+
+        data = numpy.array(stats) if len(stats) else numpy.zeros(0, dtype=numpy.int64)
+        if data.dtype.kind not in 'iu':
+            # nulls, fractional values or integers beyond 64 bits, typed column by column
+            rows = numpy.array(stats, dtype=object).reshape(len(stats), len(STAT_FIELDS))
+            for index, name in enumerate(STAT_FIELDS):
+                self.columns[name] = _masked(rows[:, index].tolist(), dtype)
+            return
+
+        data = data.reshape(len(stats), len(STAT_FIELDS))
+        mask = data == _NULL
+        # one contiguous array per column
+        data = numpy.ascontiguousarray(data.T, dtype=dtype)
+        mask = numpy.ascontiguousarray(mask.T)
+        for index, name in enumerate(STAT_FIELDS):
+            self.columns[name] = numpy.ma.MaskedArray(data[index], mask=mask[index])
+
+    @property
+    def names(self):
+        return list(self.columns)
+
+    def select(self, rows):
+        """
+        New table with only the given rows, a boolean mask or array of indexes.
+        """
+        table = StatsTable.__new__(StatsTable)
+        table.columns = collections.OrderedDict(
+                (name, column[rows]) for name, column in self.columns.items())
+        return table
+
+    def group_sum(self, by, name):
+        """
+        Sums column name for every distinct value of column by, leaving out
+        missing values.
+
+        returns (keys, sums) arrays
+        """
+        keys, inverse = numpy.unique(self.columns[by], return_inverse=True)
+        column = self.columns[name]
+        sums = numpy.zeros(len(keys), dtype=column.dtype)
+        numpy.add.at(sums, inverse, numpy.ma.filled(column, 0))
+        return keys, sums
+
+    def __getitem__(self, name):
+        return self.columns[name]
+
+    def __contains__(self, name):
+        return name in self.columns
+
+    def __len__(self):
+        if not self.columns:
+            return 0
+        return len(next(iter(self.columns.values())))
+
+def ranked_stats_table(ranked_stats, totals=False, dtype=numpy.int64):
+    """
+    One row per champion of every PlayerRankedStats.
+
+    ranked_stats: Iterable of stats_ranked results, PlayerRankedStats or raw json dictionaries.
+    totals: Keep the rows with champion id 0, which hold the summoner's stats over all champions.
+    dtype: Numpy type of the stat columns.
+
+    returns StatsTable with columns summoner_id, champion_id and every name in STAT_FIELDS
+    """
+    summoner_ids = []
+    champion_ids = []
+    stats = []
+    for ranked in ranked_stats:
+        if isinstance(ranked, dict):
+            summoner_id = ranked['summonerId']
+            champions = [(champion['id'], champion['stats']) for champion in ranked['champions']]
+        else:
+            summoner_id = ranked.summoner_id
+            champions = [(champion.id, champion.stats) for champion in ranked.champions]
+
+        for champion_id, champion_stats in champions:
+            if champion_id == 0 and not totals:
+                continue
+            summoner_ids.append(summoner_id)
+            champion_ids.append(champion_id)
+            stats.append(_stat_values(champion_stats))
+
+    keys = (
+        ('summoner_id', numpy.array(summoner_ids, dtype=numpy.int64)),
+        ('champion_id', numpy.array(champion_ids, dtype=numpy.int64)),
+    )
+    return StatsTable(keys, stats, dtype)
+
+def stats_summary_table(stat_summaries, dtype=numpy.int64):
+    """
+    One row per PlayerStatsSummary.
+
+    stat_summaries: Dictionary of summoner id to its stats_summary result, a list of
+                    PlayerStatsSummary, or an iterable of raw json stats_summary responses.
+    dtype: Numpy type of the stat columns.
+
+    returns StatsTable with columns summoner_id, player_stat_summary_type, wins, losses
+    and every name in STAT_FIELDS. wins and losses are masked where missing.
+    """
+    if hasattr(stat_summaries, 'items'):
+        items = stat_summaries.items()
+    else:
+        items = ((content['summonerId'], content) for content in stat_summaries)
+
+    summoner_ids = []
+    summary_types = []
+    wins = []
+    losses = []
+    stats = []
+    for summoner_id, summaries in items:
+        if isinstance(summaries, dict):
+            summaries = summaries['playerStatSummaries']
+
+        for summary in summaries:
+            if isinstance(summary, dict):
+                summary_types.append(summary['playerStatSummaryType'])
+                wins.append(summary.get('wins', _NULL))
+                losses.append(summary.get('losses', _NULL))
+                stats.append(_stat_values(summary['aggregatedStats']))
+            else:
+                summary_types.append(summary.player_stat_summary_type)
+                wins.append(_value(summary, 'wins'))
+                losses.append(_value(summary, 'losses'))
+                stats.append(_stat_values(summary.aggregated_stats))
+            summoner_ids.append(summoner_id)
+
+    keys = (
+        ('summoner_id', numpy.array(summoner_ids, dtype=numpy.int64)),
+        ('player_stat_summary_type', numpy.array(summary_types, dtype=object)),
+        ('wins', _masked(wins)),
+        ('losses', _masked(losses)),
+    )
+    return StatsTable(keys, stats, dtype)
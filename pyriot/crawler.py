@@ -0,0 +1,296 @@
+# -*- coding: utf-8 -*-
+
+"""
+Breadth first crawl of the summoners of a region.
+
+    crawler = Crawler(priot, NORTH_AMERICA, [24915110], workers=8)
+    for result in crawler:
+        store(result.summoner_id, result.leagues, result.recent_games)
+
+Starting from seed summoner ids, every summoner's leagues and recent games
+are fetched and the summoners found in league entries and fellow players are
+queued for crawling. Memory stays flat however long the crawl runs: the
+frontier of queued summoners and the results waiting for the consumer are
+bounded queues, and visited summoners are kept in a bloom filter. Requests go
+through the client's rate limiter, so throughput follows the api key's limit.
+"""
+
+import collections
+import math
+import threading
+
+try:
+    import Queue as queue
+except ImportError:
+    import queue
+
+import requests
+
+DEFAULT_WORKERS = 4
+DEFAULT_MAX_FRONTIER = 100000
+DEFAULT_MAX_PENDING = 100
+DEFAULT_EXPECTED_SUMMONERS = 10000000
+DEFAULT_ERROR_RATE = 0.001
+
+# seconds blocked threads wait before checking whether the crawl was stopped
+_POLL_SECONDS = 0.1
+
+_MASK_64 = 2 ** 64 - 1
+
+_DONE = object()
+
+class _WorkerFailure(object):
+    # put on the results queue by a worker dying of an unexpected exception
+    def __init__(self, error):
+        self.error = error
+
+CrawlResult = collections.namedtuple('CrawlResult', 'summoner_id leagues recent_games error')
+
+def _mix(value):
+    # splitmix64 finalizer, spreads consecutive ids over the whole range
+    value = (value + 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+class BloomFilter(object):
+    """
+    Set of integer ids using a fixed number of bits. Membership tests may
+    give false positives at about error_rate, never false negatives.
+
+    capacity: Number of ids the filter is sized for.
+    error_rate: False positive rate once capacity ids were added.
+
+    Ten million ids at the default error rate take about 18 MB.
+    """
+    def __init__(self, capacity=DEFAULT_EXPECTED_SUMMONERS, error_rate=DEFAULT_ERROR_RATE):
+        self.size = max(8, int(math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)))
+        self.hash_count = max(1, int(round(float(self.size) / capacity * math.log(2))))
+        self.count = 0
+
+        self._bits = bytearray((self.size + 7) // 8)
+
+    def _positions(self, value):
+        hashed = _mix(value)
+        first = hashed & 0xFFFFFFFF
+        second = (hashed >> 32) | 1
+        return [(first + index * second) % self.size for index in range(self.hash_count)]
+
+    def add(self, value):
+        """
+        Adds value, returning False when it was already present.
+        """
+        added = False
+        bits = self._bits
+        for position in self._positions(value):
+            mask = 1 << (position & 7)
+            if not bits[position >> 3] & mask:
+                bits[position >> 3] |= mask
+                added = True
+
+        if added:
+            self.count += 1
+        return added
+
+    def __contains__(self, value):
+        bits = self._bits
+        for position in self._positions(value):
+            if not bits[position >> 3] & (1 << (position & 7)):
+                return False
+        return True
+
+    def __len__(self):
+        return self.count
+
+class Crawler(object):
+    """
+    Generator of CrawlResult(summoner_id, leagues, recent_games, error), one
+    per crawled summoner, in breadth first order.
+
+    priot: PyRiot client, its pool_size should be at least workers.
+    region: Region to crawl.
+    seeds: Summoner ids to start from.
+    workers: Number of summoners fetched at the same time.
+    max_frontier: Summoners queued for crawling at most. Summoners found while
+                  the frontier is full are dropped until found again.
+    max_pending: Results waiting for the consumer at most. Workers stop
+                 fetching while the consumer lags behind.
+    max_summoners: Stop after this many summoners, by default the crawl ends
+                   when no new summoners are found.
+    expected_summoners: Capacity of the visited BloomFilter.
+    error_rate: False positive rate of the visited BloomFilter, the share of
+                summoners skipped once expected_summoners were visited.
+    leagues: Fetch the leagues of every summoner.
+    recent_games: Fetch the recent games of every summoner.
+
+    leagues is a dictionary and recent_games a list as returned by PyRiot,
+    empty when the summoner has none. When fetching fails, error holds the
+    exception and the summoner's neighbours are not crawled.
+    """
+    def __init__(self, priot, region, seeds, workers=DEFAULT_WORKERS, max_frontier=DEFAULT_MAX_FRONTIER,
+                 max_pending=DEFAULT_MAX_PENDING, max_summoners=None, expected_summoners=DEFAULT_EXPECTED_SUMMONERS,
+                 error_rate=DEFAULT_ERROR_RATE, leagues=True, recent_games=True):
+        self.priot = priot
+        self.region = region
+        self.seeds = list(seeds)
+        self.workers = workers
+        self.max_summoners = max_summoners
+        self.fetch_leagues = leagues
+        self.fetch_recent_games = recent_games
+
+        self.visited = BloomFilter(expected_summoners, error_rate)
+        self.crawled = 0
+        self.dropped = 0
+
+        self._frontier = queue.Queue(max_frontier)
+        self._results = queue.Queue(max_pending)
+        self._pending = 0
+        self._started = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._threads = []
+
+    def __iter__(self):
+        return self.crawl()
+
+    def crawl(self):
+        """
+        Starts the workers and yields results as they come in. Closing the
+        generator stops the crawl.
+
+        Errors fetching a summoner are returned in its result. Any other
+        exception in a worker stops the crawl and is raised here.
+        """
+        for seed in self.seeds:
+            self._enqueue(int(seed))
+
+        if not self._pending:
+            return
+
+        for _ in range(self.workers):
+            thread = threading.Thread(target=self._work)
+            thread.daemon = True
+            thread.start()
+            self._threads.append(thread)
+
+        try:
+            while self.max_summoners is None or self.crawled < self.max_summoners:
+                result = self._results.get()
+                if result is _DONE:
+                    break
+                if isinstance(result, _WorkerFailure):
+                    raise result.error
+
+                self.crawled += 1
+                yield result
+        finally:
+            self.stop()
+
+    def stop(self):
+        """
+        Stops the workers once their current requests are done.
+        """
+        self._stop.set()
+        for thread in self._threads:
+            thread.join()
+        self._threads = []
+
+    def _enqueue(self, summoner_id):
+        with self._lock:
+            if summoner_id in self.visited:
+                return
+
+            try:
+                self._frontier.put_nowait(summoner_id)
+            except queue.Full:
+                self.dropped += 1
+                return
+
+            self.visited.add(summoner_id)
+            self._pending += 1
+
+    def _take(self):
+        """
+        Next summoner to crawl, or None once stopped or max_summoners were started.
+        """
+        while not self._stop.is_set():
+            try:
+                summoner_id = self._frontier.get(timeout=_POLL_SECONDS)
+            except queue.Empty:
+                continue
+
+            with self._lock:
+                if self.max_summoners is not None and self._started >= self.max_summoners:
+                    return None
+                self._started += 1
+            return summoner_id
+
+        return None
+
+    def _put(self, item):
+        while not self._stop.is_set():
+            try:
+                self._results.put(item, timeout=_POLL_SECONDS)
+                return
+            except queue.Full:
+                pass
+
+    def _work(self):
+        try:
+            self._crawl_frontier()
+        except BaseException as error:
+            # without a result or _DONE from this worker the consumer would wait forever
+            self._put(_WorkerFailure(error))
+
+    def _crawl_frontier(self):
+        while True:
+            summoner_id = self._take()
+            if summoner_id is None:
+                return
+
+            result = self._visit(summoner_id)
+            if result.error is None:
+                for found in self._neighbours(result):
+                    self._enqueue(found)
+
+            self._put(result)
+
+            with self._lock:
+                self._pending -= 1
+                done = self._pending == 0
+            if done:
+                self._put(_DONE)
+
+    def _visit(self, summoner_id):
+        leagues = dict()
+        games = []
+        try:
+            if self.fetch_leagues:
+                leagues = self._fetch(self.priot.leagues, summoner_id, leagues)
+            if self.fetch_recent_games:
+                games = self._fetch(self.priot.recent_games, summoner_id, games)
+        except Exception as error:
+            return CrawlResult(summoner_id, leagues, games, error)
+
+        return CrawlResult(summoner_id, leagues, games, None)
+
+    def _fetch(self, function, summoner_id, empty):
+        # the api answers 404 for summoners without leagues or games
+        try:
+            return function(self.region, summoner_id, raw=False)
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return empty
+            raise
+
+    def _neighbours(self, result):
+        for league in result.leagues.values():
+            for entry in getattr(league, 'entries', None) or ():
+                # team queues list team ids instead of summoner ids
+                player_id = getattr(entry, 'player_or_team_id', None)
+                if player_id and player_id.isdigit():
+                    yield int(player_id)
+
+        for game in result.recent_games:
+            for player in getattr(game, 'fellow_players', None) or ():
+                yield player.summoner_id
@@ -0,0 +1,95 @@
+# -*- coding: utf-8 -*-
+
+"""
+Json decoders for response bodies. A decoder is any callable taking a raw
+response body and returning the decoded json.
+
+orjson, ujson and simplejson are optional. The first installed library of
+PREFERRED_DECODERS is used by default. simplejson is only used when asked
+for by name, as it is no faster than the standard library json module.
+"""
+
+import collections
+import json
+
+DECODERS = ('orjson', 'ujson', 'simplejson', 'json')
+
+PREFERRED_DECODERS = ('orjson', 'ujson', 'json')
+
+def stdlib_decoder(body):
+    # json.loads only accepts bytes from Python 3.6
+    if isinstance(body, bytes) and not isinstance(body, str):
+        body = body.decode('utf-8')
+    return json.loads(body)
+
+def _orjson():
+    import orjson
+    return orjson.loads
+
+def _ujson():
+    import ujson
+    return ujson.loads
+
+def _simplejson():
+    import simplejson
+    return simplejson.loads
+
+def _json():
+    return stdlib_decoder
+
+_LOADERS = {
+    'orjson': _orjson,
+    'ujson': _ujson,
+    'simplejson': _simplejson,
+    'json': _json,
+}
+
+def get_decoder(name):
+    """
+    Returns the decoder of the named json library.
+
+    throws ValueError for unknown names and ImportError when the library is not installed
+    """
+    loader = _LOADERS.get(name)
+    if loader is None:
+        raise ValueError('unknown decoder {0!r}, expected one of {1}'.format(name, ', '.join(DECODERS)))
+    return loader()
+
+def available_decoders():
+    """
+    Ordered dictionary of name to decoder for every installed json library.
+    """
+    decoders = collections.OrderedDict()
+    for name in DECODERS:
+        try:
+            decoders[name] = get_decoder(name)
+        except ImportError:
+            pass
+
+    return decoders
+
+_default = None
+
+def default_decoder():
+    """
+    Fastest installed decoder.
+    """
+    global _default
+    if _default is None:
+        available = available_decoders()
+        for name in PREFERRED_DECODERS:
+            if name in available:
+                _default = available[name]
+                break
+    return _default
+
+def resolve(decoder):
+    """
+    Turns the decoder argument of a client, None, a library name or a
+    callable, into a decoder.
+    """
+    if decoder is None:
+        return default_decoder()
+    if callable(decoder):
+        return decoder
+    return get_decoder(decoder)
@@ -0,0 +1,185 @@
+# -*- coding: utf-8 -*-
+
+"""
+Attaches summoner, champion, summoner spell and item names to batches of
+games.
+
+    names = NameCache(priot)
+    static = StaticData(priot, NORTH_AMERICA, directory='/var/cache/pyriot')
+
+    games = priot.recent_games(NORTH_AMERICA, summoner_id)
+    enrich_games(games, NORTH_AMERICA, names, static)
+    for game in games:
+        print(game.champion_name, [player.summoner_name for player in game.fellow_players])
+
+The ids of a whole batch are collected first, so every unknown summoner is
+requested once, SUMMONER_CHUNK_SIZE to a request, and known ones come from
+the NameCache shared between batches. Champions, spells and items are looked
+up in the StaticData snapshot without any request.
+"""
+
+import collections
+import threading
+import time
+
+import requests
+
+from . import utils
+from .cache import HOUR
+from .wrapper import SUMMONER_CHUNK_SIZE
+
+DEFAULT_MAX_NAMES = 100000
+DEFAULT_NAME_TTL = HOUR
+
+# RawStat names holding the id of an item in the final build
+ITEM_STATS = frozenset('ITEM{0}'.format(slot) for slot in range(7))
+
+class NameCache(object):
+    """
+    Summoner names by region and summoner id, shared by every enrichment pass.
+
+    priot: PyRiot client used to request unknown names.
+    max_entries: Names kept at most, the least recently used are evicted.
+    ttl: Seconds a name is kept, summoners may rename themselves.
+
+    Ids the api does not know are remembered as None for ttl as well.
+    """
+    def __init__(self, priot, max_entries=DEFAULT_MAX_NAMES, ttl=DEFAULT_NAME_TTL):
+        self.priot = priot
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.requests = 0
+
+        self._entries = collections.OrderedDict()
+        self._lock = threading.Lock()
+
+    def _lookup(self, key, now):
+        entry = self._entries.pop(key, None)
+        if entry is None or now - entry[0] >= self.ttl:
+            return False, None
+
+        self._entries[key] = entry
+        return True, entry[1]
+
+    def _store(self, region, names, now):
+        with self._lock:
+            for summoner_id, name in names.items():
+                key = (region, summoner_id)
+                self._entries.pop(key, None)
+                self._entries[key] = (now, name)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def names(self, region, summoner_ids):
+        """
+        Names of summoner_ids, requesting the ones not cached.
+
+        returns dictionary of summoner ids to names, None for unknown summoners
+
+        throws HTTPError
+        """
+        now = time.time()
+        names = dict()
+        missing = []
+        with self._lock:
+            for summoner_id in utils.unique(int(summoner_id) for summoner_id in summoner_ids):
+                found, name = self._lookup((region, summoner_id), now)
+                if found:
+                    names[summoner_id] = name
+                else:
+                    missing.append(summoner_id)
+
+        if not missing:
+            return names
+
+        def fetch(chunk):
+            try:
+                return self.priot.summoner_get_names_for_ids(
+                        region, ','.join('{0}'.format(summoner_id) for summoner_id in chunk), raw=False)
+            except requests.HTTPError as error:
+                # the api answers 404 when none of the summoners exist
+                if error.response is not None and error.response.status_code == 404:
+                    return dict()
+                raise
+
+        chunks = utils.chunks(missing, SUMMONER_CHUNK_SIZE)
+        fetched = dict((summoner_id, None) for summoner_id in missing)
+        for content in self.priot.map(fetch, chunks):
+            for summoner_id, name in content.items():
+                fetched[int(summoner_id)] = name
+
+        with self._lock:
+            self.requests += len(chunks)
+        self._store(region, fetched, now)
+
+        names.update(fetched)
+        return names
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        return len(self._entries)
+
+def _name(entry):
+    if entry is None:
+        return None
+    return entry.get('name')
+
+def enrich_games(games, region, names, static=None):
+    """
+    Sets name attributes on every game of a batch, None where unknown:
+
+    Game        champion_name, spell1_name, spell2_name
+    Player      summoner_name, champion_name
+    RawStat     item_name, for the ITEM0 to ITEM6 statistics
+
+    games: Games from any model module, such as the results of several recent_games calls.
+    region: Region the games were played in.
+    names: NameCache resolving summoner ids.
+    static: StaticData resolving champion, spell and item ids. Without it
+            only summoner names are set.
+
+    returns games
+
+    throws HTTPError
+    """
+    games = list(games)
+
+    summoner_ids = []
+    for game in games:
+        for player in getattr(game, 'fellow_players', None) or ():
+            summoner_ids.append(player.summoner_id)
+
+    summoner_names = names.names(region, summoner_ids) if summoner_ids else dict()
+
+    def champion_name(champion_id):
+        return _name(static.champion(champion_id)) if champion_id else None
+
+    def spell_name(spell_id):
+        return _name(static.summoner_spell(spell_id)) if spell_id else None
+
+    for game in games:
+        players = getattr(game, 'fellow_players', None) or ()
+        for player in players:
+            player.summoner_name = summoner_names.get(player.summoner_id)
+
+        if static is None:
+            continue
+
+        game.champion_name = champion_name(game.champion_id)
+        game.spell1_name = spell_name(game.spell1)
+        game.spell2_name = spell_name(game.spell2)
+
+        for player in players:
+            player.champion_name = champion_name(player.champion_id)
+
+        for stat in getattr(game, 'statistics', None) or ():
+            item_name = None
+            if stat.name in ITEM_STATS and stat.value:
+                item_name = _name(static.item(stat.value))
+            stat.item_name = item_name
+
+    return games
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+
+"""
+Runs batches of wrapper function calls spread over several regions.
+
+Every region has its own worker pool and its own rate limit buckets, so a
+job touching all regions takes as long as its slowest region instead of the
+sum of all of them.
+
+    with RegionExecutor(priot) as executor:
+        calls = [call('recent_games', region, summoner_id) for region, summoner_id in work]
+        for done in executor.run(calls):
+            print(done.call.region, done.result)
+"""
+
+import collections
+
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+DEFAULT_WORKERS_PER_REGION = 4
+
+WRAPPER_FUNCTIONS = (
+    'champions',
+    'recent_games',
+    'leagues',
+    'stats_summary',
+    'stats_ranked',
+    'summoner_masteries',
+    'summoner_runes',
+    'summoner_get_by_name',
+    'summoner_get_by_id',
+    'summoner_get_names_for_ids',
+    'summoners_by_ids',
+    'summoners_by_names',
+    'teams',
+)
+
+Call = collections.namedtuple('Call', 'endpoint region args kwargs')
+
+CallResult = collections.namedtuple('CallResult', 'call result error')
+
+def call(endpoint, region, *args, **kwargs):
+    """
+    Describes the call priot.endpoint(region, *args, **kwargs).
+    """
+    return Call(endpoint, region, args, kwargs)
+
+def as_call(spec):
+    """
+    Call for a Call, or for a (endpoint, region, *args) tuple such as ('leagues', region, summoner_id).
+    """
+    if isinstance(spec, Call):
+        return spec
+    if len(spec) < 2:
+        raise ValueError('call needs an endpoint and a region: {0!r}'.format(spec))
+    return Call(spec[0], spec[1], tuple(spec[2:]), dict())
+
+def wrapper_function(priot, endpoint):
+    """
+    Bound wrapper function endpoint of priot.
+
+    throws ValueError for names missing from WRAPPER_FUNCTIONS, such as close or batch
+    """
+    if endpoint not in WRAPPER_FUNCTIONS:
+        raise ValueError('unknown wrapper function {0!r}'.format(endpoint))
+    return getattr(priot, endpoint)
+
+class RegionExecutor(object):
+    """
+    Worker pools per region running PyRiot wrapper function calls.
+
+    priot: PyRiot client, its pool_size should be at least workers_per_region.
+    workers_per_region: Number of calls running at the same time in each region.
+    """
+    def __init__(self, priot, workers_per_region=DEFAULT_WORKERS_PER_REGION):
+        self.priot = priot
+        self.workers_per_region = workers_per_region
+
+        self._executors = dict()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
+
+    def shutdown(self, wait=True):
+        """
+        Stops the worker pools, by default after finishing the calls already submitted.
+        """
+        for executor in self._executors.values():
+            executor.shutdown(wait)
+        self._executors = dict()
+
+    def _executor(self, region):
+        executor = self._executors.get(region)
+        if executor is None:
+            executor = ThreadPoolExecutor(self.workers_per_region)
+            self._executors[region] = executor
+        return executor
+
+    def submit(self, endpoint, region, *args, **kwargs):
+        """
+        Schedules priot.endpoint(region, *args, **kwargs) on the pool of region.
+
+        returns concurrent.futures.Future of the call's return value
+        """
+        function = wrapper_function(self.priot, endpoint)
+        return self._executor(region).submit(function, region, *args, **kwargs)
+
+    def run(self, calls):
+        """
+        Runs every Call, or (endpoint, region, *args) tuple, and yields a
+        CallResult(call, result, error) for each as soon as it finishes. error
+        holds the exception of failed calls.
+
+        throws ValueError for unknown wrapper functions, before any call is submitted
+        """
+        calls = [as_call(spec) for spec in calls]
+        functions = [wrapper_function(self.priot, pending.endpoint) for pending in calls]
+
+        futures = dict()
+        for function, pending in zip(functions, calls):
+            future = self._executor(pending.region).submit(function, pending.region, *pending.args, **pending.kwargs)
+            futures[future] = pending
+
+        for future in as_completed(futures):
+            pending = futures.pop(future)
+            error = future.exception()
+            if error is not None:
+                yield CallResult(pending, None, error)
+            else:
+                yield CallResult(pending, future.result(), None)
@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+
+# Requires Python 3.6+ and httpx, with h2 for HTTP/2 (pip install httpx[http2]).
+
+"""
+Transport sending the requests of PyRiot over httpx, which can multiplex
+the requests to a region over one HTTP/2 connection instead of a connection
+per request in flight.
+
+HTTP/2 is only negotiated over https. httpx does not upgrade plain http
+connections, so with the default http BASE_URL requests use HTTP/1.1.
+Pass an https base_url to use HTTP/2:
+
+    with PyRiot('your_riot_api_key', base_url='https://prod.api.pvp.net/api/lol',
+                transport=HttpxTransport()) as priot:
+        priot.summoner_get_by_id(NORTH_AMERICA, 24915110)
+
+Servers without HTTP/2 are spoken to over HTTP/1.1.
+"""
+
+import threading
+
+import httpx
+import requests
+
+from .metrics import timer
+from .session import DEFAULT_POOL_SIZE
+from .transport import build_response
+
+class HttpxTransport(object):
+    """
+    One httpx.Client per region, shared by every endpoint call.
+
+    http2: When True HTTP/2 is negotiated with https servers supporting it.
+    pool_size: Number of connections kept alive per region.
+    timeout: Default timeout in seconds passed to every request.
+
+    Timeouts are raised as requests.Timeout and connection failures as
+    requests.ConnectionError, so the client retries them as with SessionPool.
+    """
+    def __init__(self, http2=True, pool_size=DEFAULT_POOL_SIZE, timeout=None):
+        self.http2 = http2
+        self.pool_size = pool_size
+        self.timeout = timeout
+
+        self._clients = dict()
+        self._lock = threading.Lock()
+
+    def client(self, region):
+        """
+        Returns the client for region, creating it on first use.
+        """
+        client = self._clients.get(region)
+        if client is not None:
+            return client
+
+        with self._lock:
+            client = self._clients.get(region)
+            if client is None:
+                client = httpx.Client(
+                        http2=self.http2,
+                        limits=httpx.Limits(max_connections=self.pool_size,
+                                            max_keepalive_connections=self.pool_size),
+                        timeout=None)
+                self._clients[region] = client
+
+        return client
+
+    def get(self, region, url, timeout=None):
+        """
+        Sends a GET request for url over the region's client.
+        """
+        if timeout is None:
+            timeout = self.timeout
+
+        sent = timer()
+        try:
+            with self.client(region).stream('GET', url, timeout=timeout) as response:
+                first_byte = timer() - sent
+                body = response.read()
+        except httpx.TimeoutException as error:
+            raise requests.Timeout(error)
+        except httpx.TransportError as error:
+            raise requests.ConnectionError(error)
+
+        return build_response(url, response.status_code, dict(response.headers), body, first_byte)
+
+    def close(self):
+        """
+        Closes every client and drops their pooled connections.
+        """
+        with self._lock:
+            clients = list(self._clients.values())
+            self._clients.clear()
+
+        for client in clients:
+            client.close()
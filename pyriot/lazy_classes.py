@@ -0,0 +1,215 @@
+# -*- coding: utf-8 -*-
+
+"""
+Lazy variants of the classes in api_classes.
+
+Objects only keep the raw api dictionary when created. Each attribute,
+including nested objects, lists and datetimes, is built the first time it is
+read and then stored on the instance, so reading a field twice costs no more
+than a plain attribute. Use them with PyRiot(api_key, models=lazy_classes).
+
+Every class subclasses its api_classes counterpart and exposes the same
+attributes. Like there, attributes for keys missing from the response raise
+AttributeError.
+"""
+
+from . import api_classes
+from . import schema
+from . import utils
+
+class _Field(object):
+    """
+    Non-data descriptor reading key from the raw dictionary on first access
+    and caching the converted value in the instance dictionary.
+    """
+    def __init__(self, key, name, convert=None):
+        self.key = key
+        self.name = name
+        self.convert = convert
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+
+        try:
+            value = instance._raw[self.key]
+        except KeyError:
+            raise AttributeError(self.name)
+
+        if self.convert is not None:
+            value = self.convert(value)
+
+        instance.__dict__[self.name] = value
+        return value
+
+def _datetime(value):
+    return utils.convert_epoch_millis_to_datetime(value)
+
+def _object(cls):
+    return lambda raw: cls._from_raw(raw)
+
+def _list(cls):
+    return lambda items: [cls._from_raw(raw) for raw in items]
+
+class _LazyModel(object):
+    _fields = ()
+
+    def __init__(self, **kwargs):
+        self._raw = kwargs
+
+    @classmethod
+    def _from_raw(cls, raw):
+        instance = cls.__new__(cls)
+        instance._raw = raw
+        return instance
+
+    def hydrate(self):
+        """
+        Builds every attribute, including those of nested objects.
+        """
+        for name in self._fields:
+            value = getattr(self, name, None)
+            if isinstance(value, _LazyModel):
+                value.hydrate()
+            elif isinstance(value, list):
+                for item in value:
+                    if isinstance(item, _LazyModel):
+                        item.hydrate()
+        return self
+
+    def __object_string(self):
+        object_string = ''
+        for name in self._fields:
+            if hasattr(self, name):
+                object_string = object_string + '{0}: {1}\n'.format(name, getattr(self, name))
+
+        return object_string
+
+    def __repr__(self):
+        return self.__object_string()
+
+    def __str__(self):
+        return self.__object_string()
+
+    def __unicode__(self):
+        return self.__object_string()
+
+def _bind_fields(cls):
+    """
+    Adds a _Field descriptor for every entry of the class schema.
+    """
+    fields = []
+    for field in cls._schema:
+        convert = None
+        if field.kind == schema.DATETIME:
+            convert = _datetime
+        elif field.kind == schema.OBJECT:
+            convert = _object(globals()[field.model])
+        elif field.kind == schema.LIST:
+            convert = _list(globals()[field.model])
+
+        setattr(cls, field.name, _Field(field.key, field.name, convert))
+        fields.append(field.name)
+
+    cls._fields = tuple(fields)
+
+
+class Summoner(_LazyModel, api_classes.Summoner):
+    _schema = schema.SUMMONER
+
+
+class Champion(_LazyModel, api_classes.Champion):
+    _schema = schema.CHAMPION
+
+
+class Game(_LazyModel, api_classes.Game):
+    _schema = schema.GAME
+
+
+class Player(_LazyModel, api_classes.Player):
+    _schema = schema.PLAYER
+
+
+class RawStat(_LazyModel, api_classes.RawStat):
+    _schema = schema.RAW_STAT
+
+
+class League(_LazyModel, api_classes.League):
+    _schema = schema.LEAGUE
+
+
+class LeagueItem(_LazyModel, api_classes.LeagueItem):
+    _schema = schema.LEAGUE_ITEM
+
+
+class MiniSeries(_LazyModel, api_classes.MiniSeries):
+    _schema = schema.MINI_SERIES
+
+
+class PlayerStatsSummary(_LazyModel, api_classes.PlayerStatsSummary):
+    _schema = schema.PLAYER_STATS_SUMMARY
+
+
+class PlayerRankedStats(_LazyModel, api_classes.PlayerRankedStats):
+    _schema = schema.PLAYER_RANKED_STATS
+
+
+class ChampionStats(_LazyModel, api_classes.ChampionStats):
+    _schema = schema.CHAMPION_STATS
+
+
+class AggregatedStats(_LazyModel, api_classes.AggregatedStats):
+    _schema = schema.AGGREGATED_STATS
+
+
+class MasteryPage(_LazyModel, api_classes.MasteryPage):
+    _schema = schema.MASTERY_PAGE
+
+
+class Talent(_LazyModel, api_classes.Talent):
+    _schema = schema.TALENT
+
+
+class RunePage(_LazyModel, api_classes.RunePage):
+    _schema = schema.RUNE_PAGE
+
+
+class RuneSlot(_LazyModel, api_classes.RuneSlot):
+    _schema = schema.RUNE_SLOT
+
+
+class Rune(_LazyModel, api_classes.Rune):
+    _schema = schema.RUNE
+
+
+class Team(_LazyModel, api_classes.Team):
+    _schema = schema.TEAM
+
+
+class MatchHistorySummary(_LazyModel, api_classes.MatchHistorySummary):
+    _schema = schema.MATCH_HISTORY_SUMMARY
+
+
+class MessageOfDay(_LazyModel, api_classes.MessageOfDay):
+    _schema = schema.MESSAGE_OF_DAY
+
+
+class Roster(_LazyModel, api_classes.Roster):
+    _schema = schema.ROSTER
+
+
+class TeamStatSummary(_LazyModel, api_classes.TeamStatSummary):
+    _schema = schema.TEAM_STAT_SUMMARY
+
+
+class TeamMemberInfo(_LazyModel, api_classes.TeamMemberInfo):
+    _schema = schema.TEAM_MEMBER_INFO
+
+
+class TeamStatDetail(_LazyModel, api_classes.TeamStatDetail):
+    _schema = schema.TEAM_STAT_DETAIL
+
+
+for _name in schema.SCHEMAS:
+    _bind_fields(globals()[_name])
+del _name
@@ -0,0 +1,259 @@
+# -*- coding: utf-8 -*-
+
+"""
+Request metrics per wrapper function and region, exported in the Prometheus
+text format.
+
+    metrics = MetricsRegistry()
+    priot = PyRiot('your_riot_api_key', metrics=metrics)
+    ...
+    metrics.write_prometheus('/var/lib/node_exporter/pyriot.prom')
+
+Every request sent is counted by status with the bytes received, and the
+time of every call is split into stages:
+
+wait        Waiting for the rate limiter, and in AsyncPyRiot for a free request slot.
+first_byte  From sending the request until the response headers arrived:
+            DNS lookup, connecting and the api's processing time.
+transfer    Reading the response body.
+decode      Decoding the json body.
+
+Building objects from decoded responses is timed per model class, summed
+over the objects built, since one call may build objects of several classes.
+"""
+
+import os
+import threading
+import timeit
+
+# Upper bounds in seconds of the histogram buckets
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+STAGES = ('wait', 'first_byte', 'transfer', 'decode')
+
+# status label of requests failing without a response, such as timeouts
+ERROR_STATUS = 'error'
+
+timer = timeit.default_timer
+
+def _escape(value):
+    return '{0}'.format(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+def _labels(names, values, extra=''):
+    pairs = ['{0}="{1}"'.format(name, _escape(value)) for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return '{' + ','.join(pairs) + '}'
+
+def _number(value):
+    if isinstance(value, float):
+        return repr(value)
+    return '{0}'.format(value)
+
+class Histogram(object):
+    """
+    Count of observed values per bucket, with their sum and count.
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * (len(self.buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value):
+        index = 0
+        for bound in self.buckets:
+            if value <= bound:
+                break
+            index += 1
+        self.counts[index] += 1
+        self.sum += value
+        self.count += 1
+
+    def cumulative(self):
+        """
+        (upper bound, count of values at most the bound) per bucket, the last bound being float('inf').
+        """
+        total = 0
+        result = []
+        for bound, count in zip(self.buckets + (float('inf'),), self.counts):
+            total += count
+            result.append((bound, total))
+        return result
+
+    def quantile(self, q):
+        """
+        Estimate of quantile q, the upper bound of the bucket holding it.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        for bound, total in self.cumulative():
+            if total >= rank:
+                return bound
+        return float('inf')
+
+class _TimedModel(object):
+    # stand-in for a model class, timing every object built through it
+    def __init__(self, cls, registry):
+        self.cls = cls
+        self.registry = registry
+
+    def __call__(self, *args, **kwargs):
+        started = timer()
+        instance = self.cls(*args, **kwargs)
+        self.registry.record_hydration(self.cls.__name__, timer() - started)
+        return instance
+
+class TimedModels(object):
+    """
+    Stand-in for a models module, timing the objects built with it.
+    """
+    def __init__(self, models, registry):
+        self.models = models
+        self.registry = registry
+
+        self._classes = dict()
+
+    def __getattr__(self, name):
+        timed = self._classes.get(name)
+        if timed is None:
+            timed = _TimedModel(getattr(self.models, name), self.registry)
+            self._classes[name] = timed
+        return timed
+
+class MetricsRegistry(object):
+    """
+    Metrics of every client sharing the registry, safe to use from several threads.
+
+    buckets: Upper bounds in seconds of the histogram buckets.
+
+    requests        dictionary of (endpoint, region, status) to requests sent
+    response_bytes  dictionary of (endpoint, region) to bytes received
+    latency         dictionary of (endpoint, region) to Histogram of request times, first_byte plus transfer
+    stages          dictionary of (endpoint, region, stage) to Histogram of stage times
+    hydration       dictionary of model class name to [seconds, objects built]
+    """
+    def __init__(self, buckets=DEFAULT_BUCKETS):
+        self.buckets = tuple(buckets)
+
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = dict()
+            self.response_bytes = dict()
+            self.latency = dict()
+            self.stages = dict()
+            self.hydration = dict()
+
+    def _histogram(self, histograms, key):
+        histogram = histograms.get(key)
+        if histogram is None:
+            histogram = Histogram(self.buckets)
+            histograms[key] = histogram
+        return histogram
+
+    def timed_models(self, models):
+        return TimedModels(models, self)
+
+    def record_request(self, endpoint, region, status, size, wait, first_byte, transfer):
+        """
+        Records a request that got a response.
+        """
+        with self._lock:
+            key = (endpoint, region)
+            status_key = (endpoint, region, '{0}'.format(status))
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            self.response_bytes[key] = self.response_bytes.get(key, 0) + size
+            self._histogram(self.latency, key).observe(first_byte + transfer)
+            self._histogram(self.stages, key + ('wait',)).observe(wait)
+            self._histogram(self.stages, key + ('first_byte',)).observe(first_byte)
+            self._histogram(self.stages, key + ('transfer',)).observe(transfer)
+
+    def record_error(self, endpoint, region, wait, elapsed):
+        """
+        Records a request that failed without a response, such as a timeout.
+        """
+        with self._lock:
+            key = (endpoint, region)
+            status_key = (endpoint, region, ERROR_STATUS)
+            self.requests[status_key] = self.requests.get(status_key, 0) + 1
+            self._histogram(self.latency, key).observe(elapsed)
+            self._histogram(self.stages, key + ('wait',)).observe(wait)
+
+    def record_decode(self, endpoint, region, seconds):
+        with self._lock:
+            self._histogram(self.stages, (endpoint, region, 'decode')).observe(seconds)
+
+    def record_hydration(self, model, seconds):
+        with self._lock:
+            entry = self.hydration.get(model)
+            if entry is None:
+                entry = [0.0, 0]
+                self.hydration[model] = entry
+            entry[0] += seconds
+            entry[1] += 1
+
+    def prometheus(self, prefix='pyriot'):
+        """
+        Every metric in the Prometheus text exposition format.
+        """
+        with self._lock:
+            lines = []
+
+            lines.append('# HELP {0}_requests_total Requests sent to the api.'.format(prefix))
+            lines.append('# TYPE {0}_requests_total counter'.format(prefix))
+            for key in sorted(self.requests):
+                lines.append('{0}_requests_total{1} {2}'.format(
+                        prefix, _labels(('endpoint', 'region', 'status'), key), self.requests[key]))
+
+            lines.append('# HELP {0}_response_bytes_total Response body bytes received.'.format(prefix))
+            lines.append('# TYPE {0}_response_bytes_total counter'.format(prefix))
+            for key in sorted(self.response_bytes):
+                lines.append('{0}_response_bytes_total{1} {2}'.format(
+                        prefix, _labels(('endpoint', 'region'), key), self.response_bytes[key]))
+
+            self._histogram_lines(lines, prefix + '_request_duration_seconds',
+                                  'Time from sending a request until its body was read.',
+                                  ('endpoint', 'region'), self.latency)
+            self._histogram_lines(lines, prefix + '_stage_duration_seconds',
+                                  'Time spent per call stage: wait, first_byte, transfer and decode.',
+                                  ('endpoint', 'region', 'stage'), self.stages)
+
+            lines.append('# HELP {0}_hydration_seconds_total Time spent building objects, per model class.'.format(prefix))
+            lines.append('# TYPE {0}_hydration_seconds_total counter'.format(prefix))
+            for model in sorted(self.hydration):
+                lines.append('{0}_hydration_seconds_total{1} {2}'.format(
+                        prefix, _labels(('model',), (model,)), _number(self.hydration[model][0])))
+
+            lines.append('# HELP {0}_hydrated_objects_total Objects built from responses, per model class.'.format(prefix))
+            lines.append('# TYPE {0}_hydrated_objects_total counter'.format(prefix))
+            for model in sorted(self.hydration):
+                lines.append('{0}_hydrated_objects_total{1} {2}'.format(
+                        prefix, _labels(('model',), (model,)), self.hydration[model][1]))
+
+        return '\n'.join(lines) + '\n'
+
+    def _histogram_lines(self, lines, name, description, label_names, histograms):
+        lines.append('# HELP {0} {1}'.format(name, description))
+        lines.append('# TYPE {0} histogram'.format(name))
+        for key in sorted(histograms):
+            histogram = histograms[key]
+            for bound, total in histogram.cumulative():
+                le = '+Inf' if bound == float('inf') else _number(bound)
+                lines.append('{0}_bucket{1} {2}'.format(
+                        name, _labels(label_names, key, 'le="{0}"'.format(le)), total))
+            lines.append('{0}_sum{1} {2}'.format(name, _labels(label_names, key), _number(histogram.sum)))
+            lines.append('{0}_count{1} {2}'.format(name, _labels(label_names, key), histogram.count))
+
+    def write_prometheus(self, path, prefix='pyriot'):
+        """
+        Writes prometheus() to path, for the node exporter textfile collector.
+        The file is replaced at once, so it is never read half written.
+        """
+        temporary = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(temporary, 'w') as output:
+            output.write(self.prometheus(prefix))
+        os.rename(temporary, path)
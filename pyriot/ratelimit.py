@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+
+import collections
+import threading
+import time
+
+# (requests, seconds) windows of a development api key
+DEFAULT_RATE_LIMITS = ((10, 10), (500, 600))
+
+RATE_LIMIT_HEADER = 'X-Rate-Limit'
+RATE_LIMIT_COUNT_HEADER = 'X-Rate-Limit-Count'
+APP_RATE_LIMIT_HEADER = 'X-App-Rate-Limit'
+APP_RATE_LIMIT_COUNT_HEADER = 'X-App-Rate-Limit-Count'
+
+def parse_rate_limit_header(value):
+    """
+    Parses a rate limit header such as '10:10,500:600' into a dictionary of
+    window seconds to request count.
+    """
+    windows = dict()
+    for part in value.split(','):
+        count, _, seconds = part.strip().partition(':')
+        if count and seconds:
+            windows[int(seconds)] = int(count)
+
+    return windows
+
+class _Window(object):
+    """
+    Send times reserved within one rolling window of a bucket.
+    """
+    def __init__(self, limit, seconds):
+        self.limit = limit
+        self.seconds = seconds
+        self.sent = collections.deque()
+
+    def next_slot(self, now):
+        while self.sent and self.sent[0] <= now - self.seconds:
+            self.sent.popleft()
+
+        if len(self.sent) < self.limit:
+            return now
+        return self.sent[-self.limit] + self.seconds
+
+    def reserve(self, at):
+        self.sent.append(at)
+        while len(self.sent) > self.limit:
+            self.sent.popleft()
+
+    def resync(self, count, now):
+        """
+        Pads the window when the server has counted more requests than we did,
+        e.g. because another process shares the api key.
+        """
+        in_window = 0
+        for sent in self.sent:
+            if now - self.seconds < sent <= now:
+                in_window += 1
+
+        missing = min(count, self.limit) - in_window
+        if missing > 0:
+            self.sent.extend([now] * missing)
+            self.sent = collections.deque(sorted(self.sent))
+
+class _Bucket(object):
+    def __init__(self, limits):
+        self.windows = [_Window(limit, seconds) for limit, seconds in limits]
+        self.blocked_until = 0
+
+    def reserve(self, now):
+        at = max(now, self.blocked_until)
+        for window in self.windows:
+            at = max(at, window.next_slot(now))
+
+        for window in self.windows:
+            window.reserve(at)
+
+        return at - now
+
+class RateLimiter(object):
+    """
+    Client side rate limiter keeping a bucket of rolling windows per api key
+    and region. Requests reserve the next free send slot in every window of
+    their bucket and wait for it, so callers queue in order instead of
+    running into 429 responses.
+
+    One limiter can be shared by several PyRiot instances and threads.
+
+    limits: Sequence of (requests, seconds) windows applied to every bucket.
+    """
+    def __init__(self, limits=DEFAULT_RATE_LIMITS):
+        self.limits = tuple(limits)
+
+        self._buckets = dict()
+        self._lock = threading.Lock()
+
+    def _bucket(self, api_key, region):
+        bucket = self._buckets.get((api_key, region))
+        if bucket is None:
+            bucket = _Bucket(self.limits)
+            self._buckets[(api_key, region)] = bucket
+        return bucket
+
+    def reserve(self, api_key, region):
+        """
+        Reserves a send slot and returns the number of seconds to wait for it.
+        """
+        with self._lock:
+            if not self.limits:
+                # rate limiting is disabled, only honour block()
+                bucket = self._buckets.get((api_key, region))
+                if bucket is None:
+                    return 0
+                return max(0, bucket.blocked_until - time.time())
+
+            return self._bucket(api_key, region).reserve(time.time())
+
+    def acquire(self, api_key, region):
+        """
+        Blocks until a request may be sent for api_key in region.
+        """
+        delay = self.reserve(api_key, region)
+        if delay > 0:
+            time.sleep(delay)
+
+    def block(self, api_key, region, seconds):
+        """
+        Holds back every request for api_key in region for seconds, e.g. after
+        a 429 response asking to retry later.
+        """
+        with self._lock:
+            bucket = self._bucket(api_key, region)
+            bucket.blocked_until = max(bucket.blocked_until, time.time() + seconds)
+
+    def update(self, api_key, region, headers):
+        """
+        Resyncs the bucket with the rate limit headers of a response.
+
+        When the server announces its limits the bucket switches to them.
+        """
+        limits_header = headers.get(APP_RATE_LIMIT_HEADER) or headers.get(RATE_LIMIT_HEADER)
+        count_header = headers.get(APP_RATE_LIMIT_COUNT_HEADER) or headers.get(RATE_LIMIT_COUNT_HEADER)
+        if not limits_header and not count_header:
+            return
+
+        now = time.time()
+        with self._lock:
+            bucket = self._bucket(api_key, region)
+
+            if limits_header:
+                limits = parse_rate_limit_header(limits_header)
+                current = dict((window.seconds, window.limit) for window in bucket.windows)
+                if limits != current:
+                    windows = []
+                    for seconds, limit in sorted(limits.items()):
+                        window = _Window(limit, seconds)
+                        for old in bucket.windows:
+                            if old.seconds == seconds:
+                                window.sent = old.sent
+                        windows.append(window)
+                    bucket.windows = windows
+
+            if count_header:
+                counts = parse_rate_limit_header(count_header)
+                for window in bucket.windows:
+                    if window.seconds in counts:
+                        window.resync(counts[window.seconds], now)
@@ -0,0 +1,233 @@
+# -*- coding: utf-8 -*-
+
+"""
+Retries and circuit breaking shared by every wrapper function.
+
+A RetryPolicy decides whether a failed request is sent again and how long
+to wait first: exponential backoff with jitter, or the Retry-After the api
+asked for, within an optional deadline per call. A CircuitBreaker counts
+consecutive failures per region and, once a region looks down, fails calls
+at once with CircuitOpenError instead of queueing more requests against it.
+"""
+
+import email.utils
+import random
+import threading
+import time
+
+# statuses worth sending the request again for
+DEFAULT_RETRY_STATUSES = (429, 500, 502, 503, 504)
+
+CLOSED = 'closed'
+OPEN = 'open'
+HALF_OPEN = 'half-open'
+
+def parse_retry_after(value, now=None):
+    """
+    Seconds to wait from a Retry-After header, given as seconds or as an
+    HTTP date. Returns None when missing or unreadable.
+    """
+    if not value:
+        return None
+
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    parsed = email.utils.parsedate_tz(value)
+    if parsed is None:
+        return None
+
+    if now is None:
+        now = time.time()
+    return max(0.0, email.utils.mktime_tz(parsed) - now)
+
+class RetryPolicy(object):
+    """
+    max_attempts: Requests sent per call at most, 1 disables retrying.
+    backoff: Seconds to wait before the first retry, doubled for every further retry.
+    max_backoff: Longest wait between two attempts.
+    jitter: Wait a random time between 0 and the backoff, so clients retrying
+            together do not hit the api in lockstep.
+    retry_statuses: Response statuses that are retried.
+    retry_errors: Retry timeouts and connection errors.
+    deadline: Seconds a call may take overall, including waits. No further
+              attempt is made once it would be exceeded.
+    """
+    def __init__(self, max_attempts=4, backoff=0.5, max_backoff=30, jitter=True,
+                 retry_statuses=DEFAULT_RETRY_STATUSES, retry_errors=True, deadline=None):
+        self.max_attempts = max_attempts
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+        self.jitter = jitter
+        self.retry_statuses = frozenset(retry_statuses)
+        self.retry_errors = retry_errors
+        self.deadline = deadline
+
+    def backoff_delay(self, attempt):
+        """
+        Seconds to wait after attempt number attempt, counted from 1.
+        """
+        delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+
+    def retry_delay(self, attempt, started, status=None, headers=None):
+        """
+        Seconds to wait before sending the request again, or None to give up.
+
+        attempt: Number of requests sent so far for the call.
+        started: time.time() when the call started.
+        status: Status of the failed response, None for timeouts and connection errors.
+        headers: Headers of the failed response.
+        """
+        if attempt >= self.max_attempts:
+            return None
+
+        if status is None:
+            if not self.retry_errors:
+                return None
+        elif status not in self.retry_statuses:
+            return None
+
+        delay = None
+        if headers is not None:
+            delay = parse_retry_after(headers.get('Retry-After'))
+        if delay is None:
+            delay = self.backoff_delay(attempt)
+
+        if self.deadline is not None and time.time() + delay - started >= self.deadline:
+            return None
+
+        return delay
+
+    def timeout(self, started, timeout=None):
+        """
+        Timeout for the next attempt, shortened to what is left of the deadline.
+        """
+        if self.deadline is None:
+            return timeout
+
+        remaining = max(0.001, self.deadline - (time.time() - started))
+        if timeout is None:
+            return remaining
+        return min(timeout, remaining)
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+class CircuitOpenError(Exception):
+    """
+    Raised instead of sending a request to a region whose circuit is open.
+    """
+    def __init__(self, region, retry_at):
+        Exception.__init__(self, 'circuit open for region {0}, retrying after {1:.1f}s'.format(
+                region, max(0.0, retry_at - time.time())))
+        self.region = region
+        self.retry_at = retry_at
+
+class _Circuit(object):
+    def __init__(self):
+        self.state = CLOSED
+        self.failures = 0
+        self.opened_at = 0
+        self.probing = False
+        self.probe_started = 0
+        self.probe_id = 0
+
+class CircuitBreaker(object):
+    """
+    Circuit per region. After failure_threshold consecutive failures
+    (timeouts, connection errors and 5xx responses) the circuit opens and
+    calls for the region raise CircuitOpenError without a request. After
+    recovery_time seconds one probe request is let through: the circuit
+    closes again when it succeeds and reopens when it fails. A probe still
+    without an outcome after probe_timeout seconds, such as a hung request,
+    no longer holds back the next one.
+
+    One breaker can be shared by several clients and threads.
+    """
+    def __init__(self, failure_threshold=5, recovery_time=30, probe_timeout=60):
+        self.failure_threshold = failure_threshold
+        self.recovery_time = recovery_time
+        self.probe_timeout = probe_timeout
+
+        self._circuits = dict()
+        self._lock = threading.Lock()
+
+    def _circuit(self, region):
+        circuit = self._circuits.get(region)
+        if circuit is None:
+            circuit = _Circuit()
+            self._circuits[region] = circuit
+        return circuit
+
+    def state(self, region):
+        with self._lock:
+            return self._circuit(region).state
+
+    def before_request(self, region):
+        """
+        returns None, or an id to pass to end_probe when the request is the probe of a half open circuit
+
+        throws CircuitOpenError when no request may be sent to region
+        """
+        with self._lock:
+            circuit = self._circuit(region)
+            if circuit.state == CLOSED:
+                return None
+
+            now = time.time()
+            retry_at = circuit.opened_at + self.recovery_time
+            if circuit.state == OPEN and now >= retry_at:
+                circuit.state = HALF_OPEN
+                circuit.probing = False
+
+            if circuit.state == HALF_OPEN and circuit.probing and now >= circuit.probe_started + self.probe_timeout:
+                circuit.probing = False
+
+            if circuit.state == HALF_OPEN and not circuit.probing:
+                circuit.probing = True
+                circuit.probe_started = now
+                circuit.probe_id += 1
+                return circuit.probe_id
+
+            raise CircuitOpenError(region, retry_at)
+
+    def end_probe(self, region, probe_id):
+        """
+        Ends a probe whose call is done. A probe that ended without
+        record_success or record_failure, such as a cancelled call, lets the
+        next request probe the region instead.
+        """
+        with self._lock:
+            circuit = self._circuit(region)
+            if circuit.state == HALF_OPEN and circuit.probing and circuit.probe_id == probe_id:
+                circuit.probing = False
+
+    def record_success(self, region):
+        with self._lock:
+            circuit = self._circuit(region)
+            circuit.state = CLOSED
+            circuit.failures = 0
+            circuit.probing = False
+
+    def record_failure(self, region):
+        with self._lock:
+            circuit = self._circuit(region)
+            circuit.failures += 1
+            if circuit.state == HALF_OPEN or circuit.failures >= self.failure_threshold:
+                circuit.state = OPEN
+                circuit.opened_at = time.time()
+                circuit.probing = False
+
+    def reset(self, region=None):
+        """
+        Closes the circuit of region, or of every region.
+        """
+        with self._lock:
+            if region is None:
+                self._circuits.clear()
+            else:
+                self._circuits.pop(region, None)
@@ -0,0 +1,384 @@
+# -*- coding: utf-8 -*-
+
+"""
+Field tables describing how every api DTO maps onto the model classes, and
+the constructor generator that turns a table into __init__ code.
+
+Each field gives the api key, the attribute name, how the value is converted
+and whether the api may leave it out. api_classes, lazy_classes and
+slotted_classes are all built from these tables.
+"""
+
+import collections
+
+# field kinds
+PLAIN = None
+DATETIME = 'datetime'
+OBJECT = 'object'
+LIST = 'list'
+
+Field = collections.namedtuple('Field', 'key name kind model optional')
+
+def field(key, name, kind=PLAIN, model=None, optional=False):
+    """
+    key: Key in the api dictionary.
+    name: Attribute name on the model.
+    kind: PLAIN, DATETIME (epoch millis), OBJECT or LIST of model.
+    model: Name of the model class for OBJECT and LIST fields.
+    optional: The api may leave the key out.
+    """
+    return Field(key, name, kind, model, optional)
+
+SUMMONER = (
+    field('id', 'id'),
+    field('name', 'name'),
+    field('profileIconId', 'profile_icon_id'),
+    field('revisionDate', 'revision_date', DATETIME),
+    field('summonerLevel', 'summoner_level'),
+)
+
+CHAMPION = (
+    field('active', 'active'),
+    field('attackRank', 'attack_rank'),
+    field('botEnabled', 'bot_enabled'),
+    field('botMmEnabled', 'bot_mm_enabled'),
+    field('defenseRank', 'defense_rank'),
+    field('difficultyRank', 'difficulty_rank'),
+    field('freeToPlay', 'free_to_play'),
+    field('id', 'id'),
+    field('magicRank', 'magic_rank'),
+    field('name', 'name'),
+    field('rankedPlayEnabled', 'ranked_play_enabled'),
+)
+
+GAME = (
+    field('championId', 'champion_id'),
+    field('createDate', 'create_date', DATETIME),
+    field('fellowPlayers', 'fellow_players', LIST, 'Player'),
+    field('gameId', 'game_id'),
+    field('gameMode', 'game_mode'),
+    field('gameType', 'game_type'),
+    field('invalid', 'invalid'),
+    field('level', 'level'),
+    field('mapId', 'map_id'),
+    field('spell1', 'spell1'),
+    field('spell2', 'spell2'),
+    field('statistics', 'statistics', LIST, 'RawStat'),
+    field('subType', 'sub_type'),
+    field('teamId', 'team_id'),
+)
+
+PLAYER = (
+    field('championId', 'champion_id'),
+    field('summonerId', 'summoner_id'),
+    field('teamId', 'team_id'),
+)
+
+RAW_STAT = (
+    field('id', 'id'),
+    field('name', 'name'),
+    field('value', 'value'),
+)
+
+# attributes attached by enrichment.enrich_games on top of the api fields
+GAME_NAMES = ('champion_name', 'spell1_name', 'spell2_name')
+PLAYER_NAMES = ('champion_name', 'summoner_name')
+RAW_STAT_NAMES = ('item_name',)
+
+LEAGUE = (
+    field('entries', 'entries', LIST, 'LeagueItem'),
+    field('name', 'name'),
+    field('queue', 'queue'),
+    field('tier', 'tier'),
+)
+
+LEAGUE_ITEM = (
+    field('isFreshBlood', 'is_fresh_blood'),
+    field('isHotStreak', 'is_hot_streak'),
+    field('isInactive', 'is_inactive'),
+    field('isVeteran', 'is_veteran'),
+    field('lastPlayed', 'last_played'),
+    field('leagueName', 'league_name'),
+    field('leaguePoints', 'league_points'),
+    field('miniSeries', 'mini_series', OBJECT, 'MiniSeries', optional=True),
+    field('playerOrTeamId', 'player_or_team_id'),
+    field('playerOrTeamName', 'player_or_team_name'),
+    field('queueType', 'queue_type'),
+    field('rank', 'rank'),
+    field('tier', 'tier'),
+    field('wins', 'wins'),
+)
+
+MINI_SERIES = (
+    field('losses', 'losses'),
+    field('progress', 'progress'),
+    field('target', 'target'),
+    field('timeLeftToPlayMillis', 'time_left_to_play_millis'),
+    field('wins', 'wins'),
+)
+
+PLAYER_STATS_SUMMARY = (
+    field('aggregatedStats', 'aggregated_stats', OBJECT, 'AggregatedStats'),
+    field('losses', 'losses'),
+    field('modifyDate', 'modify_date', DATETIME),
+    field('playerStatSummaryType', 'player_stat_summary_type'),
+    field('wins', 'wins'),
+)
+
+PLAYER_RANKED_STATS = (
+    field('champions', 'champions', LIST, 'ChampionStats'),
+    field('modifyDate', 'modify_date', DATETIME),
+    field('summonerId', 'summoner_id'),
+)
+
+CHAMPION_STATS = (
+    field('id', 'id'),
+    field('name', 'name'),
+    field('stats', 'stats', OBJECT, 'AggregatedStats'),
+)
+
+# every aggregated stat is optional, Dominion only stats are marked
+AGGREGATED_STATS = (
+    field('averageAssists', 'average_assists', optional=True),  # Dominion only
+    field('averageChampionsKilled', 'average_champions_killed', optional=True),  # Dominion only
+    field('averageCombatPlayerScore', 'average_combat_player_score', optional=True),  # Dominion only
+    field('averageNodeCapture', 'average_node_capture', optional=True),  # Dominion only
+    field('averageNodeCaptureAssist', 'average_node_capture_assist', optional=True),  # Dominion only
+    field('averageNodeNeutralize', 'average_node_neutralize', optional=True),  # Dominion only
+    field('averageNodeNeutralizeAssist', 'average_node_neutralize_assist', optional=True),  # Dominion only
+    field('averageNumDeaths', 'average_num_deaths', optional=True),  # Dominion only
+    field('averageObjectivePlayerScore', 'average_objective_player_score', optional=True),  # Dominion only
+    field('averageTeamObjective', 'average_team_objective', optional=True),  # Dominion only
+    field('averageTotalPlayerScore', 'average_total_player_score', optional=True),  # Dominion only
+    field('botGamesPlayed', 'bot_games_played', optional=True),
+    field('killingSpree', 'killing_spree', optional=True),
+    field('maxAssists', 'max_assists', optional=True),  # Dominion only
+    field('maxChampionsKilled', 'max_champions_killed', optional=True),
+    field('maxCombatPlayerScore', 'max_combat_player_score', optional=True),  # Dominion only
+    field('maxLargestCriticalStrike', 'max_largest_critical_strike', optional=True),
+    field('maxLargestKillingSpree', 'max_largest_killing_spree', optional=True),
+    field('maxNodeCapture', 'max_node_capture', optional=True),  # Dominion only
+    field('maxNodeCaptureAssist', 'max_node_capture_assist', optional=True),  # Dominion only
+    field('maxNodeNeutralize', 'max_node_neutralize', optional=True),  # Dominion only
+    field('maxNodeNeutralizeAssist', 'max_node_neutralize_assist', optional=True),  # Dominion only
+    field('maxObjectivePlayerScore', 'max_objective_player_score', optional=True),  # Dominion only
+    field('maxTeamObjective', 'max_team_objective', optional=True),  # Dominion only
+    field('maxTimePlayed', 'max_time_played', optional=True),
+    field('maxTimeSpentLiving', 'max_time_spent_living', optional=True),
+    field('maxTotalPlayerScore', 'max_total_player_score', optional=True),  # Dominion only
+    field('mostChampionKillsPerSession', 'most_champion_kills_per_session', optional=True),
+    field('mostSpellsCast', 'most_spells_cast', optional=True),
+    field('normalGamesPlayed', 'normal_games_played', optional=True),
+    field('rankedPremadeGamesPlayed', 'ranked_premade_games_played', optional=True),
+    field('rankedSoloGamesPlayed', 'ranked_solo_games_played', optional=True),
+    field('totalAssists', 'total_assists', optional=True),
+    field('totalChampionKills', 'total_champion_kills', optional=True),
+    field('totalDamageDealt', 'total_damage_dealt', optional=True),
+    field('totalDamageTaken', 'total_damage_taken', optional=True),
+    field('totalDoubleKills', 'total_double_kills', optional=True),
+    field('totalFirstBlood', 'total_first_blood', optional=True),
+    field('totalGoldEarned', 'total_gold_earned', optional=True),
+    field('totalHeal', 'total_heal', optional=True),
+    field('totalMagicDamageDealt', 'total_magic_damage_dealt', optional=True),
+    field('totalMinionKills', 'total_minion_kills', optional=True),
+    field('totalNeutralMinionsKilled', 'total_neutral_minions_killed', optional=True),
+    field('totalNodeCapture', 'total_node_capture', optional=True),  # Dominion only
+    field('totalNodeNeutralize', 'total_node_neutralize', optional=True),  # Dominion only
+    field('totalPentaKills', 'total_penta_kills', optional=True),
+    field('totalPhysicalDamageDealt', 'total_physical_damage_dealt', optional=True),
+    field('totalQuadraKills', 'total_quadra_kills', optional=True),
+    field('totalSessionsLost', 'total_sessions_lost', optional=True),
+    field('totalSessionsPlayed', 'total_sessions_played', optional=True),
+    field('totalSessionsWon', 'total_sessions_won', optional=True),
+    field('totalTripleKills', 'total_triple_kills', optional=True),
+    field('totalTurretsKilled', 'total_turrets_killed', optional=True),
+    field('totalUnrealKills', 'total_unreal_kills', optional=True),
+)
+
+MASTERY_PAGE = (
+    field('current', 'current'),
+    field('id', 'id'),
+    field('name', 'name'),
+    field('talents', 'talents', LIST, 'Talent', optional=True),
+)
+
+TALENT = (
+    field('id', 'id'),
+    field('name', 'name'),
+    field('rank', 'rank'),
+)
+
+RUNE_PAGE = (
+    field('current', 'current'),
+    field('id', 'id'),
+    field('name', 'name'),
+    field('slots', 'slots', LIST, 'RuneSlot', optional=True),
+)
+
+RUNE_SLOT = (
+    field('rune', 'rune', OBJECT, 'Rune'),
+    field('runeSlotId', 'id'),
+)
+
+RUNE = (
+    field('description', 'description'),
+    field('id', 'id'),
+    field('name', 'name'),
+    field('tier', 'tier'),
+)
+
+TEAM = (
+    field('createDate', 'create_date', DATETIME),
+    field('fullId', 'full_id'),
+    field('lastGameDate', 'last_game_date', DATETIME),
+    field('lastJoinDate', 'last_join_date', DATETIME),
+    field('lastJoinedRankedTeamQueueDate', 'last_joined_ranked_team_queue_date', DATETIME),
+    field('matchHistory', 'match_history', LIST, 'MatchHistorySummary'),
+    field('messageOfDay', 'message_of_day', OBJECT, 'MessageOfDay', optional=True),
+    field('modifyDate', 'modify_date', DATETIME),
+    field('name', 'name'),
+    field('roster', 'roster', OBJECT, 'Roster'),
+    field('secondLastJoinDate', 'second_last_join_date', DATETIME),
+    field('status', 'status'),
+    field('tag', 'tag'),
+    field('teamStatSummary', 'team_stat_summary', OBJECT, 'TeamStatSummary'),
+    field('thirdLastJoinDate', 'third_last_join_date', DATETIME),
+)
+
+MATCH_HISTORY_SUMMARY = (
+    field('assists', 'assists'),
+    field('deaths', 'deaths'),
+    field('gameId', 'game_id'),
+    field('gameMode', 'game_mode'),
+    field('invalid', 'invalid'),
+    field('kills', 'kills'),
+    field('mapId', 'map_id'),
+    field('opposingTeamKills', 'opposing_team_kills'),
+    field('opposingTeamName', 'opposing_team_name'),
+    field('win', 'win'),
+)
+
+MESSAGE_OF_DAY = (
+    field('createDate', 'create_date', DATETIME),
+    field('message', 'message'),
+    field('version', 'version'),
+)
+
+ROSTER = (
+    field('memberList', 'member_list', LIST, 'TeamMemberInfo'),
+    field('ownerId', 'owner_id'),
+)
+
+TEAM_STAT_SUMMARY = (
+    field('fullId', 'full_id'),
+    field('teamStatDetails', 'team_stat_details', LIST, 'TeamStatDetail'),
+)
+
+TEAM_MEMBER_INFO = (
+    field('inviteDate', 'invite_date', DATETIME),
+    field('joinDate', 'join_date', DATETIME),
+    field('playerId', 'player_id'),
+    field('status', 'status'),
+)
+
+TEAM_STAT_DETAIL = (
+    field('averageGamesPlayed', 'average_games_played'),
+    field('fullId', 'full_id'),
+    field('losses', 'losses'),
+    field('teamStatType', 'team_stat_type'),
+    field('wins', 'wins'),
+)
+
+# model class name to field table
+SCHEMAS = collections.OrderedDict([
+    ('Summoner', SUMMONER),
+    ('Champion', CHAMPION),
+    ('Game', GAME),
+    ('Player', PLAYER),
+    ('RawStat', RAW_STAT),
+    ('League', LEAGUE),
+    ('LeagueItem', LEAGUE_ITEM),
+    ('MiniSeries', MINI_SERIES),
+    ('PlayerStatsSummary', PLAYER_STATS_SUMMARY),
+    ('PlayerRankedStats', PLAYER_RANKED_STATS),
+    ('ChampionStats', CHAMPION_STATS),
+    ('AggregatedStats', AGGREGATED_STATS),
+    ('MasteryPage', MASTERY_PAGE),
+    ('Talent', TALENT),
+    ('RunePage', RUNE_PAGE),
+    ('RuneSlot', RUNE_SLOT),
+    ('Rune', RUNE),
+    ('Team', TEAM),
+    ('MatchHistorySummary', MATCH_HISTORY_SUMMARY),
+    ('MessageOfDay', MESSAGE_OF_DAY),
+    ('Roster', ROSTER),
+    ('TeamStatSummary', TEAM_STAT_SUMMARY),
+    ('TeamMemberInfo', TEAM_MEMBER_INFO),
+    ('TeamStatDetail', TEAM_STAT_DETAIL),
+])
+
+def _convert(field, value):
+    """
+    Source expression converting value for field.
+    """
+    if field.kind == DATETIME:
+        return 'utils.convert_epoch_millis_to_datetime({0})'.format(value)
+    if field.kind == OBJECT:
+        return '{0}._from_raw({1})'.format(field.model, value)
+    if field.kind == LIST:
+        return '[{0}._from_raw(item) for item in {1}]'.format(field.model, value)
+    return value
+
+def _body(fields, missing):
+    lines = []
+    for field in fields:
+        value = "kwargs['{0}']".format(field.key)
+        assignment = 'self.{0} = {1}'.format(field.name, _convert(field, value))
+
+        if missing is None and not field.optional:
+            lines.append(assignment)
+            continue
+
+        lines.append("if '{0}' in kwargs:".format(field.key))
+        lines.append('    ' + assignment)
+        if missing is not None:
+            lines.append('else:')
+            lines.append('    self.{0} = {1}'.format(field.name, missing))
+
+    return lines or ['pass']
+
+def constructor_source(fields, missing=None):
+    """
+    Source of a factory returning the (__init__, _from_raw) pair for fields.
+
+    missing: Name of a value assigned to fields absent from the api
+             dictionary, by default absent optional fields are left unset
+             and absent required fields raise KeyError.
+    """
+    body = _body(fields, missing)
+
+    lines = ['def _make():']
+    lines.append('    def __init__(self, **kwargs):')
+    lines.extend('        ' + line for line in body)
+    lines.append('    def _from_raw(cls, kwargs):')
+    lines.append('        self = cls.__new__(cls)')
+    lines.extend('        ' + line for line in body)
+    lines.append('        return self')
+    lines.append('    return __init__, classmethod(_from_raw)')
+
+    return '\n'.join(lines) + '\n'
+
+def constructors(fields, module_globals, missing=None):
+    """
+    Generates __init__(self, **kwargs) and the _from_raw(raw) classmethod
+    from a field table.
+
+    The code is compiled once, at class creation. Converters and nested model
+    classes are looked up in module_globals when an object is built, so
+    nested models may be defined later in the module. _from_raw builds an
+    object straight from an api dictionary without copying it into kwargs,
+    and is what nested fields use.
+    """
+    namespace = dict()
+    exec(compile(constructor_source(fields, missing), '<pyriot.schema>', 'exec'), module_globals, namespace)
+    return namespace['_make']()
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+
+import threading
+
+import requests
+from requests.adapters import HTTPAdapter
+
+DEFAULT_POOL_SIZE = 10
+
+class SessionPool(object):
+    """
+    One pooled requests.Session per region, shared by every endpoint call.
+
+    pool_size: Number of connections kept alive per region.
+    pool_block: When True pool_size is a hard limit and callers wait for a free
+                connection instead of opening extra, non-pooled ones.
+    keep_alive: When False every request asks the server to close the connection.
+    timeout: Default timeout in seconds passed to every request.
+    """
+    def __init__(self, pool_size=DEFAULT_POOL_SIZE, pool_block=False, keep_alive=True, timeout=None):
+        self.pool_size = pool_size
+        self.pool_block = pool_block
+        self.keep_alive = keep_alive
+        self.timeout = timeout
+
+        self._sessions = dict()
+        self._lock = threading.Lock()
+
+    def session(self, region):
+        """
+        Returns the session for region, creating it on first use.
+        """
+        session = self._sessions.get(region)
+        if session is not None:
+            return session
+
+        with self._lock:
+            session = self._sessions.get(region)
+            if session is None:
+                session = self._create_session()
+                self._sessions[region] = session
+
+        return session
+
+    def get(self, region, url, **kwargs):
+        """
+        Sends a GET request for url over the region's session.
+        """
+        kwargs.setdefault('timeout', self.timeout)
+        return self.session(region).get(url, **kwargs)
+
+    def close(self):
+        """
+        Closes every session and drops their pooled connections.
+        """
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+
+        for session in sessions:
+            session.close()
+
+    def _create_session(self):
+        session = requests.Session()
+
+        adapter = HTTPAdapter(
+                pool_connections=1,
+                pool_maxsize=self.pool_size,
+                pool_block=self.pool_block)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+
+        if not self.keep_alive:
+            session.headers['Connection'] = 'close'
+
+        return session
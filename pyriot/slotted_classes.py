@@ -0,0 +1,245 @@
+# -*- coding: utf-8 -*-
+
+"""
+Compact variants of the classes in api_classes, built on __slots__ so that
+instances carry no per-object dictionary. Use them with
+PyRiot(api_key, models=slotted_classes).
+
+Every attribute of the api_classes counterpart is always present. Fields the
+api did not return, such as the Dominion only AggregatedStats fields, hold
+the MISSING sentinel instead of being left unset.
+
+AggregatedStats, which is mostly integers, packs its values into one typed
+array instead of a slot and an int object per field. Values that do not fit
+the array, such as null or fractional averages, are kept as they are beside it.
+"""
+
+import array
+import numbers
+import sys
+
+from . import schema
+from . import utils
+from .utils import MISSING
+
+# array.typecodes is missing before Python 3.3, where 'q' is unavailable too
+_INT_TYPECODE = 'q' if 'q' in getattr(array, 'typecodes', '') else 'l'
+
+_INT_BITS = array.array(_INT_TYPECODE).itemsize * 8
+
+# stored in packed arrays in place of missing fields and of values kept aside
+_NULL = -2 ** (_INT_BITS - 1)
+_MAX = 2 ** (_INT_BITS - 1) - 1
+
+def _fits(value):
+    return isinstance(value, numbers.Integral) and _NULL < value <= _MAX
+
+def _pack(values):
+    """
+    Typed array of values, and None or a dictionary of index to the values
+    that do not fit the array.
+    """
+    try:
+        return array.array(_INT_TYPECODE, values), None
+    except (TypeError, OverflowError):
+        pass
+
+    extra = dict()
+    for index, value in enumerate(values):
+        if not _fits(value) and value != _NULL:
+            extra[index] = value
+            values[index] = _NULL
+    return array.array(_INT_TYPECODE, values), extra
+
+def _packed_property(index):
+    def get(self):
+        value = self._values[index]
+        if value == _NULL:
+            if self._extra is not None and index in self._extra:
+                return self._extra[index]
+            return MISSING
+        return value
+
+    return property(get)
+
+class _SlottedType(type):
+    """
+    Builds __slots__ and the constructors from the _schema field table, plus
+    a slot for every attribute in _names. Subclasses of _PackedModel get a
+    read only property per field instead.
+    """
+    def __new__(mcs, name, bases, namespace):
+        fields = namespace.get('_schema', ())
+        namespace['_fields'] = tuple(field.name for field in fields)
+
+        if '_packed' in namespace:
+            namespace['__slots__'] = ('_values', '_extra')
+        elif any(getattr(base, '_packed', False) for base in bases):
+            namespace['__slots__'] = ()
+            namespace['_keys'] = tuple(field.key for field in fields)
+            for index, field in enumerate(fields):
+                namespace[field.name] = _packed_property(index)
+        else:
+            namespace['__slots__'] = namespace['_fields'] + tuple(namespace.get('_names', ()))
+            if fields:
+                module_globals = sys.modules[namespace['__module__']].__dict__
+                namespace['__init__'], namespace['_from_raw'] = schema.constructors(
+                        fields, module_globals, missing='MISSING')
+
+        return type.__new__(mcs, name, bases, namespace)
+
+_SlottedBase = _SlottedType('_SlottedBase', (object,), {'__module__': __name__})
+
+class _SlottedModel(_SlottedBase):
+    # attributes added after construction, such as the names set by enrichment
+    _names = ()
+
+    def __getstate__(self):
+        # field values, then a dictionary of the _names attributes that are set
+        names = dict((name, getattr(self, name)) for name in self._names if hasattr(self, name))
+        return tuple(getattr(self, attribute) for attribute in self._fields) + (names,)
+
+    def __setstate__(self, state):
+        if len(state) > len(self._fields):
+            for name, value in state[-1].items():
+                setattr(self, name, value)
+        for attribute, value in zip(self._fields, state):
+            setattr(self, attribute, value)
+
+    def __object_string(self):
+        object_string = ''
+        for attribute in self._fields:
+            value = getattr(self, attribute)
+            if value is not MISSING:
+                object_string = object_string + '{0}: {1}\n'.format(attribute, value)
+
+        return object_string
+
+    def __repr__(self):
+        return self.__object_string()
+
+    def __str__(self):
+        return self.__object_string()
+
+    def __unicode__(self):
+        return self.__object_string()
+
+class _PackedModel(_SlottedModel):
+    _packed = True
+
+    def __init__(self, **kwargs):
+        self._values, self._extra = _pack([kwargs.get(key, _NULL) for key in self._keys])
+
+    @classmethod
+    def _from_raw(cls, raw):
+        self = cls.__new__(cls)
+        self._values, self._extra = _pack([raw.get(key, _NULL) for key in cls._keys])
+        return self
+
+    def __getstate__(self):
+        return self._values, self._extra
+
+    def __setstate__(self, state):
+        # a bare array was pickled before values could be kept aside
+        if isinstance(state, array.array):
+            state = state, None
+        self._values, self._extra = state
+
+
+class Summoner(_SlottedModel):
+    _schema = schema.SUMMONER
+
+
+class Champion(_SlottedModel):
+    _schema = schema.CHAMPION
+
+
+class Game(_SlottedModel):
+    _schema = schema.GAME
+    _names = schema.GAME_NAMES
+
+
+class Player(_SlottedModel):
+    _schema = schema.PLAYER
+    _names = schema.PLAYER_NAMES
+
+
+class RawStat(_SlottedModel):
+    _schema = schema.RAW_STAT
+    _names = schema.RAW_STAT_NAMES
+
+
+class League(_SlottedModel):
+    _schema = schema.LEAGUE
+
+
+class LeagueItem(_SlottedModel):
+    _schema = schema.LEAGUE_ITEM
+
+
+class MiniSeries(_SlottedModel):
+    _schema = schema.MINI_SERIES
+
+
+class PlayerStatsSummary(_SlottedModel):
+    _schema = schema.PLAYER_STATS_SUMMARY
+
+
+class PlayerRankedStats(_SlottedModel):
+    _schema = schema.PLAYER_RANKED_STATS
+
+
+class ChampionStats(_SlottedModel):
+    _schema = schema.CHAMPION_STATS
+
+
+class AggregatedStats(_PackedModel):
+    _schema = schema.AGGREGATED_STATS
+
+
+class MasteryPage(_SlottedModel):
+    _schema = schema.MASTERY_PAGE
+
+
+class Talent(_SlottedModel):
+    _schema = schema.TALENT
+
+
+class RunePage(_SlottedModel):
+    _schema = schema.RUNE_PAGE
+
+
+class RuneSlot(_SlottedModel):
+    _schema = schema.RUNE_SLOT
+
+
+class Rune(_SlottedModel):
+    _schema = schema.RUNE
+
+
+class Team(_SlottedModel):
+    _schema = schema.TEAM
+
+
+class MatchHistorySummary(_SlottedModel):
+    _schema = schema.MATCH_HISTORY_SUMMARY
+
+
+class MessageOfDay(_SlottedModel):
+    _schema = schema.MESSAGE_OF_DAY
+
+
+class Roster(_SlottedModel):
+    _schema = schema.ROSTER
+
+
+class TeamStatSummary(_SlottedModel):
+    _schema = schema.TEAM_STAT_SUMMARY
+
+
+class TeamMemberInfo(_SlottedModel):
+    _schema = schema.TEAM_MEMBER_INFO
+
+
+class TeamStatDetail(_SlottedModel):
+    _schema = schema.TEAM_STAT_DETAIL
@@ -0,0 +1,249 @@
+# -*- coding: utf-8 -*-
+
+"""
+Static game data (champions, items, runes, masteries and summoner spells)
+downloaded once per data version and looked up locally by id or name.
+
+    static = StaticData(priot, NORTH_AMERICA, directory='/var/cache/pyriot')
+    static.champion(game.champion_id)['name']
+    static.summoner_spell(game.spell1)['name']
+    static.rune(rune.id)
+    static.mastery(talent.id)
+
+Each version is kept as a snapshot file in directory, so later processes
+load it from disk. Only the list of versions is requested to find out
+whether a newer one was released.
+"""
+
+import collections
+import gzip
+import json
+import os
+import re
+import threading
+
+from .wrapper import NORTH_AMERICA, STATIC_VERSION
+
+# dataset name to static data api path
+DATASETS = collections.OrderedDict([
+    ('champions', 'champion'),
+    ('items', 'item'),
+    ('runes', 'rune'),
+    ('masteries', 'mastery'),
+    ('summoner_spells', 'summoner-spell'),
+])
+
+# datasets keyed on name unless asked to key on id
+_BY_ID_DATASETS = ('champions', 'summoner_spells')
+
+def _version_key(version):
+    return tuple(int(part) if part.isdigit() else part for part in re.split(r'[.-]', version))
+
+class StaticData(object):
+    """
+    priot: PyRiot client used for downloads.
+    region: Region whose static data is used.
+    directory: Directory keeping a snapshot file per region, locale and version. None keeps data in memory only.
+    locale: Optional locale of names and descriptions, such as 'en_US'.
+    version: Data version to use, by default the latest one.
+
+    Data is loaded on the first lookup. Entries are the dictionaries returned
+    by the static data api.
+    """
+    def __init__(self, priot, region=NORTH_AMERICA, directory=None, locale=None, version=None):
+        self.priot = priot
+        self.region = region
+        self.directory = directory
+        self.locale = locale
+        self.pinned_version = version
+        self.version = None
+
+        self._by_id = None
+        self._by_name = None
+        self._lock = threading.RLock()
+
+    def _url(self, path, **params):
+        params['api_key'] = self.priot.api_key
+        if self.locale:
+            params['locale'] = self.locale
+        query = '&'.join('{0}={1}'.format(key, params[key]) for key in sorted(params))
+
+        return '{0}/static-data/{1}/{2}/{3}?{4}'.format(
+                self.priot.base_url,
+                self.region,
+                STATIC_VERSION,
+                path,
+                query)
+
+    def versions(self):
+        """
+        Released data versions, newest first.
+
+        throws HTTPError
+        """
+        return self.priot.request('static_versions', self.region, self._url('versions'))
+
+    def latest_version(self):
+        return self.versions()[0]
+
+    def download(self, version):
+        """
+        Fetches every dataset of version.
+
+        returns dictionary of dataset name to the data dictionary of the api response
+
+        throws HTTPError
+        """
+        snapshot = dict()
+        for name, path in DATASETS.items():
+            params = dict(version=version)
+            if name in _BY_ID_DATASETS:
+                params['dataById'] = 'true'
+            content = self.priot.request('static_' + name, self.region, self._url(path, **params))
+            snapshot[name] = content['data']
+
+        return snapshot
+
+    def _snapshot_path(self, version):
+        name = 'static-{0}-{1}-{2}.json.gz'.format(self.region, self.locale or 'default', version)
+        return os.path.join(self.directory, name)
+
+    def snapshot_versions(self):
+        """
+        Versions with a snapshot in directory, newest first.
+        """
+        if self.directory is None or not os.path.isdir(self.directory):
+            return []
+
+        prefix = 'static-{0}-{1}-'.format(self.region, self.locale or 'default')
+        versions = []
+        for name in os.listdir(self.directory):
+            if name.startswith(prefix) and name.endswith('.json.gz'):
+                versions.append(name[len(prefix):-len('.json.gz')])
+
+        return sorted(versions, key=_version_key, reverse=True)
+
+    def _read_snapshot(self, version):
+        if self.directory is None:
+            return None
+
+        path = self._snapshot_path(version)
+        if not os.path.exists(path):
+            return None
+
+        with gzip.open(path, 'rb') as snapshot:
+            return json.loads(snapshot.read().decode('utf-8'))
+
+    def _write_snapshot(self, version, snapshot):
+        if self.directory is None:
+            return
+
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+
+        # write aside and rename, so readers never see a partial file
+        path = self._snapshot_path(version)
+        temporary = '{0}.{1}.tmp'.format(path, os.getpid())
+        with gzip.open(temporary, 'wb') as output:
+            output.write(json.dumps(snapshot).encode('utf-8'))
+        os.rename(temporary, path)
+
+    def load(self, version=None, offline=False):
+        """
+        Loads version, from its snapshot when there is one and downloading
+        it otherwise. Without version the pinned version is loaded, or else
+        the latest released one.
+
+        offline: Load the newest snapshot in directory without any request,
+                 falling back to the api when there is none.
+
+        throws HTTPError
+        """
+        with self._lock:
+            if version is None:
+                version = self.pinned_version
+            if version is None and offline:
+                snapshots = self.snapshot_versions()
+                if snapshots:
+                    version = snapshots[0]
+            if version is None:
+                version = self.latest_version()
+
+            snapshot = self._read_snapshot(version)
+            if snapshot is None:
+                snapshot = self.download(version)
+                self._write_snapshot(version, snapshot)
+
+            by_id = dict()
+            by_name = dict()
+            for name in DATASETS:
+                entries = snapshot.get(name, dict()).values()
+                by_id[name] = dict((entry['id'], entry) for entry in entries if 'id' in entry)
+                by_name[name] = dict((entry['name'].lower(), entry) for entry in entries if 'name' in entry)
+
+            self._by_id = by_id
+            self._by_name = by_name
+            self.version = version
+
+    def refresh(self):
+        """
+        Loads the latest version when a newer one was released.
+
+        returns True when a new version was loaded
+        """
+        latest = self.latest_version()
+        if latest == self.version:
+            return False
+
+        self.load(latest)
+        return True
+
+    def _indexes(self):
+        if self._by_id is None:
+            with self._lock:
+                # another thread may have loaded while this one waited
+                if self._by_id is None:
+                    self.load(offline=True)
+        return self._by_id, self._by_name
+
+    def get(self, dataset, entry_id):
+        """
+        Entry of dataset with entry_id, or None.
+        """
+        return self._indexes()[0][dataset].get(int(entry_id))
+
+    def by_name(self, dataset, name):
+        """
+        Entry of dataset named name, ignoring case, or None.
+        """
+        return self._indexes()[1][dataset].get(name.lower())
+
+    def champion(self, champion_id):
+        return self.get('champions', champion_id)
+
+    def champion_by_name(self, name):
+        return self.by_name('champions', name)
+
+    def item(self, item_id):
+        return self.get('items', item_id)
+
+    def item_by_name(self, name):
+        return self.by_name('items', name)
+
+    def rune(self, rune_id):
+        return self.get('runes', rune_id)
+
+    def rune_by_name(self, name):
+        return self.by_name('runes', name)
+
+    def mastery(self, mastery_id):
+        return self.get('masteries', mastery_id)
+
+    def mastery_by_name(self, name):
+        return self.by_name('masteries', name)
+
+    def summoner_spell(self, spell_id):
+        return self.get('summoner_spells', spell_id)
+
+    def summoner_spell_by_name(self, name):
+        return self.by_name('summoner_spells', name)
@@ -0,0 +1,301 @@
+# -*- coding: utf-8 -*-
+
+"""
+Incremental syncing of tracked summoners.
+
+A summoner's revisionDate changes whenever anything about the summoner
+changes, such as a finished game. Revision dates are checked in bulk, 40
+summoners to a request, and only summoners whose revision date moved since
+the previous sync are fetched again.
+
+    games_sync = RecentGamesSync(priot, store=SQLiteStore('/var/lib/pyriot/sync.db'))
+    for summoner_id, games in games_sync.sync(NORTH_AMERICA, tracked_ids).items():
+        store_games(summoner_id, games)
+
+    fetcher = ConditionalFetcher(priot, store=SQLiteStore('/var/lib/pyriot/snapshots.db'))
+    for summoner_id, results in fetcher.fetch(NORTH_AMERICA, tracked_ids).items():
+        store_stats(summoner_id, results['stats_summary'], results['stats_ranked'])
+
+Revision dates, and the results of summoners whose revision date changed,
+are always requested fresh, past any ResponseCache of the client.
+"""
+
+import collections
+import pickle
+import sqlite3
+import threading
+
+import requests
+
+from . import executor
+from . import utils
+from .cache import _SQLiteDatabase
+from .wrapper import RAW_JSON
+
+# pickle protocol readable by Python 2 and 3
+_PICKLE_PROTOCOL = 2
+
+# wrapper functions ConditionalFetcher serves from snapshots
+CONDITIONAL_ENDPOINTS = ('stats_summary', 'stats_ranked', 'summoner_runes', 'summoner_masteries', 'teams')
+
+GameSyncState = collections.namedtuple('GameSyncState', 'revision_date game_id create_date')
+
+Snapshot = collections.namedtuple('Snapshot', 'revision_date result')
+
+def revision_dates(priot, region, summoner_ids):
+    """
+    Revision dates of summoner_ids, requested SUMMONER_CHUNK_SIZE at a time
+    without using the client's response cache.
+
+    returns dictionary of summoner ids to revision dates as epoch milliseconds,
+    summoners that do not exist are left out
+
+    throws HTTPError
+    """
+    summoners = priot.summoners_by_ids(region, summoner_ids, raw=RAW_JSON, fresh=True)
+    return dict((summoner['id'], summoner['revisionDate']) for summoner in summoners.values())
+
+class MemoryStore(object):
+    """
+    Sync state kept in process memory.
+    """
+    def __init__(self):
+        self._values = dict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            return self._values.get(key)
+
+    def set(self, key, value):
+        with self._lock:
+            self._values[key] = value
+
+    def delete(self, key):
+        with self._lock:
+            self._values.pop(key, None)
+
+    def __len__(self):
+        return len(self._values)
+
+class SQLiteStore(_SQLiteDatabase):
+    """
+    Sync state kept in a SQLite database across restarts. Values are pickled.
+
+    path: Database file, created if missing.
+    timeout: Seconds to wait for another process holding the database lock.
+    """
+    def __init__(self, path, timeout=30):
+        _SQLiteDatabase.__init__(self, path, timeout)
+
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                    'CREATE TABLE IF NOT EXISTS sync_state ('
+                    'key TEXT PRIMARY KEY, '
+                    'value BLOB NOT NULL)')
+
+    def _key(self, key):
+        return '/'.join('{0}'.format(part) for part in key)
+
+    def get(self, key):
+        row = self._connection().execute(
+                'SELECT value FROM sync_state WHERE key = ?', (self._key(key),)).fetchone()
+        if row is None:
+            return None
+
+        return pickle.loads(bytes(row[0]))
+
+    def set(self, key, value):
+        connection = self._connection()
+        with connection:
+            connection.execute(
+                    'INSERT OR REPLACE INTO sync_state (key, value) VALUES (?, ?)',
+                    (self._key(key), sqlite3.Binary(pickle.dumps(value, _PICKLE_PROTOCOL))))
+
+    def delete(self, key):
+        connection = self._connection()
+        with connection:
+            connection.execute('DELETE FROM sync_state WHERE key = ?', (self._key(key),))
+
+    def __len__(self):
+        return self._connection().execute('SELECT COUNT(*) FROM sync_state').fetchone()[0]
+
+def _fetch_or_none(function, region, summoner_id):
+    # the api answers 404 for summoners without games, stats, pages or teams.
+    # the summoner changed, so a cached response would be out of date
+    try:
+        return function(region, summoner_id, raw=False, fresh=True)
+    except requests.HTTPError as error:
+        if error.response is not None and error.response.status_code == 404:
+            return None
+        raise
+
+def _is_new(game, state):
+    if state is None:
+        return True
+    if state.game_id is not None and game.game_id > state.game_id:
+        return True
+    return state.create_date is not None and game.create_date > state.create_date
+
+class RecentGamesSync(object):
+    """
+    Returns the recent games of tracked summoners that are new since the
+    previous sync. Remembers the highest gameId and createDate seen and the
+    revision date of every summoner, and skips the recent_games call for
+    summoners whose revision date did not change.
+
+    priot: PyRiot client.
+    store: MemoryStore, SQLiteStore or any object with get(key) and set(key, value).
+
+    checked counts the summoners whose revision date was checked, fetched
+    those whose recent games were requested.
+    """
+    def __init__(self, priot, store=None):
+        self.priot = priot
+        self.store = store if store is not None else MemoryStore()
+        self.checked = 0
+        self.fetched = 0
+
+    def state(self, region, summoner_id):
+        """
+        GameSyncState(revision_date, game_id, create_date) of a summoner, or None before its first sync.
+        """
+        return self.store.get(('recent_games', region, int(summoner_id)))
+
+    def reset(self, region, summoner_id):
+        """
+        Forgets a summoner, so the next sync returns all its recent games.
+        """
+        self.store.delete(('recent_games', region, int(summoner_id)))
+
+    def sync(self, region, summoner_ids):
+        """
+        Recent games of summoner_ids played since the previous sync.
+
+        returns dictionary of summoner ids to lists of new games, summoners
+        without new games are left out
+
+        throws HTTPError, in which case no summoner's state is updated, so
+        the next sync returns their new games again
+        """
+        summoner_ids = utils.unique(int(summoner_id) for summoner_id in summoner_ids)
+        dates = revision_dates(self.priot, region, summoner_ids)
+        self.checked += len(summoner_ids)
+
+        changed = []
+        for summoner_id in summoner_ids:
+            if summoner_id not in dates:
+                continue
+
+            state = self.state(region, summoner_id)
+            if state is None or state.revision_date != dates[summoner_id]:
+                changed.append((summoner_id, state))
+
+        def fetch(item):
+            summoner_id, state = item
+            return self._sync_summoner(region, summoner_id, state, dates[summoner_id])
+
+        # states are only saved once every summoner was fetched, or games
+        # of the others would be lost when one of them fails
+        synced = self.priot.map(fetch, changed)
+        self.fetched += len(changed)
+
+        games = dict()
+        for (summoner_id, _), (new_games, state) in zip(changed, synced):
+            self.store.set(('recent_games', region, summoner_id), state)
+            if new_games:
+                games[summoner_id] = new_games
+
+        return games
+
+    def _sync_summoner(self, region, summoner_id, state, revision_date):
+        """
+        New games of a summoner and its GameSyncState after them.
+        """
+        games = _fetch_or_none(self.priot.recent_games, region, summoner_id) or []
+
+        new_games = [game for game in games if _is_new(game, state)]
+
+        game_id = state.game_id if state is not None else None
+        create_date = state.create_date if state is not None else None
+        for game in new_games:
+            if game_id is None or game.game_id > game_id:
+                game_id = game.game_id
+            if create_date is None or game.create_date > create_date:
+                create_date = game.create_date
+
+        return new_games, GameSyncState(revision_date, game_id, create_date)
+
+class ConditionalFetcher(object):
+    """
+    Calls per summoner wrapper functions only for summoners whose revision
+    date changed since the previous fetch, serving the others from the
+    snapshot stored back then.
+
+    priot: PyRiot client.
+    store: MemoryStore, SQLiteStore or any object with get(key) and set(key, value).
+           Snapshots hold the returned objects, pickled by SQLiteStore.
+    endpoints: Wrapper functions taking (region, summoner_id) fetched by default.
+
+    fetched and served count, per wrapper function, the results requested
+    from the api and those served from snapshots.
+    """
+    def __init__(self, priot, store=None, endpoints=CONDITIONAL_ENDPOINTS):
+        self.priot = priot
+        self.store = store if store is not None else MemoryStore()
+        self.endpoints = tuple(endpoints)
+
+        self.fetched = collections.Counter()
+        self.served = collections.Counter()
+
+    def snapshot(self, region, summoner_id, endpoint):
+        """
+        Snapshot(revision_date, result) of a wrapper function for a summoner, or None.
+        """
+        return self.store.get(('snapshot', endpoint, region, int(summoner_id)))
+
+    def fetch(self, region, summoner_ids, endpoints=None):
+        """
+        Results of endpoints for summoner_ids, requested from the api only
+        where the summoner's revision date changed or there is no snapshot.
+
+        returns dictionary of summoner ids to dictionaries of wrapper function
+        names to results, None where the api answered 404. Summoners that do
+        not exist are left out.
+
+        throws HTTPError, ValueError for unknown wrapper functions
+        """
+        endpoints = self.endpoints if endpoints is None else tuple(endpoints)
+        for endpoint in endpoints:
+            executor.wrapper_function(self.priot, endpoint)
+
+        summoner_ids = utils.unique(int(summoner_id) for summoner_id in summoner_ids)
+        dates = revision_dates(self.priot, region, summoner_ids)
+
+        results = dict()
+        stale = []
+        for summoner_id in summoner_ids:
+            if summoner_id not in dates:
+                continue
+
+            results[summoner_id] = dict()
+            for endpoint in endpoints:
+                snapshot = self.snapshot(region, summoner_id, endpoint)
+                if snapshot is not None and snapshot.revision_date == dates[summoner_id]:
+                    results[summoner_id][endpoint] = snapshot.result
+                    self.served[endpoint] += 1
+                else:
+                    stale.append((summoner_id, endpoint))
+
+        def fetch(item):
+            summoner_id, endpoint = item
+            result = _fetch_or_none(getattr(self.priot, endpoint), region, summoner_id)
+            self.store.set(('snapshot', endpoint, region, summoner_id), Snapshot(dates[summoner_id], result))
+            return result
+
+        for (summoner_id, endpoint), result in zip(stale, self.priot.map(fetch, stale)):
+            results[summoner_id][endpoint] = result
+            self.fetched[endpoint] += 1
+
+        return results
@@ -0,0 +1,514 @@
+# -*- coding: utf-8 -*-
+
+"""
+Local stand-in for the Riot API, for exercising PyRiot and AsyncPyRiot
+without a key or network access.
+
+    with FakeRiotServer() as server:
+        priot = PyRiot('key', base_url=server.base_url)
+        priot.summoner_get_by_id(NORTH_AMERICA, 24915110)
+
+FakeTransport answers the same way in memory, without sockets or threads:
+
+    priot = PyRiot('key', rate_limits=(), transport=FakeTransport())
+
+Every endpoint answers with a payload generated from the ids in the url, so
+any summoner id or name resolves.
+"""
+
+import json
+import random
+import re
+import threading
+import time
+import zlib
+
+try:
+    from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+    from SocketServer import ThreadingMixIn
+    from urllib import unquote
+except ImportError:
+    from http.server import BaseHTTPRequestHandler, HTTPServer
+    from socketserver import ThreadingMixIn
+    from urllib.parse import unquote
+
+from .transport import build_response, request_key
+
+REVISION_DATE = 1387485731000
+
+def summoner_id_for_name(name):
+    """
+    Deterministic summoner id for a summoner name.
+    """
+    return zlib.crc32(name.lower().encode('utf-8')) & 0x7fffffff
+
+def summoner_payload(summoner_id, name=None):
+    return {
+        'id': summoner_id,
+        'name': name or 'summoner{0}'.format(summoner_id),
+        'profileIconId': summoner_id % 600,
+        'revisionDate': REVISION_DATE,
+        'summonerLevel': 30,
+    }
+
+def champion_payload(champion_id, free_to_play=False):
+    return {
+        'active': True,
+        'attackRank': champion_id % 10,
+        'botEnabled': False,
+        'botMmEnabled': False,
+        'defenseRank': champion_id % 7,
+        'difficultyRank': champion_id % 5,
+        'freeToPlay': free_to_play,
+        'id': champion_id,
+        'magicRank': champion_id % 3,
+        'name': 'Champion{0}'.format(champion_id),
+        'rankedPlayEnabled': True,
+    }
+
+def champions_payload(free_to_play=False, count=120):
+    champions = []
+    for champion_id in range(1, count + 1):
+        ftp = champion_id % 12 == 0
+        if free_to_play and not ftp:
+            continue
+        champions.append(champion_payload(champion_id, ftp))
+
+    return {'champions': champions}
+
+def game_payload(summoner_id, game_id):
+    fellow_players = []
+    for index in range(9):
+        fellow_players.append({
+            'championId': (game_id + index) % 120 + 1,
+            'summonerId': summoner_id + index + 1,
+            'teamId': 100 if index < 4 else 200,
+        })
+
+    statistics = []
+    for stat_id, name in enumerate(('CHAMPIONS_KILLED', 'NUM_DEATHS', 'ASSISTS', 'GOLD_EARNED', 'WIN')):
+        statistics.append({'id': stat_id + 1, 'name': name, 'value': (game_id * (stat_id + 3)) % 17})
+    for slot in range(2):
+        statistics.append({'id': 6 + slot, 'name': 'ITEM{0}'.format(slot), 'value': 1001 + (game_id + slot) % 50})
+
+    return {
+        'championId': game_id % 120 + 1,
+        'createDate': REVISION_DATE - (summoner_id + game_id) % 1000 * 60000,
+        'fellowPlayers': fellow_players,
+        'gameId': game_id,
+        'gameMode': 'CLASSIC',
+        'gameType': 'MATCHED_GAME',
+        'invalid': False,
+        'level': 30,
+        'mapId': 1,
+        'spell1': 4,
+        'spell2': 14,
+        'statistics': statistics,
+        'subType': 'RANKED_SOLO_5x5',
+        'teamId': 100,
+    }
+
+def recent_games_payload(summoner_id):
+    games = []
+    for index in range(10):
+        games.append(game_payload(summoner_id, summoner_id * 10 + index))
+
+    return {'games': games, 'summonerId': summoner_id}
+
+def league_item_payload(player_id, league_points):
+    return {
+        'isFreshBlood': False,
+        'isHotStreak': league_points % 2 == 0,
+        'isInactive': False,
+        'isVeteran': True,
+        'lastPlayed': 0,
+        'leagueName': 'Fake League',
+        'leaguePoints': league_points,
+        'playerOrTeamId': '{0}'.format(player_id),
+        'playerOrTeamName': 'summoner{0}'.format(player_id),
+        'queueType': 'RANKED_SOLO_5x5',
+        'rank': 'I',
+        'tier': 'GOLD',
+        'wins': league_points % 50,
+    }
+
+def leagues_payload(summoner_id, size=50):
+    entries = []
+    for index in range(size):
+        entries.append(league_item_payload(summoner_id + index, (summoner_id + index) % 100))
+    entries[0]['miniSeries'] = {
+        'losses': 1,
+        'progress': ['W', 'L', 'N'],
+        'target': 2,
+        'timeLeftToPlayMillis': 0,
+        'wins': 1,
+    }
+
+    return {
+        '{0}'.format(summoner_id): {
+            'entries': entries,
+            'name': 'Fake League',
+            'queue': 'RANKED_SOLO_5x5',
+            'tier': 'GOLD',
+        }
+    }
+
+AGGREGATED_STATS_KEYS = (
+    'botGamesPlayed', 'killingSpree', 'maxChampionsKilled', 'maxLargestCriticalStrike',
+    'maxLargestKillingSpree', 'maxTimePlayed', 'maxTimeSpentLiving', 'mostChampionKillsPerSession',
+    'mostSpellsCast', 'normalGamesPlayed', 'rankedPremadeGamesPlayed', 'rankedSoloGamesPlayed',
+    'totalAssists', 'totalChampionKills', 'totalDamageDealt', 'totalDamageTaken',
+    'totalDoubleKills', 'totalFirstBlood', 'totalGoldEarned', 'totalHeal',
+    'totalMagicDamageDealt', 'totalMinionKills', 'totalNeutralMinionsKilled', 'totalPentaKills',
+    'totalPhysicalDamageDealt', 'totalQuadraKills', 'totalSessionsLost', 'totalSessionsPlayed',
+    'totalSessionsWon', 'totalTripleKills', 'totalTurretsKilled', 'totalUnrealKills',
+)
+
+def aggregated_stats_payload(seed):
+    stats = dict()
+    for index, key in enumerate(AGGREGATED_STATS_KEYS):
+        stats[key] = (seed * (index + 7)) % 5000
+
+    return stats
+
+def stats_summary_payload(summoner_id):
+    summaries = []
+    for index, summary_type in enumerate(('Unranked', 'RankedSolo5x5', 'AramUnranked5x5', 'CoopVsAI')):
+        summaries.append({
+            'aggregatedStats': aggregated_stats_payload(summoner_id + index),
+            'losses': index * 3,
+            'modifyDate': REVISION_DATE,
+            'playerStatSummaryType': summary_type,
+            'wins': index * 5,
+        })
+
+    return {'playerStatSummaries': summaries, 'summonerId': summoner_id}
+
+def stats_ranked_payload(summoner_id, champion_count=40):
+    champions = []
+    for champion_id in range(1, champion_count + 1):
+        champions.append({
+            'id': champion_id,
+            'name': 'Champion{0}'.format(champion_id),
+            'stats': aggregated_stats_payload(summoner_id + champion_id),
+        })
+
+    return {'champions': champions, 'modifyDate': REVISION_DATE, 'summonerId': summoner_id}
+
+def masteries_payload(summoner_id):
+    pages = []
+    for index in range(3):
+        talents = []
+        for talent_id in range(4100, 4130, 3):
+            talents.append({'id': talent_id, 'name': 'Talent{0}'.format(talent_id), 'rank': 1})
+        pages.append({'current': index == 0, 'id': summoner_id * 10 + index, 'name': 'Page {0}'.format(index), 'talents': talents})
+
+    return {'pages': pages, 'summonerId': summoner_id}
+
+def runes_payload(summoner_id):
+    pages = []
+    for index in range(3):
+        slots = []
+        for slot_id in range(1, 31):
+            rune_id = 5000 + slot_id % 4
+            slots.append({
+                'rune': {'description': 'Rune {0}'.format(rune_id), 'id': rune_id, 'name': 'Rune{0}'.format(rune_id), 'tier': 3},
+                'runeSlotId': slot_id,
+            })
+        pages.append({'current': index == 0, 'id': summoner_id * 10 + index, 'name': 'Page {0}'.format(index), 'slots': slots})
+
+    return {'pages': pages, 'summonerId': summoner_id}
+
+def teams_payload(summoner_id, count=2):
+    teams = []
+    for index in range(count):
+        full_id = 'TEAM-{0}-{1}'.format(summoner_id, index)
+        teams.append({
+            'createDate': REVISION_DATE,
+            'fullId': full_id,
+            'lastGameDate': REVISION_DATE,
+            'lastJoinDate': REVISION_DATE,
+            'lastJoinedRankedTeamQueueDate': REVISION_DATE,
+            'matchHistory': [{
+                'assists': 10, 'deaths': 5, 'gameId': summoner_id * 100 + game, 'gameMode': 'CLASSIC',
+                'invalid': False, 'kills': 20, 'mapId': 1, 'opposingTeamKills': 15,
+                'opposingTeamName': 'Opponents', 'win': game % 2 == 0,
+            } for game in range(10)],
+            'messageOfDay': {'createDate': REVISION_DATE, 'message': 'gl hf', 'version': 1},
+            'modifyDate': REVISION_DATE,
+            'name': 'Team {0}'.format(index),
+            'roster': {
+                'memberList': [{
+                    'inviteDate': REVISION_DATE, 'joinDate': REVISION_DATE,
+                    'playerId': summoner_id + member, 'status': 'MEMBER',
+                } for member in range(5)],
+                'ownerId': summoner_id,
+            },
+            'secondLastJoinDate': REVISION_DATE,
+            'status': 'ACTIVE',
+            'tag': 'T{0}'.format(index),
+            'teamStatSummary': {
+                'fullId': full_id,
+                'teamStatDetails': [{
+                    'averageGamesPlayed': 0, 'fullId': full_id, 'losses': 3,
+                    'teamStatType': stat_type, 'wins': 7,
+                } for stat_type in ('RANKED_TEAM_3x3', 'RANKED_TEAM_5x5')],
+            },
+            'thirdLastJoinDate': REVISION_DATE,
+        })
+
+    return teams
+
+STATIC_DATA_VERSION = '4.4.3'
+
+SUMMONER_SPELLS = (
+    (1, 'Cleanse'), (2, 'Clairvoyance'), (3, 'Exhaust'), (4, 'Flash'), (6, 'Ghost'), (7, 'Heal'),
+    (11, 'Smite'), (12, 'Teleport'), (13, 'Clarity'), (14, 'Ignite'), (21, 'Barrier'),
+)
+
+def static_versions_payload():
+    return [STATIC_DATA_VERSION, '4.4.2', '4.3.18']
+
+def _static_payload(data_type, entries, version):
+    return {
+        'data': dict(('{0}'.format(entry['id']), entry) for entry in entries),
+        'type': data_type,
+        'version': version,
+    }
+
+def static_champions_payload(version=STATIC_DATA_VERSION):
+    return _static_payload('champion', [{
+        'id': champion_id,
+        'key': 'Champion{0}'.format(champion_id),
+        'name': 'Champion{0}'.format(champion_id),
+        'title': 'the Fake',
+    } for champion_id in range(1, 121)], version)
+
+def static_items_payload(version=STATIC_DATA_VERSION):
+    return _static_payload('item', [{
+        'description': 'Item {0}'.format(item_id),
+        'id': item_id,
+        'name': 'Item{0}'.format(item_id),
+        'plaintext': 'Fake item',
+    } for item_id in range(1001, 1051)], version)
+
+def static_runes_payload(version=STATIC_DATA_VERSION):
+    return _static_payload('rune', [{
+        'description': 'Rune {0}'.format(rune_id),
+        'id': rune_id,
+        'name': 'Rune{0}'.format(rune_id),
+        'rune': {'isrune': True, 'tier': '3', 'type': 'red'},
+    } for rune_id in range(5000, 5040)], version)
+
+def static_masteries_payload(version=STATIC_DATA_VERSION):
+    return _static_payload('mastery', [{
+        'description': ['Talent {0}'.format(talent_id)],
+        'id': talent_id,
+        'name': 'Talent{0}'.format(talent_id),
+    } for talent_id in range(4100, 4130)], version)
+
+def static_summoner_spells_payload(version=STATIC_DATA_VERSION):
+    return _static_payload('summoner', [{
+        'description': name,
+        'id': spell_id,
+        'key': 'Summoner{0}'.format(name),
+        'name': name,
+        'summonerLevel': 1,
+    } for spell_id, name in SUMMONER_SPELLS], version)
+
+def _ids(match):
+    return [int(summoner_id) for summoner_id in match.group('ids').split(',') if summoner_id]
+
+def _summoners_by_id(match, query):
+    summoners = dict()
+    for summoner_id in _ids(match):
+        summoners['{0}'.format(summoner_id)] = summoner_payload(summoner_id)
+    return summoners
+
+def _summoners_by_name(match, query):
+    summoners = dict()
+    for name in unquote(match.group('names')).split(','):
+        if name:
+            summoners[name] = summoner_payload(summoner_id_for_name(name), name)
+    return summoners
+
+def _summoner_names(match, query):
+    return {'summoners': [{'id': summoner_id, 'name': 'summoner{0}'.format(summoner_id)} for summoner_id in _ids(match)]}
+
+def _summoner_id(match):
+    return int(match.group('id'))
+
+ROUTES = [
+    (r'/static-data/\w+/v[\d.]+/versions$', lambda match, query: static_versions_payload()),
+    (r'/static-data/\w+/v[\d.]+/champion$', lambda match, query: static_champions_payload(query.get('version', STATIC_DATA_VERSION))),
+    (r'/static-data/\w+/v[\d.]+/item$', lambda match, query: static_items_payload(query.get('version', STATIC_DATA_VERSION))),
+    (r'/static-data/\w+/v[\d.]+/rune$', lambda match, query: static_runes_payload(query.get('version', STATIC_DATA_VERSION))),
+    (r'/static-data/\w+/v[\d.]+/mastery$', lambda match, query: static_masteries_payload(query.get('version', STATIC_DATA_VERSION))),
+    (r'/static-data/\w+/v[\d.]+/summoner-spell$', lambda match, query: static_summoner_spells_payload(query.get('version', STATIC_DATA_VERSION))),
+    (r'/champion$', lambda match, query: champions_payload(query.get('freeToPlay') == 'True')),
+    (r'/game/by-summoner/(?P<id>\d+)/recent$', lambda match, query: recent_games_payload(_summoner_id(match))),
+    (r'/league/by-summoner/(?P<id>\d+)$', lambda match, query: leagues_payload(_summoner_id(match))),
+    (r'/stats/by-summoner/(?P<id>\d+)/summary$', lambda match, query: stats_summary_payload(_summoner_id(match))),
+    (r'/stats/by-summoner/(?P<id>\d+)/ranked$', lambda match, query: stats_ranked_payload(_summoner_id(match))),
+    (r'/summoner/(?P<id>\d+)/masteries$', lambda match, query: masteries_payload(_summoner_id(match))),
+    (r'/summoner/(?P<id>\d+)/runes$', lambda match, query: runes_payload(_summoner_id(match))),
+    (r'/summoner/by-name/(?P<names>[^/]+)$', _summoners_by_name),
+    (r'/summoner/(?P<ids>[\d,]+)/name$', _summoner_names),
+    (r'/summoner/(?P<ids>[\d,]+)$', _summoners_by_id),
+    (r'/team/by-summoner/(?P<id>\d+)$', lambda match, query: teams_payload(_summoner_id(match))),
+]
+
+class _ThreadingHTTPServer(ThreadingMixIn, HTTPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+    request_queue_size = 128
+
+class _FakeRiotHandler(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+    # headers and body are written separately, without this every response
+    # waits for the client's delayed ack
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        status, body, headers = self.server.fake.answer(self.path)
+
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json;charset=utf-8')
+        self.send_header('Content-Length', '{0}'.format(len(body)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+def _query(query_string):
+    query = dict()
+    for pair in query_string.split('&'):
+        key, _, value = pair.partition('=')
+        if key:
+            query[key] = unquote(value)
+    return query
+
+class _FakeApi(object):
+    """
+    Routing shared by FakeRiotServer and FakeTransport.
+    """
+    def __init__(self, latency=0, throttle_rate=0, retry_after='1'):
+        self.routes = [(re.compile(pattern), handler) for pattern, handler in ROUTES]
+        self.latency = latency
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.request_count = 0
+        self.throttled_count = 0
+
+        self._lock = threading.Lock()
+
+    def add_route(self, pattern, handler):
+        """
+        Registers handler(match, query) for paths matching pattern, ahead of the
+        built-in routes. The handler returns the JSON payload, or a
+        (status, payload) or (status, payload, headers) tuple. A bytes payload
+        is sent as it is, such as a recorded response body.
+        """
+        self.routes.insert(0, (re.compile(pattern), handler))
+
+    def handle(self, path, query):
+        with self._lock:
+            self.request_count += 1
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        if self.throttle_rate and random.random() < self.throttle_rate:
+            with self._lock:
+                self.throttled_count += 1
+            payload = {'status': {'message': 'Rate limit exceeded', 'status_code': 429}}
+            return 429, payload, {'Retry-After': '{0}'.format(self.retry_after)}
+
+        for pattern, handler in self.routes:
+            match = pattern.search(path)
+            if match:
+                result = handler(match, query)
+                if not isinstance(result, tuple):
+                    return 200, result, dict()
+                if len(result) == 2:
+                    return result[0], result[1], dict()
+                return result
+
+        return 404, {'status': {'message': 'Not Found', 'status_code': 404}}, dict()
+
+    def answer(self, path):
+        """
+        Returns (status, body, headers) for a request path with its query string.
+        """
+        path, _, query_string = path.partition('?')
+        status, payload, headers = self.handle(path, _query(query_string))
+        if isinstance(payload, bytes):
+            body = payload
+        else:
+            body = json.dumps(payload).encode('utf-8')
+        return status, body, headers
+
+class FakeRiotServer(_FakeApi):
+    """
+    Threaded HTTP server on localhost answering every PyRiot endpoint.
+
+    port: Port to listen on, 0 picks a free port.
+    latency: Seconds every answer is delayed by.
+    throttle_rate: Share of requests answered with 429, between 0 and 1.
+    retry_after: Retry-After header value of those 429 answers.
+
+    request_count counts every request, throttled_count the 429 answers.
+    """
+    def __init__(self, port=0, latency=0, throttle_rate=0, retry_after='1'):
+        _FakeApi.__init__(self, latency, throttle_rate, retry_after)
+
+        self._server = _ThreadingHTTPServer(('127.0.0.1', port), _FakeRiotHandler)
+        self._server.fake = self
+        self._thread = None
+
+    @property
+    def base_url(self):
+        """
+        Value to pass as base_url to PyRiot or AsyncPyRiot.
+        """
+        return 'http://127.0.0.1:{0}/api/lol'.format(self._server.server_address[1])
+
+    def start(self):
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+class FakeTransport(_FakeApi):
+    """
+    In-memory transport for PyRiot answering like FakeRiotServer, without
+    sockets or threads. Takes the same arguments, except port, and has the
+    same add_route(pattern, handler).
+    """
+    timeout = None
+
+    def get(self, region, url, **kwargs):
+        started = time.time()
+        status, body, headers = self.answer(request_key(url))
+        headers = dict(headers)
+        headers['Content-Type'] = 'application/json;charset=utf-8'
+        return build_response(url, status, headers, body, time.time() - started)
+
+    def close(self):
+        pass
@@ -0,0 +1,250 @@
+# -*- coding: utf-8 -*-
+
+"""
+Transports send the requests of PyRiot. A transport has a
+get(region, url, timeout=None) method returning a requests.Response, a
+timeout attribute with its default timeout and a close() method. Failures
+without a response raise requests.Timeout or requests.ConnectionError to be
+retried.
+
+AsyncPyRiot sends its requests with aiohttp unless given a transport. It
+awaits get() and close() when they are coroutine functions and runs a
+blocking get() on the event loop's default executor, so every transport
+below works with it, a thread per request in flight. Available transports:
+
+session.SessionPool             Pooled requests sessions, the default.
+httpx_transport.HttpxTransport  httpx clients, speaking HTTP/2 to https urls.
+testing.FakeTransport           In-memory stand-in for the api.
+RecordingTransport              Archives the traffic of another transport.
+ReplayTransport                 Answers from such an archive.
+
+RecordingTransport saves every request and response passing through another
+transport to an archive, ReplayTransport answers from such an archive
+without any network access:
+
+    with PyRiot(api_key, transport=RecordingTransport(SessionPool(), 'traffic.jsonl.gz')) as priot:
+        run_pipeline(priot)
+
+    with PyRiot('any_key', rate_limits=(), transport=ReplayTransport('traffic.jsonl.gz', time_scale=0.01)) as priot:
+        run_pipeline(priot)
+
+Archives are gzip compressed json lines, one exchange per line, with the
+seconds since recording started at which the request was sent. Urls are
+stored without the api key, so archives can be shared and replayed with any
+key.
+"""
+
+import base64
+import collections
+import datetime
+import gzip
+import json
+import re
+import threading
+import time
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from .cache import request_params
+
+_REASONS = {
+    200: 'OK',
+    400: 'Bad Request',
+    401: 'Unauthorized',
+    404: 'Not Found',
+    429: 'Too Many Requests',
+    500: 'Internal Server Error',
+    503: 'Service Unavailable',
+}
+
+_ORIGIN_PATTERN = re.compile(r'^[a-zA-Z][a-zA-Z0-9+.-]*://[^/]*')
+
+def request_key(url):
+    """
+    Path and query of url without the api key, matching requests recorded
+    against another host or with another key.
+    """
+    return _ORIGIN_PATTERN.sub('', request_params(url))
+
+class ReplayMissError(LookupError):
+    """
+    Raised by ReplayTransport for a request missing from its archive.
+    """
+
+def build_response(url, status, headers, body, elapsed=0.0):
+    """
+    requests.Response for a response that did not come from requests.
+
+    elapsed: Seconds until the response headers arrived.
+    """
+    response = requests.Response()
+    response.url = url
+    response.status_code = status
+    response.reason = _REASONS.get(status, '')
+    response.headers = CaseInsensitiveDict(headers)
+    response.encoding = 'utf-8'
+    response.elapsed = datetime.timedelta(seconds=elapsed)
+    response._content = body
+    response._content_consumed = True
+    return response
+
+def _encode_body(body):
+    try:
+        return {'body': body.decode('utf-8')}
+    except UnicodeDecodeError:
+        return {'body_base64': base64.b64encode(body).decode('ascii')}
+
+def _decode_body(exchange):
+    if 'body_base64' in exchange:
+        return base64.b64decode(exchange['body_base64'])
+    return exchange['body'].encode('utf-8')
+
+def read_archive(path):
+    """
+    Yields the exchanges of an archive as dictionaries, in recorded order.
+    """
+    with gzip.open(path, 'rb') as archive:
+        for line in archive:
+            line = line.strip()
+            if line:
+                yield json.loads(line.decode('utf-8'))
+
+class RecordingTransport(object):
+    """
+    Sends requests through transport and appends every exchange to the
+    archive at path.
+
+    transport: Transport doing the requests, such as session.SessionPool.
+    path: Archive file, gzip compressed json lines. An existing file is replaced.
+
+    Call close(), or close the client, to finish the archive.
+    """
+    def __init__(self, transport, path):
+        self.transport = transport
+        self.path = path
+        self.count = 0
+
+        self._archive = gzip.open(path, 'wb')
+        self._started = time.time()
+        self._lock = threading.Lock()
+
+    @property
+    def timeout(self):
+        return getattr(self.transport, 'timeout', None)
+
+    def get(self, region, url, **kwargs):
+        sent = time.time()
+        response = self.transport.get(region, url, **kwargs)
+
+        exchange = {
+            'at': round(sent - self._started, 6),
+            'region': region,
+            'request': request_key(url),
+            'status': response.status_code,
+            'headers': dict(response.headers),
+            'elapsed': round(response.elapsed.total_seconds(), 6),
+        }
+        exchange.update(_encode_body(response.content))
+        line = (json.dumps(exchange, sort_keys=True) + '\n').encode('utf-8')
+
+        with self._lock:
+            if self._archive is not None:
+                self._archive.write(line)
+                self.count += 1
+
+        return response
+
+    def close(self):
+        with self._lock:
+            if self._archive is not None:
+                self._archive.close()
+                self._archive = None
+        self.transport.close()
+
+class ReplayTransport(object):
+    """
+    Answers requests from an archive written by RecordingTransport, without
+    any network access.
+
+    path: Archive file.
+    time_scale: Multiplier of the recorded response times waited before
+                answering. 0 answers at once, 1 takes as long as when
+                recorded, 0.01 is a hundred times faster.
+    loop: When a request was recorded several times its responses are
+          served in recorded order. With loop they start over once used up,
+          otherwise the last one is repeated.
+    pace: Also holds every response until as long after the first replayed
+          request as it was sent after the first recorded one, times
+          time_scale, so a client replaying faster than recorded keeps the
+          recorded spacing between requests. Responses served again by loop
+          are not held.
+
+    Requests match on region and on the url path and query without the api
+    key. Requests missing from the archive raise ReplayMissError. Disable the
+    client's rate limits with rate_limits=() to replay faster than recorded.
+    """
+    def __init__(self, path, time_scale=0.0, loop=True, pace=False):
+        self.path = path
+        self.time_scale = time_scale
+        self.loop = loop
+        self.pace = pace
+        self.timeout = None
+        self.count = 0
+        self.misses = 0
+
+        self._responses = collections.defaultdict(list)
+        self._positions = collections.defaultdict(int)
+        self._lock = threading.Lock()
+        self._first_sent = None
+        self._started = None
+
+        for exchange in read_archive(path):
+            key = (exchange['region'], exchange['request'])
+            sent = exchange.get('at', 0.0)
+            self._responses[key].append((exchange['status'], exchange['headers'], _decode_body(exchange),
+                                         exchange.get('elapsed', 0.0), sent))
+            if self._first_sent is None or sent < self._first_sent:
+                self._first_sent = sent
+
+    def __len__(self):
+        return sum(len(responses) for responses in self._responses.values())
+
+    def get(self, region, url, **kwargs):
+        key = (region, request_key(url))
+        with self._lock:
+            responses = self._responses.get(key)
+            if not responses:
+                self.misses += 1
+                raise ReplayMissError('no recorded response for {0} {1}'.format(region, key[1]))
+
+            if self._started is None:
+                self._started = time.time()
+            position = self._positions[key]
+            replayed = position >= len(responses)
+            if replayed:
+                position = 0 if self.loop else len(responses) - 1
+            self._positions[key] = position + 1
+            self.count += 1
+
+        status, headers, body, elapsed, sent = responses[position]
+        if self.pace and self.time_scale and not replayed:
+            delay = self._started + (sent - self._first_sent) * self.time_scale - time.time()
+            if delay > 0:
+                time.sleep(delay)
+        if self.time_scale and elapsed:
+            time.sleep(elapsed * self.time_scale)
+
+        return build_response(url, status, headers, body, elapsed * self.time_scale)
+
+    def rewind(self):
+        """
+        Serves every request's responses from the first one again, paced
+        from the next request.
+        """
+        with self._lock:
+            self._positions.clear()
+            self._started = None
+
+    def close(self):
+        pass
@@ -6,4 +6,41 @@ import pytz
 EPOCH = datetime(1970, 1, 1, 0, 0, tzinfo=pytz.utc)
 
 def convert_epoch_millis_to_datetime(epoch_millis):
-    return EPOCH + timedelta(milliseconds=epoch_millis)
\ No newline at end of file
+    return EPOCH + timedelta(milliseconds=epoch_millis)
+
+
+def unique(items):
+    """
+    Items in their original order with duplicates removed.
+    """
+    seen = set()
+    result = []
+    for item in items:
+        if item not in seen:
+            seen.add(item)
+            result.append(item)
+
+    return result
+
+def chunks(items, size):
+    """
+    Splits a list into lists of at most size items.
+    """
+    return [items[index:index + size] for index in range(0, len(items), size)]
+
+class _Missing(object):
+    """
+    Type of MISSING, the value of model fields the api did not return.
+    """
+    def __repr__(self):
+        return 'MISSING'
+
+    def __bool__(self):
+        return False
+
+    __nonzero__ = __bool__
+
+    def __reduce__(self):
+        return 'MISSING'
+
+MISSING = _Missing()
@@ -1,7 +1,20 @@
 # -*- coding: utf-8 -*-
 
+import threading
+import time
+
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
-import api_classes
+
+from . import api_classes
+from . import cache as response_cache
+from . import decoders
+from . import executor
+from . import metrics as request_metrics
+from . import ratelimit
+from . import resilience
+from . import session
+from . import utils
 
 # API versions
 # Change version as needed
@@ -19,17 +32,354 @@ EUROPE_EAST = 'eune'
 BRAZIL = 'br'
 TURKEY = 'tr'
 
+BASE_URL = 'http://prod.api.pvp.net/api/lol'
+
+# Maximum number of summoner ids or names per summoner request
+SUMMONER_CHUNK_SIZE = 40
+
+DEFAULT_MAX_WORKERS = 8
+
+# Raw modes, returning the response instead of api_classes objects
+RAW_BYTES = 'bytes'     # undecoded response body
+RAW_JSON = 'json'       # decoded json, as returned by the api
+
+def check_raw_mode(raw):
+    if raw not in (None, False, RAW_BYTES, RAW_JSON):
+        raise ValueError('raw must be RAW_BYTES or RAW_JSON, got {0!r}'.format(raw))
+    return raw
+
+def _merge_raw(contents, raw):
+    # raw results of the requests of a bulk wrapper function
+    if raw == RAW_BYTES:
+        return [body for body in contents if body is not None]
+
+    merged = dict()
+    for content in contents:
+        merged.update(content)
+    return merged
+
 class PyRiot:
-    def __init__(self, api_key):
+    def __init__(self, api_key, pool_size=session.DEFAULT_POOL_SIZE, pool_block=False, keep_alive=True, timeout=None, base_url=BASE_URL,
+                 rate_limits=ratelimit.DEFAULT_RATE_LIMITS, rate_limiter=None, cache=None, max_workers=DEFAULT_MAX_WORKERS,
+                 coalesce=True, models=api_classes, raw=None, decoder=None,
+                 retry=resilience.DEFAULT_RETRY_POLICY, circuit_breaker=None, metrics=None, transport=None):
+        """
+        api_key: Riot API key.
+        pool_size: Number of connections kept alive per region.
+        pool_block: Treat pool_size as a hard limit on concurrent connections per region.
+        keep_alive: Reuse connections between calls.
+        timeout: Timeout in seconds for every request.
+        base_url: Root url of the api, override to point at a proxy or pyriot.testing.FakeRiotServer.
+        rate_limits: Sequence of (requests, seconds) windows allowed for the api key per region, empty to disable.
+        rate_limiter: RateLimiter to share with other clients, replaces rate_limits.
+        cache: Optional ResponseCache serving repeated calls without a request.
+        max_workers: Number of requests bulk functions, and batch calls, send at the same time.
+        coalesce: Let concurrent identical calls share one request instead of sending duplicates.
+        models: Module providing the returned classes, api_classes or lazy_classes.
+        raw: RAW_BYTES or RAW_JSON to have every wrapper function return the response body instead of objects.
+        decoder: Json decoder for response bodies, a callable or a name from decoders.DECODERS. Defaults to the fastest installed.
+        retry: RetryPolicy for failed requests, None to raise on the first failure.
+        circuit_breaker: Optional CircuitBreaker failing calls at once while a region is down.
+        metrics: Optional MetricsRegistry recording requests, stage timings and object building.
+        transport: Sends the requests, see transport.py. Defaults to pooled sessions built from pool_size,
+                   pool_block, keep_alive and timeout.
+        """
         self.api_key = api_key
-        self.base_url = 'http://prod.api.pvp.net/api/lol'
+        self.base_url = base_url
+        self.rate_limiter = rate_limiter or ratelimit.RateLimiter(rate_limits)
+        self.cache = cache
+        if transport is None:
+            transport = session.SessionPool(
+                    pool_size=pool_size,
+                    pool_block=pool_block,
+                    keep_alive=keep_alive,
+                    timeout=timeout)
+        self.transport = transport
+        self.max_workers = max_workers
+        self.coalesce = coalesce
+        self.metrics = metrics
+        self.models = metrics.timed_models(models) if metrics is not None else models
+        self.raw = check_raw_mode(raw)
+        self.decoder = decoders.resolve(decoder)
+        self.retry = retry
+        self.circuit_breaker = circuit_breaker
+
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._batch_executor = None
+        self._batch_lock = threading.Lock()
+        self._in_flight = dict()
+        self._in_flight_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        Closes the pooled connections of every region.
+        """
+        with self._executor_lock:
+            pool, self._executor = self._executor, None
+        if pool is not None:
+            pool.shutdown()
+        with self._batch_lock:
+            batch_pool, self._batch_executor = self._batch_executor, None
+        if batch_pool is not None:
+            batch_pool.shutdown()
+        self.transport.close()
+
+    def _map(self, function, items):
+        """
+        Calls function for every item on the worker threads, returning the results in order.
+        """
+        if len(items) < 2:
+            return [function(item) for item in items]
+
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(self.max_workers)
+            pool = self._executor
+        return list(pool.map(function, items))
+
+    def map(self, function, items):
+        """
+        Calls function for every item on the client's worker threads, at most
+        max_workers at the same time, for helpers sending requests of their own.
+
+        returns list of the results in order
+
+        throws the first exception raised by function
+        """
+        return self._map(function, list(items))
+
+    def request(self, endpoint, region, url, raw=RAW_JSON, fresh=False):
+        """
+        Sends a GET request for an api url without a wrapper function, such as
+        the static data api, through the cache, rate limiter and retries like
+        any wrapper function call.
+
+        endpoint: Name of the request in cache ttls and metrics.
+        region: Region of the rate limits the request counts against.
+        url: Full request url, including the api key.
+        raw: RAW_JSON for the decoded json, RAW_BYTES for the response body.
+        fresh: Skip the response cache and request current data.
+
+        throws HTTPError
+        """
+        if raw not in (RAW_BYTES, RAW_JSON):
+            raise ValueError('raw must be RAW_BYTES or RAW_JSON, got {0!r}'.format(raw))
+        return self._get(endpoint, region, url, raw, fresh)
+
+    def submit_batch(self, calls):
+        """
+        Schedules every call on the batch worker threads, at most max_workers
+        running at the same time. Requests still go through the rate limiter.
+
+        calls: (endpoint, region, *args) tuples such as ('leagues', region, summoner_id),
+               or executor.Call descriptions.
 
-    def champions(self, region, free_to_play=False):
+        returns list of concurrent.futures.Future of the calls' return values, in order
+
+        throws ValueError for unknown wrapper functions, before any call is scheduled
+        """
+        calls = [executor.as_call(spec) for spec in calls]
+        functions = [executor.wrapper_function(self, pending.endpoint) for pending in calls]
+
+        with self._batch_lock:
+            if self._batch_executor is None:
+                # apart from the pool of _map, so bulk functions called in a
+                # batch never wait for a worker held by the batch itself
+                self._batch_executor = ThreadPoolExecutor(self.max_workers)
+            return [self._batch_executor.submit(function, pending.region, *pending.args, **pending.kwargs)
+                    for function, pending in zip(functions, calls)]
+
+    def batch(self, calls):
+        """
+        Runs every call concurrently and waits for all of them.
+
+            summoner, leagues, teams = priot.batch([
+                    ('summoner_get_by_id', NORTH_AMERICA, summoner_id),
+                    ('leagues', NORTH_AMERICA, summoner_id),
+                    ('teams', NORTH_AMERICA, summoner_id)])
+
+        calls: (endpoint, region, *args) tuples or executor.Call descriptions.
+
+        returns list of the calls' return values in order, holding the
+        exception instead for calls that failed
+
+        throws ValueError for unknown wrapper functions, before any call is scheduled
+        """
+        results = []
+        for future in self.submit_batch(calls):
+            error = future.exception()
+            results.append(error if error is not None else future.result())
+        return results
+
+    def _raw_mode(self, raw):
+        """
+        Resolves the raw argument of a call, None meaning the client default
+        and False forcing objects.
+        """
+        if raw is None:
+            return self.raw
+        return check_raw_mode(raw)
+
+    def _get(self, endpoint, region, url, raw=None, fresh=False):
+        body = self._fetch(endpoint, region, url, fresh)
+        if raw == RAW_BYTES:
+            return body
+        if self.metrics is None:
+            return self.decoder(body)
+
+        started = request_metrics.timer()
+        content = self.decoder(body)
+        self.metrics.record_decode(endpoint, region, request_metrics.timer() - started)
+        return content
+
+    def _fetch(self, endpoint, region, url, fresh=False):
+        """
+        Returns the raw response body for url, from the cache when possible
+        unless fresh is set. Fresh responses still refresh the cache.
+
+        When coalesce is set, callers asking for a request that is already in
+        flight wait for it and get its body or exception.
+        """
+        params = response_cache.request_params(url, self.base_url)
+        if self.cache is not None and not fresh:
+            body = self.cache.get(endpoint, region, params)
+            if body is not None:
+                return body
+
+        if not self.coalesce:
+            return self._send(endpoint, region, params, url)
+
+        key = (endpoint, region, params)
+        with self._in_flight_lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            return future.result()
+
+        try:
+            body = self._send(endpoint, region, params, url)
+        except BaseException as error:
+            future.set_exception(error)
+            raise
+        else:
+            future.set_result(body)
+        finally:
+            with self._in_flight_lock:
+                del self._in_flight[key]
+
+        return body
+
+    def _send(self, endpoint, region, params, url):
+        """
+        Sends the request, retrying it as the retry policy allows.
+        """
+        started = time.time()
+        attempt = 0
+        probe = None
+        try:
+            while True:
+                attempt += 1
+                if self.circuit_breaker is not None:
+                    probe = self.circuit_breaker.before_request(region)
+
+                waiting = request_metrics.timer()
+                self.rate_limiter.acquire(self.api_key, region)
+                sent = request_metrics.timer()
+
+                options = dict()
+                if self.retry is not None and self.retry.deadline is not None:
+                    options['timeout'] = self.retry.timeout(started, getattr(self.transport, 'timeout', None))
+
+                try:
+                    response = self.transport.get(region, url, **options)
+                except (requests.Timeout, requests.ConnectionError):
+                    self._record_error(endpoint, region, waiting, sent)
+                    self._record_outcome(region, False)
+                    delay = self._retry_delay(attempt, started)
+                    if delay is None:
+                        raise
+                    time.sleep(delay)
+                    continue
+                except Exception:
+                    self._record_error(endpoint, region, waiting, sent)
+                    self._record_outcome(region, False)
+                    raise
+
+                self._record_request(endpoint, region, response, waiting, sent)
+                self.rate_limiter.update(self.api_key, region, response.headers)
+                self._record_outcome(region, response.status_code < 500)
+
+                if response.status_code >= 400:
+                    delay = self._retry_delay(attempt, started, response.status_code, response.headers)
+                    if delay is not None:
+                        if response.status_code == 429:
+                            # hold back every request to the region, not just this one
+                            self.rate_limiter.block(self.api_key, region, delay)
+                        else:
+                            time.sleep(delay)
+                        continue
+
+                response.raise_for_status()
+                break
+        finally:
+            # a probe ending without an outcome, such as a cancelled call,
+            # must not keep the circuit half open
+            if probe is not None:
+                self.circuit_breaker.end_probe(region, probe)
+
+        body = response.content
+
+        if self.cache is not None:
+            self.cache.set(endpoint, region, params, body)
+
+        return body
+
+    def _retry_delay(self, attempt, started, status=None, headers=None):
+        if self.retry is None:
+            return None
+        return self.retry.retry_delay(attempt, started, status, headers)
+
+    def _record_outcome(self, region, success):
+        if self.circuit_breaker is None:
+            return
+        if success:
+            self.circuit_breaker.record_success(region)
+        else:
+            self.circuit_breaker.record_failure(region)
+
+    def _record_request(self, endpoint, region, response, waiting, sent):
+        if self.metrics is None:
+            return
+        # requests reads the body before returning, elapsed stops at the headers
+        elapsed = request_metrics.timer() - sent
+        first_byte = min(elapsed, response.elapsed.total_seconds())
+        self.metrics.record_request(endpoint, region, response.status_code, len(response.content),
+                                    sent - waiting, first_byte, elapsed - first_byte)
+
+    def _record_error(self, endpoint, region, waiting, sent):
+        if self.metrics is None:
+            return
+        self.metrics.record_error(endpoint, region, sent - waiting, request_metrics.timer() - sent)
+
+    def champions(self, region, free_to_play=False, raw=None, fresh=False):
         """
         The list of champion information.
 
         region: Region where to retrieve the data. Use the constants included in this package.
         free_to_play: Optional filter param to retrieve only free to play champions.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns dictionary of champions keyed on champion id
 
@@ -55,22 +405,25 @@ class PyRiot:
                 free_to_play, 
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('champions', region, url, raw, fresh)
+        if raw:
+            return content
 
         champions = dict()
         for champion in content['champions']:
-            champions[champion['id']] = api_classes.Champion(**champion)     
+            champions[champion['id']] = self.models.Champion(**champion)     
 
         return champions
 
-    def recent_games(self, region, summoner_id):
+    def recent_games(self, region, summoner_id, raw=None, fresh=False):
         """
         List of recent games played (max 10).
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_id: Summoner ID.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns list of recent games played by Summoner
 
@@ -109,22 +462,25 @@ class PyRiot:
                 summoner_id,
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('recent_games', region, url, raw, fresh)
+        if raw:
+            return content
 
         games = []
         for game in content['games']:
-            games.append(api_classes.Game(**game))
+            games.append(self.models.Game(**game))
 
         return games
 
-    def leagues(self, region, summoner_id):
+    def leagues(self, region, summoner_id, raw=None, fresh=False):
         """
         League information for summoner.
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_id: Summoner ID.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns Map[string, LeagueDto]
 
@@ -167,24 +523,27 @@ class PyRiot:
                 summoner_id,
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('leagues', region, url, raw, fresh)
+        if raw:
+            return content
 
         leagues = dict()
         for league_id in content:
-            league = api_classes.League(**content[league_id])
+            league = self.models.League(**content[league_id])
 
             leagues[league_id] = league
 
         return leagues
 
-    def stats_summary(self, region, summoner_id, season=None):
+    def stats_summary(self, region, summoner_id, season=None, raw=None, fresh=False):
         """
         Summoner stat summary
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_id: Summoner ID.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns list of player stat summaries
 
@@ -267,22 +626,25 @@ class PyRiot:
         if season:
             url += '&season=SEASON{0}'.format(season)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('stats_summary', region, url, raw, fresh)
+        if raw:
+            return content
 
         player_stat_summaries = []
         for stat_summary in content['playerStatSummaries']:
-            player_stat_summaries.append(api_classes.PlayerStatsSummary(**stat_summary))
+            player_stat_summaries.append(self.models.PlayerStatsSummary(**stat_summary))
 
         return player_stat_summaries
 
-    def stats_ranked(self, region, summoner_id, season=None):
+    def stats_ranked(self, region, summoner_id, season=None, raw=None, fresh=False):
         """
         Summoner ranked stats
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_id: Summoner ID.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns list of player ranked stats
 
@@ -364,18 +726,21 @@ class PyRiot:
         if season:
             url += '&season=SEASON{0}'.format(season)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('stats_ranked', region, url, raw, fresh)
+        if raw:
+            return content
 
-        return api_classes.PlayerRankedStats(**content)
+        return self.models.PlayerRankedStats(**content)
 
-    def summoner_masteries(self, region, summoner_id):
+    def summoner_masteries(self, region, summoner_id, raw=None, fresh=False):
         """
         Summoner mastery pages
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_id: Summoner ID.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns list of mastery pages associated with summoner
 
@@ -403,22 +768,25 @@ class PyRiot:
                 summoner_id,
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('summoner_masteries', region, url, raw, fresh)
+        if raw:
+            return content
 
         mastery_pages = []
         for page in content['pages']:
-            mastery_pages.append(api_classes.MasteryPage(**page))
+            mastery_pages.append(self.models.MasteryPage(**page))
 
         return mastery_pages
 
-    def summoner_runes(self, region, summoner_id):
+    def summoner_runes(self, region, summoner_id, raw=None, fresh=False):
         """
         Summoner rune pages
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_id: Summoner ID.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns list of rune pages associated with summoner
 
@@ -451,22 +819,25 @@ class PyRiot:
                 summoner_id,
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('summoner_runes', region, url, raw, fresh)
+        if raw:
+            return content
 
         rune_pages = []
         for page in content['pages']:
-            rune_pages.append(api_classes.RunePage(**page))
+            rune_pages.append(self.models.RunePage(**page))
 
         return rune_pages
 
-    def summoner_get_by_name(self, region, summoner_name):
+    def summoner_get_by_name(self, region, summoner_name, raw=None, fresh=False):
         """
         Get summoner by name
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_name: Summoner name.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns summoner information for summoner with specified name
 
@@ -486,18 +857,21 @@ class PyRiot:
                 summoner_name,
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('summoner_get_by_name', region, url, raw, fresh)
+        if raw:
+            return content
 
-        return api_classes.Summoner(**content.get(summoner_name))
+        return self.models.Summoner(**content.get(summoner_name))
 
-    def summoner_get_by_id(self, region, summoner_id):
+    def summoner_get_by_id(self, region, summoner_id, raw=None, fresh=False):
         """
         Get summoner names for list of summoner ids
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_id: Summoner ID.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns summoner information for summoner with specified id
 
@@ -517,18 +891,21 @@ class PyRiot:
                 summoner_id,
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('summoner_get_by_id', region, url, raw, fresh)
+        if raw:
+            return content
 
-        return  api_classes.Summoner(**content.get('{0}'.format(summoner_id)))
+        return self.models.Summoner(**content.get('{0}'.format(summoner_id)))
 
-    def summoner_get_names_for_ids(self, region, summoner_ids):
+    def summoner_get_names_for_ids(self, region, summoner_ids, raw=None, fresh=False):
         """
         Get summoner names for list of summoner ids
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_ids: Comma separted string of summoner IDs.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns dictionary of summoner ids to names
 
@@ -545,9 +922,10 @@ class PyRiot:
                 summoner_ids,
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('summoner_get_names_for_ids', region, url, raw, fresh)
+        if raw:
+            return content
 
         summoners = dict()
         for summoner in content['summoners']:
@@ -555,12 +933,103 @@ class PyRiot:
 
         return summoners
 
-    def teams(self, region, summoner_id):
+    def summoners_by_ids(self, region, summoner_ids, raw=None, fresh=False):
+        """
+        Get summoners for any number of summoner ids
+
+        region: Region where to retrieve the data. Use the constants included in this package.
+        summoner_ids: Iterable of summoner IDs.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
+
+        Ids are requested SUMMONER_CHUNK_SIZE at a time, up to max_workers requests at once.
+
+        returns dictionary of summoner ids to summoners, ids that do not exist are left out.
+        In RAW_JSON mode the merged api dictionary, in RAW_BYTES mode a list with the body of every request.
+
+        throws HTTPError
+        """
+
+        def fetch(chunk):
+            url = '{0}/{1}/{2}/summoner/{3}?api_key={4}'.format(
+                    self.base_url,
+                    region,
+                    SUMMONER_VERSION,
+                    ','.join('{0}'.format(summoner_id) for summoner_id in chunk),
+                    self.api_key)
+
+            return self._get_summoners('summoners_by_ids', region, url, raw, fresh)
+
+        raw = self._raw_mode(raw)
+        ids = utils.unique(int(summoner_id) for summoner_id in summoner_ids)
+        contents = self._map(fetch, utils.chunks(ids, SUMMONER_CHUNK_SIZE))
+        if raw:
+            return _merge_raw(contents, raw)
+
+        summoners = dict()
+        for content in contents:
+            for summoner in content.values():
+                summoners[summoner['id']] = self.models.Summoner(**summoner)
+
+        return summoners
+
+    def summoners_by_names(self, region, summoner_names, raw=None, fresh=False):
+        """
+        Get summoners for any number of summoner names
+
+        region: Region where to retrieve the data. Use the constants included in this package.
+        summoner_names: Iterable of summoner names.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
+
+        Names are requested SUMMONER_CHUNK_SIZE at a time, up to max_workers requests at once.
+
+        returns dictionary of summoner names, as keyed by the api, to summoners. Names that do not exist are left out.
+        In RAW_JSON mode the merged api dictionary, in RAW_BYTES mode a list with the body of every request.
+
+        throws HTTPError
+        """
+
+        def fetch(chunk):
+            url = '{0}/{1}/{2}/summoner/by-name/{3}?api_key={4}'.format(
+                    self.base_url,
+                    region,
+                    SUMMONER_VERSION,
+                    ','.join(chunk),
+                    self.api_key)
+
+            return self._get_summoners('summoners_by_names', region, url, raw, fresh)
+
+        raw = self._raw_mode(raw)
+        names = utils.unique(summoner_names)
+        contents = self._map(fetch, utils.chunks(names, SUMMONER_CHUNK_SIZE))
+        if raw:
+            return _merge_raw(contents, raw)
+
+        summoners = dict()
+        for content in contents:
+            for name in content:
+                summoners[name] = self.models.Summoner(**content[name])
+
+        return summoners
+
+    def _get_summoners(self, endpoint, region, url, raw=None, fresh=False):
+        # the api answers 404 when none of the requested summoners exist
+        try:
+            return self._get(endpoint, region, url, raw, fresh)
+        except requests.HTTPError as error:
+            if error.response is not None and error.response.status_code == 404:
+                return None if raw == RAW_BYTES else dict()
+            raise
+
+    def teams(self, region, summoner_id, raw=None, fresh=False):
         """
         Get teams that summoner is in
 
         region: Region where to retrieve the data. Use the constants included in this package.
         summoner_id: Summoner ID.
+        raw: Optional RAW_BYTES or RAW_JSON to return the response body instead of objects, defaults to the client's raw.
+        fresh: Skip the response cache and request current data. The response still refreshes the cache.
 
         returns list of teams associated to a summoner
 
@@ -626,12 +1095,13 @@ class PyRiot:
                 summoner_id,
                 self.api_key)
 
-        response = requests.get(url)
-        response.raise_for_status()
-        content = response.json()
+        raw = self._raw_mode(raw)
+        content = self._get('teams', region, url, raw, fresh)
+        if raw:
+            return content
 
         teams = []
         for team in content:
-            teams.append(api_classes.Team(**team))
+            teams.append(self.models.Team(**team))
 
         return teams
\ No newline at end of file
@@ -1,4 +1,4 @@
-from distutils.core import setup
+from setuptools import setup
 setup(name='pyriot',
       version='2.0.2',
       description='python wrapper for riot league of legends api',
@@ -6,5 +6,10 @@ setup(name='pyriot',
       author_email='esailer@asu.edu',
       url='http://ehom.co',
       packages=['pyriot'],
-      install_requires=['requests==2.1.0','pytz==2013.8',],
-      )
\ No newline at end of file
+      install_requires=['requests==2.1.0','pytz==2013.8','futures>=2.1.6;python_version<"3"',],
+      extras_require={
+          'async': ['aiohttp>=3.3'],
+          'columnar': ['numpy'],
+          'http2': ['httpx[http2]'],
+      },
+      )
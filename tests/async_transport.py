@@ -0,0 +1,32 @@
+# -*- coding: utf-8 -*-
+
+# Requires Python 3.5+, imported through helpers.
+
+import asyncio
+
+import requests
+
+from pyriot.testing import FakeTransport
+
+class AsyncTransport(object):
+    """
+    Transport with coroutine get() and close(), answering from FakeTransport.
+    The first failures attempts raise requests.ConnectionError.
+    """
+    timeout = None
+
+    def __init__(self, failures=0):
+        self.failures = failures
+        self.attempts = 0
+        self.closed = False
+        self.fake = FakeTransport()
+
+    async def get(self, region, url, **kwargs):
+        self.attempts += 1
+        if self.attempts <= self.failures:
+            raise requests.ConnectionError('connection reset')
+        await asyncio.sleep(0)
+        return self.fake.get(region, url, **kwargs)
+
+    async def close(self):
+        self.closed = True
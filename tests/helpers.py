@@ -0,0 +1,29 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+try:
+    import asyncio
+    import aiohttp
+    from pyriot.async_wrapper import AsyncPyRiot
+    from .async_transport import AsyncTransport
+except (ImportError, SyntaxError):
+    # Python 2, or aiohttp is not installed
+    asyncio = aiohttp = AsyncPyRiot = AsyncTransport = None
+
+requires_async = unittest.skipIf(AsyncPyRiot is None, 'requires Python 3 and aiohttp')
+
+class AsyncTestCase(unittest.TestCase):
+    """
+    Runs every test on a new event loop.
+    """
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+
+    def tearDown(self):
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    def run_async(self, coroutine):
+        return self.loop.run_until_complete(coroutine)
@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+
+from pyriot.cache import MemoryBackend, ResponseCache, SQLiteBackend, request_params
+from pyriot.testing import FakeTransport
+from pyriot.wrapper import EUROPE_WEST, NORTH_AMERICA, PyRiot
+
+class ResponseCacheTest(unittest.TestCase):
+    def test_request_params_drop_base_url_and_api_key(self):
+        url = 'http://prod.api.pvp.net/api/lol/na/v1.1/summoner/5?api_key=secret'
+        self.assertEqual(request_params(url, 'http://prod.api.pvp.net/api/lol'), '/na/v1.1/summoner/5')
+
+    def test_uncached_endpoint(self):
+        cache = ResponseCache(ttls={})
+        cache.set('teams', NORTH_AMERICA, '/teams', b'[]')
+        self.assertIsNone(cache.get('teams', NORTH_AMERICA, '/teams'))
+        self.assertEqual(len(cache), 0)
+
+    def test_expired_entry_is_a_miss(self):
+        cache = ResponseCache(ttls={'teams': 60})
+        cache.backend.set(('teams', NORTH_AMERICA, '/old'), time.time() - 61, b'old')
+        cache.set('teams', NORTH_AMERICA, '/new', b'new')
+
+        self.assertIsNone(cache.get('teams', NORTH_AMERICA, '/old'))
+        self.assertEqual(cache.get('teams', NORTH_AMERICA, '/new'), b'new')
+        self.assertEqual((cache.hits['teams'], cache.misses['teams']), (1, 1))
+        self.assertEqual(cache.hit_ratio(), 0.5)
+
+    def test_invalidate(self):
+        cache = ResponseCache(ttls={'teams': 60, 'leagues': 60})
+        cache.set('teams', NORTH_AMERICA, '/a', b'a')
+        cache.set('teams', EUROPE_WEST, '/a', b'a')
+        cache.set('leagues', NORTH_AMERICA, '/a', b'a')
+
+        cache.invalidate('teams', NORTH_AMERICA)
+        self.assertEqual(len(cache), 2)
+        cache.invalidate(region=NORTH_AMERICA)
+        self.assertEqual(len(cache), 1)
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+
+    def test_counts_are_exact_under_threads(self):
+        cache = ResponseCache(ttls={'teams': 60})
+        cache.set('teams', NORTH_AMERICA, '/hit', b'body')
+
+        def lookups():
+            for _ in range(500):
+                cache.get('teams', NORTH_AMERICA, '/hit')
+                cache.get('teams', NORTH_AMERICA, '/miss')
+
+        threads = [threading.Thread(target=lookups) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(cache.hits['teams'], 4000)
+        self.assertEqual(cache.misses['teams'], 4000)
+
+class MemoryBackendTest(unittest.TestCase):
+    def test_evicts_least_recently_used(self):
+        backend = MemoryBackend(max_entries=2)
+        backend.set('a', 0, b'a')
+        backend.set('b', 0, b'b')
+        backend.get('a')
+        backend.set('c', 0, b'c')
+
+        self.assertIsNone(backend.get('b'))
+        self.assertEqual(backend.get('a'), (0, b'a'))
+        self.assertEqual(backend.get('c'), (0, b'c'))
+        self.assertEqual(backend.evictions, 1)
+        self.assertEqual(len(backend), 2)
+
+class SQLiteBackendTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'cache.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_shared_by_clients(self):
+        fake = FakeTransport()
+        for _ in range(2):
+            cache = ResponseCache(backend=SQLiteBackend(self.path))
+            with PyRiot('test_key', rate_limits=(), cache=cache, transport=fake) as priot:
+                self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+            cache.backend.close()
+        self.assertEqual(fake.request_count, 1)
+
+    def test_round_trip_across_instances(self):
+        backend = SQLiteBackend(self.path)
+        backend.set(('teams', NORTH_AMERICA, '/a'), 10.0, b'body')
+        backend.close()
+
+        backend = SQLiteBackend(self.path)
+        self.assertEqual(backend.get(('teams', NORTH_AMERICA, '/a')), (10.0, b'body'))
+        self.assertIsNone(backend.get(('teams', NORTH_AMERICA, '/b')))
+        backend.close()
+
+    def test_delete_and_purge(self):
+        backend = SQLiteBackend(self.path)
+        backend.set(('teams', NORTH_AMERICA, '/a'), time.time(), b'a')
+        backend.set(('teams', EUROPE_WEST, '/a'), time.time(), b'a')
+        backend.set(('leagues', NORTH_AMERICA, '/a'), time.time() - 100, b'a')
+
+        backend.purge(50)
+        self.assertEqual(len(backend), 2)
+        backend.delete(region=EUROPE_WEST)
+        self.assertEqual(len(backend), 1)
+        backend.close()
+
+class ClientCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeTransport()
+
+    def test_repeated_calls_are_served_until_ttl(self):
+        cache = ResponseCache(ttls={'summoner_get_by_id': 0.2})
+        with PyRiot('test_key', rate_limits=(), cache=cache, transport=self.fake) as priot:
+            self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+            self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+            self.assertEqual(self.fake.request_count, 1)
+
+            time.sleep(0.25)
+            priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            self.assertEqual(self.fake.request_count, 2)
+
+    def test_fresh_bypasses_the_cache(self):
+        cache = ResponseCache()
+        with PyRiot('test_key', rate_limits=(), cache=cache, transport=self.fake) as priot:
+            priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            priot.summoner_get_by_id(NORTH_AMERICA, 5, fresh=True)
+            self.assertEqual(self.fake.request_count, 2)
+
+            # the fresh answer is cached for later calls
+            priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            self.assertEqual(self.fake.request_count, 2)
+
+    def test_error_responses_are_not_cached(self):
+        self.fake.add_route(r'/summoner/5$', lambda match, query: (404, {}))
+        cache = ResponseCache()
+        with PyRiot('test_key', rate_limits=(), cache=cache, transport=self.fake) as priot:
+            for _ in range(2):
+                with self.assertRaises(Exception):
+                    priot.summoner_get_by_id(NORTH_AMERICA, 5)
+        self.assertEqual(self.fake.request_count, 2)
+        self.assertEqual(len(cache), 0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,100 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+
+import requests
+
+from pyriot.testing import FakeRiotServer, FakeTransport
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+from .helpers import AsyncPyRiot, AsyncTestCase, asyncio, requires_async
+
+def client(transport, **kwargs):
+    return PyRiot('test_key', rate_limits=(), transport=transport, **kwargs)
+
+class CoalescingTest(unittest.TestCase):
+    def call_concurrently(self, priot, count):
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(priot.summoner_get_by_id(NORTH_AMERICA, 5)))
+                   for _ in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_identical_calls_share_one_request(self):
+        fake = FakeTransport(latency=0.2)
+        with client(fake) as priot:
+            results = self.call_concurrently(priot, 5)
+        self.assertEqual(fake.request_count, 1)
+        self.assertEqual([summoner.name for summoner in results], ['summoner5'] * 5)
+
+    def test_disabled(self):
+        fake = FakeTransport(latency=0.2)
+        with client(fake, coalesce=False) as priot:
+            self.call_concurrently(priot, 5)
+        self.assertEqual(fake.request_count, 5)
+
+    def test_errors_are_shared(self):
+        fake = FakeTransport(latency=0.2)
+        fake.add_route(r'/summoner/5$', lambda match, query: (404, {}))
+        errors = []
+
+        def call():
+            try:
+                priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            except requests.HTTPError as error:
+                errors.append(error)
+
+        with client(fake) as priot:
+            threads = [threading.Thread(target=call) for _ in range(3)]
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+        self.assertEqual(len(errors), 3)
+        self.assertEqual(fake.request_count, 1)
+
+@requires_async
+class AsyncCoalescingTest(AsyncTestCase):
+    def setUp(self):
+        AsyncTestCase.setUp(self)
+        self.server = FakeRiotServer(latency=0.3).start()
+        self.priot = AsyncPyRiot('test_key', base_url=self.server.base_url, rate_limits=())
+
+    def tearDown(self):
+        self.run_async(self.priot.close())
+        self.server.stop()
+        AsyncTestCase.tearDown(self)
+
+    def test_identical_calls_share_one_request(self):
+        results = self.run_async(asyncio.gather(*[self.priot.summoner_get_by_id(NORTH_AMERICA, 5) for _ in range(5)]))
+        self.assertEqual([summoner.name for summoner in results], ['summoner5'] * 5)
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_cancelled_leader_leaves_followers_waiting(self):
+        leader = self.loop.create_task(self.priot.summoner_get_by_id(NORTH_AMERICA, 5))
+        follower = self.loop.create_task(self.priot.summoner_get_by_id(NORTH_AMERICA, 5))
+        self.run_async(asyncio.sleep(0.1))
+        leader.cancel()
+
+        self.assertEqual(self.run_async(follower).name, 'summoner5')
+        self.assertTrue(leader.cancelled())
+        self.assertEqual(self.server.request_count, 1)
+
+    def test_request_is_cancelled_with_its_last_caller(self):
+        callers = [self.loop.create_task(self.priot.summoner_get_by_id(NORTH_AMERICA, 5)) for _ in range(2)]
+        self.run_async(asyncio.sleep(0.1))
+        for caller in callers:
+            caller.cancel()
+        self.run_async(asyncio.sleep(0))
+        self.assertEqual(self.priot._in_flight, {})
+
+        # a later call does not wait on the cancelled request
+        self.assertEqual(self.run_async(self.priot.summoner_get_by_id(NORTH_AMERICA, 5)).name, 'summoner5')
+        self.assertEqual(self.server.request_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
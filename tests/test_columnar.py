@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+import unittest
+
+from pyriot import api_classes, lazy_classes, slotted_classes
+from pyriot.testing import FakeTransport, aggregated_stats_payload, stats_ranked_payload, stats_summary_payload
+from pyriot.wrapper import NORTH_AMERICA, RAW_JSON, PyRiot
+
+try:
+    import numpy
+    from pyriot import columnar
+except ImportError:
+    numpy = columnar = None
+
+def ranked_payload(summoner_id, stats):
+    payload = stats_ranked_payload(summoner_id, champion_count=1)
+    payload['champions'][0]['stats'] = stats
+    return payload
+
+@unittest.skipIf(numpy is None, 'requires numpy')
+class StatsTableTest(unittest.TestCase):
+    def fetch_ranked(self, models, raw=None):
+        with PyRiot('test_key', rate_limits=(), models=models, transport=FakeTransport()) as priot:
+            return [priot.stats_ranked(NORTH_AMERICA, summoner_id, raw=raw) for summoner_id in (1, 2)]
+
+    def test_ranked_stats_table(self):
+        table = columnar.ranked_stats_table(self.fetch_ranked(api_classes))
+        self.assertEqual(len(table), 80)
+        self.assertEqual(table['summoner_id'].tolist(), [1] * 40 + [2] * 40)
+        self.assertEqual(table['champion_id'].tolist()[:3], [1, 2, 3])
+        self.assertEqual(int(table['total_champion_kills'][0]), aggregated_stats_payload(2)['totalChampionKills'])
+
+        # fields the api left out are masked, not zeros
+        self.assertTrue(table['average_assists'].mask.all())
+        self.assertIs(table['average_assists'].sum(), numpy.ma.masked)
+
+        keys, sums = table.group_sum('summoner_id', 'total_champion_kills')
+        self.assertEqual(keys.tolist(), [1, 2])
+        self.assertEqual(int(sums[0]), int(table.select(table['summoner_id'] == 1)['total_champion_kills'].sum()))
+
+    def test_every_model_gives_the_same_table(self):
+        expected = columnar.ranked_stats_table(self.fetch_ranked(api_classes))
+        for models, raw in ((lazy_classes, None), (slotted_classes, None), (api_classes, RAW_JSON)):
+            table = columnar.ranked_stats_table(self.fetch_ranked(models, raw))
+            for name in expected.names:
+                self.assertEqual(table[name].tolist(), expected[name].tolist(), name)
+
+    def test_totals(self):
+        payload = stats_ranked_payload(5, champion_count=2)
+        payload['champions'].append({'id': 0, 'name': '', 'stats': aggregated_stats_payload(5)})
+        self.assertEqual(len(columnar.ranked_stats_table([payload])), 2)
+        self.assertEqual(len(columnar.ranked_stats_table([payload], totals=True)), 3)
+
+    def test_null_and_fractional_values(self):
+        stats = aggregated_stats_payload(5)
+        stats.update(totalAssists=None, totalDamageDealt=2.5, totalGoldEarned=2 ** 70)
+        payloads = [ranked_payload(5, stats), ranked_payload(6, aggregated_stats_payload(6))]
+
+        for models in (None, api_classes, lazy_classes, slotted_classes):
+            rows = payloads
+            if models is not None:
+                rows = [models.PlayerRankedStats._from_raw(payload) for payload in payloads]
+            table = columnar.ranked_stats_table(rows)
+
+            self.assertEqual(table['total_assists'].mask.tolist(), [True, False])
+            self.assertEqual(table['total_damage_dealt'].dtype, numpy.float64)
+            self.assertEqual(table['total_damage_dealt'][0], 2.5)
+            self.assertEqual(table['total_gold_earned'][0], 2 ** 70)
+            self.assertEqual(table['total_heal'].dtype, numpy.int64)
+            self.assertEqual(table['total_champion_kills'].tolist(),
+                             [stats['totalChampionKills'], aggregated_stats_payload(6)['totalChampionKills']])
+
+    def test_stats_summary_table(self):
+        payload = stats_summary_payload(5)
+        payload['playerStatSummaries'][0]['wins'] = None
+        del payload['playerStatSummaries'][1]['losses']
+
+        summaries = [slotted_classes.PlayerStatsSummary._from_raw(summary) for summary in payload['playerStatSummaries']]
+        for results in ([payload], {5: summaries}):
+            table = columnar.stats_summary_table(results)
+            self.assertEqual(len(table), 4)
+            self.assertEqual(table['player_stat_summary_type'][0], 'Unranked')
+            self.assertEqual(table['wins'].mask.tolist(), [True, False, False, False])
+            self.assertEqual(table['losses'].mask.tolist(), [False, True, False, False])
+
+if __name__ == '__main__':
+    unittest.main()
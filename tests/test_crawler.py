@@ -0,0 +1,70 @@
+# -*- coding: utf-8 -*-
+
+import threading
+import unittest
+
+from pyriot.crawler import BloomFilter, Crawler
+from pyriot.testing import FakeTransport
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+class BloomFilterTest(unittest.TestCase):
+    def test_membership(self):
+        visited = BloomFilter(capacity=1000, error_rate=0.01)
+        for value in range(500):
+            visited.add(value)
+        self.assertTrue(all(value in visited for value in range(500)))
+        self.assertLess(sum(1 for value in range(500, 10500) if value in visited), 200)
+
+class CrawlerTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeTransport()
+        self.priot = PyRiot('test_key', rate_limits=(), transport=self.fake)
+
+    def tearDown(self):
+        self.priot.close()
+
+    def test_breadth_first_until_max_summoners(self):
+        crawler = Crawler(self.priot, NORTH_AMERICA, [5], workers=2, max_summoners=20)
+        results = list(crawler)
+        self.assertEqual(len(results), 20)
+        summoner_ids = set(result.summoner_id for result in results)
+        self.assertEqual(len(summoner_ids), 20)
+        self.assertIn(5, summoner_ids)
+        self.assertTrue(all(result.error is None for result in results))
+
+    def test_not_found_is_empty(self):
+        self.fake.add_route(r'/league/by-summoner/\d+$', lambda match, query: (404, {}))
+        result = next(iter(Crawler(self.priot, NORTH_AMERICA, [5], workers=1, max_summoners=1)))
+        self.assertEqual(result.leagues, {})
+        self.assertEqual(len(result.recent_games), 10)
+
+    def test_fetch_errors_are_returned(self):
+        self.fake.add_route(r'/game/by-summoner/\d+/recent$', lambda match, query: (403, {}))
+        results = list(Crawler(self.priot, NORTH_AMERICA, [5], workers=2))
+        # the seed's neighbours are not crawled
+        self.assertEqual(len(results), 1)
+        self.assertIsNotNone(results[0].error)
+
+    def test_worker_failure_is_raised(self):
+        crawler = Crawler(self.priot, NORTH_AMERICA, [5], workers=2, max_summoners=50)
+
+        def broken(result):
+            raise KeyError('broken')
+        crawler._neighbours = broken
+
+        finished = []
+
+        def consume():
+            try:
+                list(crawler)
+            except KeyError:
+                finished.append(True)
+
+        thread = threading.Thread(target=consume)
+        thread.daemon = True
+        thread.start()
+        thread.join(5)
+        self.assertEqual(finished, [True])
+
+if __name__ == '__main__':
+    unittest.main()
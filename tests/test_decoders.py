@@ -0,0 +1,42 @@
+# -*- coding: utf-8 -*-
+
+import json
+import unittest
+
+from pyriot import decoders
+from pyriot.testing import FakeTransport, recent_games_payload, summoner_payload
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+BODIES = [
+    json.dumps(recent_games_payload(5)).encode('utf-8'),
+    json.dumps({'5': summoner_payload(5, u'Ærøskøbing 日本')}, ensure_ascii=False).encode('utf-8'),
+]
+
+class DecodersTest(unittest.TestCase):
+    def test_installed_decoders_agree_with_json(self):
+        available = decoders.available_decoders()
+        self.assertIn('json', available)
+        for name, decoder in available.items():
+            for body in BODIES:
+                self.assertEqual(decoder(body), json.loads(body.decode('utf-8')), name)
+
+    def test_resolve(self):
+        self.assertIs(decoders.resolve(None), decoders.default_decoder())
+        self.assertIs(decoders.resolve('json'), decoders.stdlib_decoder)
+        self.assertIs(decoders.resolve(len), len)
+        with self.assertRaises(ValueError):
+            decoders.resolve('yaml')
+
+    def test_client_decoder(self):
+        bodies = []
+
+        def decoder(body):
+            bodies.append(body)
+            return json.loads(body.decode('utf-8'))
+
+        with PyRiot('test_key', rate_limits=(), decoder=decoder, transport=FakeTransport()) as priot:
+            self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+        self.assertEqual(len(bodies), 1)
+
+if __name__ == '__main__':
+    unittest.main()
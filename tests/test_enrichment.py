@@ -0,0 +1,73 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+
+from pyriot import api_classes, slotted_classes
+from pyriot.enrichment import NameCache, enrich_games
+from pyriot.static_data import StaticData
+from pyriot.testing import FakeTransport
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+class NameCacheTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeTransport()
+        self.priot = PyRiot('test_key', rate_limits=(), transport=self.fake)
+
+    def tearDown(self):
+        self.priot.close()
+
+    def test_names_are_requested_once(self):
+        names = NameCache(self.priot)
+        self.assertEqual(names.names(NORTH_AMERICA, range(1, 51)), dict((i, 'summoner{0}'.format(i)) for i in range(1, 51)))
+        self.assertEqual((names.requests, self.fake.request_count), (2, 2))
+
+        self.assertEqual(names.names(NORTH_AMERICA, ['5', 50, 51])[51], 'summoner51')
+        self.assertEqual(self.fake.request_count, 3)
+
+    def test_unknown_summoners(self):
+        self.fake.add_route(r'/summoner/[\d,]+/name$', lambda match, query: (404, {}))
+        names = NameCache(self.priot)
+        self.assertEqual(names.names(NORTH_AMERICA, [5]), {5: None})
+        names.names(NORTH_AMERICA, [5])
+        self.assertEqual(self.fake.request_count, 1)
+
+    def test_ttl_and_eviction(self):
+        names = NameCache(self.priot, max_entries=2, ttl=0.1)
+        names.names(NORTH_AMERICA, [1, 2, 3])
+        self.assertEqual(len(names), 2)
+
+        time.sleep(0.15)
+        names.names(NORTH_AMERICA, [3])
+        self.assertEqual(self.fake.request_count, 2)
+
+class EnrichGamesTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeTransport()
+
+    def test_names_on_every_model(self):
+        for models in (api_classes, slotted_classes):
+            with PyRiot('test_key', rate_limits=(), models=models, transport=self.fake) as priot:
+                games = priot.recent_games(NORTH_AMERICA, 5) + priot.recent_games(NORTH_AMERICA, 6)
+                static = StaticData(priot, NORTH_AMERICA)
+                enriched = enrich_games(games, NORTH_AMERICA, NameCache(priot), static)
+            self.assertIs(enriched[0], games[0])
+
+            game = games[0]
+            self.assertEqual(game.champion_name, 'Champion{0}'.format(game.champion_id))
+            self.assertEqual((game.spell1_name, game.spell2_name), ('Flash', 'Ignite'))
+            player = game.fellow_players[0]
+            self.assertEqual(player.summoner_name, 'summoner{0}'.format(player.summoner_id))
+            self.assertEqual(player.champion_name, 'Champion{0}'.format(player.champion_id))
+            items = dict((stat.name, stat.item_name) for stat in game.statistics)
+            self.assertTrue(items['ITEM0'].startswith('Item'))
+            self.assertIsNone(items['WIN'])
+
+    def test_without_static_data(self):
+        with PyRiot('test_key', rate_limits=(), transport=self.fake) as priot:
+            games = enrich_games(priot.recent_games(NORTH_AMERICA, 5), NORTH_AMERICA, NameCache(priot))
+        self.assertEqual(games[0].fellow_players[0].summoner_name, 'summoner6')
+        self.assertFalse(hasattr(games[0], 'champion_name'))
+
+if __name__ == '__main__':
+    unittest.main()
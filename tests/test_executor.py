@@ -0,0 +1,72 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+
+import requests
+
+from pyriot.executor import Call, RegionExecutor, as_call, call
+from pyriot.testing import FakeTransport
+from pyriot.wrapper import EUROPE_WEST, NORTH_AMERICA, PyRiot
+
+class CallTest(unittest.TestCase):
+    def test_as_call(self):
+        self.assertEqual(as_call(('leagues', NORTH_AMERICA, 5)), Call('leagues', NORTH_AMERICA, (5,), {}))
+        self.assertEqual(as_call(call('champions', NORTH_AMERICA, free_to_play=True)),
+                         Call('champions', NORTH_AMERICA, (), {'free_to_play': True}))
+        with self.assertRaises(ValueError):
+            as_call(('leagues',))
+
+class RegionExecutorTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeTransport(latency=0.1)
+
+    def test_results_of_every_call(self):
+        self.fake.add_route(r'/team/by-summoner/\d+$', lambda match, query: (404, {}))
+        calls = [call('summoner_get_by_id', region, summoner_id)
+                 for region in (NORTH_AMERICA, EUROPE_WEST) for summoner_id in range(1, 5)]
+        calls.append(('teams', NORTH_AMERICA, 5))
+
+        with PyRiot('test_key', rate_limits=(), retry=None, transport=self.fake) as priot:
+            with RegionExecutor(priot) as executor:
+                results = list(executor.run(calls))
+
+        self.assertEqual(len(results), 9)
+        names = sorted((done.call.region, done.result.name) for done in results if done.error is None)
+        self.assertEqual(names[0], (EUROPE_WEST, 'summoner1'))
+        self.assertEqual(len(names), 8)
+        failed = [done for done in results if done.error is not None]
+        self.assertEqual(failed[0].call, Call('teams', NORTH_AMERICA, (5,), {}))
+        self.assertIsInstance(failed[0].error, requests.HTTPError)
+
+    def test_regions_are_paced_separately(self):
+        calls = [('summoner_get_by_id', region, summoner_id)
+                 for region in (NORTH_AMERICA, EUROPE_WEST) for summoner_id in range(2)]
+        started = time.time()
+        with PyRiot('test_key', rate_limits=((1, 0.3),), transport=FakeTransport()) as priot:
+            with RegionExecutor(priot, workers_per_region=2) as executor:
+                self.assertEqual(len(list(executor.run(calls))), 4)
+        # one wait per region, at the same time
+        self.assertLess(time.time() - started, 0.55)
+
+    def test_submit(self):
+        with PyRiot('test_key', rate_limits=(), transport=self.fake) as priot:
+            with RegionExecutor(priot) as executor:
+                future = executor.submit('summoner_get_by_id', NORTH_AMERICA, 5)
+                self.assertEqual(future.result().name, 'summoner5')
+                with self.assertRaises(ValueError):
+                    executor.submit('_get', NORTH_AMERICA, 5)
+
+    def test_only_wrapper_functions_run(self):
+        with PyRiot('test_key', rate_limits=(), transport=self.fake) as priot:
+            with RegionExecutor(priot) as executor:
+                for endpoint in ('close', 'map', 'request', 'batch', 'submit_batch'):
+                    with self.assertRaises(ValueError):
+                        executor.submit(endpoint, NORTH_AMERICA)
+                with self.assertRaises(ValueError):
+                    list(executor.run([('leagues', NORTH_AMERICA, 5), ('close', NORTH_AMERICA)]))
+            self.assertEqual(self.fake.request_count, 0)
+            self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,89 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import requests
+
+from pyriot.metrics import Histogram, MetricsRegistry
+from pyriot.testing import FakeTransport
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+class HistogramTest(unittest.TestCase):
+    def test_buckets_and_quantiles(self):
+        histogram = Histogram((0.1, 1.0))
+        self.assertIsNone(histogram.quantile(0.5))
+        for value in (0.05, 0.1, 0.5, 2.0):
+            histogram.observe(value)
+
+        self.assertEqual(histogram.cumulative(), [(0.1, 2), (1.0, 3), (float('inf'), 4)])
+        self.assertEqual((histogram.count, histogram.sum), (4, 2.65))
+        self.assertEqual(histogram.quantile(0.5), 0.1)
+        self.assertEqual(histogram.quantile(0.75), 1.0)
+        self.assertEqual(histogram.quantile(0.99), float('inf'))
+
+class BrokenTransport(FakeTransport):
+    def get(self, region, url, **kwargs):
+        raise requests.ConnectionError('connection refused')
+
+class MetricsRegistryTest(unittest.TestCase):
+    def setUp(self):
+        self.metrics = MetricsRegistry()
+        self.fake = FakeTransport()
+
+    def test_requests_by_status(self):
+        self.fake.add_route(r'/team/by-summoner/\d+$', lambda match, query: (404, {}))
+        with PyRiot('test_key', rate_limits=(), metrics=self.metrics, transport=self.fake) as priot:
+            priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            priot.summoner_get_by_id(NORTH_AMERICA, 6)
+            with self.assertRaises(requests.HTTPError):
+                priot.teams(NORTH_AMERICA, 5)
+
+        self.assertEqual(self.metrics.requests, {
+            ('summoner_get_by_id', NORTH_AMERICA, '200'): 2,
+            ('teams', NORTH_AMERICA, '404'): 1,
+        })
+        self.assertGreater(self.metrics.response_bytes[('summoner_get_by_id', NORTH_AMERICA)], 100)
+        self.assertEqual(self.metrics.latency[('summoner_get_by_id', NORTH_AMERICA)].count, 2)
+        for stage in ('wait', 'first_byte', 'transfer', 'decode'):
+            self.assertEqual(self.metrics.stages[('summoner_get_by_id', NORTH_AMERICA, stage)].count, 2, stage)
+        self.assertEqual(self.metrics.hydration['Summoner'][1], 2)
+
+    def test_errors_without_response(self):
+        with PyRiot('test_key', rate_limits=(), retry=None, metrics=self.metrics, transport=BrokenTransport()) as priot:
+            with self.assertRaises(requests.ConnectionError):
+                priot.summoner_get_by_id(NORTH_AMERICA, 5)
+        self.assertEqual(self.metrics.requests, {('summoner_get_by_id', NORTH_AMERICA, 'error'): 1})
+
+    def test_hydration_counts_returned_objects(self):
+        with PyRiot('test_key', rate_limits=(), metrics=self.metrics, transport=self.fake) as priot:
+            games = priot.recent_games(NORTH_AMERICA, 5)
+        self.assertEqual(self.metrics.hydration['Game'][1], len(games))
+
+    def test_prometheus(self):
+        with PyRiot('test_key', rate_limits=(), metrics=self.metrics, transport=self.fake) as priot:
+            priot.summoner_get_by_id(NORTH_AMERICA, 5)
+        text = self.metrics.prometheus()
+
+        self.assertIn('pyriot_requests_total{endpoint="summoner_get_by_id",region="na",status="200"} 1\n', text)
+        self.assertIn('# TYPE pyriot_request_duration_seconds histogram\n', text)
+        self.assertIn('pyriot_stage_duration_seconds_bucket{endpoint="summoner_get_by_id",region="na",stage="decode",le="+Inf"} 1\n', text)
+        self.assertIn('pyriot_hydrated_objects_total{model="Summoner"} 1\n', text)
+
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'pyriot.prom')
+            self.metrics.write_prometheus(path)
+            with open(path) as written:
+                self.assertEqual(written.read(), text)
+            self.assertEqual(os.listdir(directory), ['pyriot.prom'])
+        finally:
+            shutil.rmtree(directory)
+
+        self.metrics.reset()
+        self.assertEqual(self.metrics.requests, {})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+# -*- coding: utf-8 -*-
+
+import datetime
+import pickle
+import unittest
+
+from pyriot import api_classes, lazy_classes, schema, slotted_classes
+from pyriot.testing import FakeTransport, league_item_payload, summoner_payload
+from pyriot.utils import MISSING
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+def recent_games(models):
+    with PyRiot('test_key', rate_limits=(), models=models, transport=FakeTransport()) as priot:
+        return priot.recent_games(NORTH_AMERICA, 5)
+
+class LazyClassesTest(unittest.TestCase):
+    def test_same_values_as_api_classes(self):
+        eager = recent_games(api_classes)[0]
+        lazy = recent_games(lazy_classes)[0]
+
+        self.assertIsInstance(lazy, api_classes.Game)
+        self.assertEqual(lazy.game_id, eager.game_id)
+        self.assertEqual(lazy.create_date, eager.create_date)
+        self.assertEqual([player.summoner_id for player in lazy.fellow_players],
+                         [player.summoner_id for player in eager.fellow_players])
+        self.assertEqual([stat.value for stat in lazy.statistics], [stat.value for stat in eager.statistics])
+
+    def test_attributes_are_built_once_on_first_read(self):
+        game = recent_games(lazy_classes)[0]
+        self.assertNotIn('fellow_players', vars(game))
+
+        players = game.fellow_players
+        self.assertIn('fellow_players', vars(game))
+        self.assertIs(game.fellow_players, players)
+
+    def test_hydrate(self):
+        game = recent_games(lazy_classes)[0].hydrate()
+        self.assertIn('create_date', vars(game))
+        self.assertIn('summoner_id', vars(game.fellow_players[0]))
+
+    def test_missing_key(self):
+        summoner = lazy_classes.Summoner._from_raw({'id': 5})
+        self.assertEqual(summoner.id, 5)
+        with self.assertRaises(AttributeError):
+            summoner.name
+
+class SlottedClassesTest(unittest.TestCase):
+    def test_endpoints_build_slotted_objects(self):
+        with PyRiot('test_key', rate_limits=(), models=slotted_classes, transport=FakeTransport()) as priot:
+            games = priot.recent_games(NORTH_AMERICA, 5)
+            summaries = priot.stats_summary(NORTH_AMERICA, 5)
+        self.assertIsInstance(games[0], slotted_classes.Game)
+        self.assertFalse(hasattr(games[0], '__dict__'))
+        self.assertIsInstance(summaries[0].aggregated_stats, slotted_classes.AggregatedStats)
+        self.assertEqual(summaries[0].aggregated_stats.total_champion_kills, 100)
+
+    def test_packed_values_that_do_not_fit(self):
+        stats = slotted_classes.AggregatedStats._from_raw({
+                'totalChampionKills': 12,
+                'totalAssists': None,
+                'totalDamageDealt': 2.5,
+                'totalGoldEarned': 2 ** 70})
+        self.assertEqual(stats.total_champion_kills, 12)
+        self.assertIsNone(stats.total_assists)
+        self.assertEqual(stats.total_damage_dealt, 2.5)
+        self.assertEqual(stats.total_gold_earned, 2 ** 70)
+        self.assertIs(stats.total_heal, MISSING)
+
+    def test_pickle_keeps_packed_values(self):
+        stats = slotted_classes.AggregatedStats._from_raw({'totalChampionKills': 12, 'totalDamageDealt': 2.5})
+        copy = pickle.loads(pickle.dumps(stats, 2))
+        self.assertEqual(copy.total_champion_kills, 12)
+        self.assertEqual(copy.total_damage_dealt, 2.5)
+        self.assertIs(copy.total_heal, MISSING)
+
+    def test_pickle_keeps_enrichment_names(self):
+        player = recent_games(slotted_classes)[0].fellow_players[0]
+        player.summoner_name = 'evangs'
+
+        copy = pickle.loads(pickle.dumps(player, 2))
+        self.assertEqual(copy.summoner_id, player.summoner_id)
+        self.assertEqual(copy.summoner_name, 'evangs')
+        self.assertFalse(hasattr(copy, 'champion_name'))
+
+class SchemaTest(unittest.TestCase):
+    def test_every_model_module_has_every_class(self):
+        for name in schema.SCHEMAS:
+            for models in (api_classes, lazy_classes, slotted_classes):
+                self.assertTrue(hasattr(models, name), '{0} missing from {1}'.format(name, models.__name__))
+
+    def test_generated_constructors(self):
+        summoner = api_classes.Summoner(**summoner_payload(5))
+        self.assertEqual(summoner.name, 'summoner5')
+        self.assertIsInstance(summoner.revision_date, datetime.datetime)
+
+        payload = summoner_payload(5)
+        del payload['name']
+        with self.assertRaises(KeyError):
+            api_classes.Summoner(**payload)
+
+    def test_optional_fields(self):
+        item = league_item_payload(5, 10)
+        self.assertFalse(hasattr(api_classes.LeagueItem._from_raw(item), 'mini_series'))
+        self.assertIs(slotted_classes.LeagueItem._from_raw(item).mini_series, MISSING)
+
+if __name__ == '__main__':
+    unittest.main()
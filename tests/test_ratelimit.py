@@ -0,0 +1,84 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+
+import requests
+
+from pyriot.ratelimit import RateLimiter, parse_rate_limit_header
+from pyriot.resilience import RetryPolicy
+from pyriot.testing import FakeTransport
+from pyriot.wrapper import EUROPE_WEST, NORTH_AMERICA, PyRiot
+
+class RateLimiterTest(unittest.TestCase):
+    def test_parse_header(self):
+        self.assertEqual(parse_rate_limit_header('10:1,500:600'), {1: 10, 600: 500})
+
+    def test_paces_requests_over_the_window(self):
+        limiter = RateLimiter(((2, 0.3),))
+        delays = [limiter.reserve('key', NORTH_AMERICA) for _ in range(4)]
+
+        self.assertEqual(delays[:2], [0, 0])
+        self.assertAlmostEqual(delays[2], 0.3, delta=0.05)
+        self.assertAlmostEqual(delays[3], 0.3, delta=0.05)
+
+    def test_buckets_per_key_and_region(self):
+        limiter = RateLimiter(((1, 10),))
+        self.assertEqual(limiter.reserve('key', NORTH_AMERICA), 0)
+        self.assertEqual(limiter.reserve('key', EUROPE_WEST), 0)
+        self.assertEqual(limiter.reserve('other', NORTH_AMERICA), 0)
+        self.assertGreater(limiter.reserve('key', NORTH_AMERICA), 9)
+
+    def test_block(self):
+        limiter = RateLimiter(((100, 1),))
+        limiter.block('key', NORTH_AMERICA, 0.5)
+        self.assertAlmostEqual(limiter.reserve('key', NORTH_AMERICA), 0.5, delta=0.05)
+        self.assertEqual(limiter.reserve('key', EUROPE_WEST), 0)
+
+    def test_block_without_limits(self):
+        limiter = RateLimiter(())
+        self.assertEqual(limiter.reserve('key', NORTH_AMERICA), 0)
+        limiter.block('key', NORTH_AMERICA, 0.5)
+        self.assertAlmostEqual(limiter.reserve('key', NORTH_AMERICA), 0.5, delta=0.05)
+
+    def test_acquire_waits(self):
+        limiter = RateLimiter(((1, 0.2),))
+        started = time.time()
+        limiter.acquire('key', NORTH_AMERICA)
+        limiter.acquire('key', NORTH_AMERICA)
+        self.assertGreaterEqual(time.time() - started, 0.18)
+
+    def test_update_resyncs_counts(self):
+        limiter = RateLimiter(((10, 10),))
+        limiter.update('key', NORTH_AMERICA, {'X-Rate-Limit-Count': '10:10'})
+        self.assertGreater(limiter.reserve('key', NORTH_AMERICA), 9)
+
+    def test_update_switches_to_announced_limits(self):
+        limiter = RateLimiter(((10, 10),))
+        limiter.update('key', NORTH_AMERICA, {'X-App-Rate-Limit': '1:10', 'X-App-Rate-Limit-Count': '1:10'})
+        self.assertGreater(limiter.reserve('key', NORTH_AMERICA), 9)
+
+class ClientRateLimitTest(unittest.TestCase):
+    def test_calls_are_paced(self):
+        fake = FakeTransport()
+        started = time.time()
+        with PyRiot('test_key', rate_limits=((2, 0.3),), transport=fake) as priot:
+            for summoner_id in range(3):
+                priot.summoner_get_by_id(NORTH_AMERICA, summoner_id)
+        self.assertGreaterEqual(time.time() - started, 0.25)
+        self.assertEqual(fake.request_count, 3)
+
+    def test_throttled_response_blocks_the_region(self):
+        fake = FakeTransport(throttle_rate=1, retry_after='0.3')
+        limiter = RateLimiter(())
+        retry = RetryPolicy(max_attempts=2, jitter=False)
+        started = time.time()
+        with PyRiot('test_key', rate_limiter=limiter, retry=retry, transport=fake) as priot:
+            with self.assertRaises(requests.HTTPError):
+                priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            # the retry waited for Retry-After through the limiter
+            self.assertGreaterEqual(time.time() - started, 0.28)
+            self.assertEqual(fake.request_count, 2)
+
+if __name__ == '__main__':
+    unittest.main()
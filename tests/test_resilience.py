@@ -0,0 +1,206 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+
+import requests
+
+from pyriot.resilience import (CLOSED, HALF_OPEN, OPEN, CircuitBreaker, CircuitOpenError, RetryPolicy,
+                               parse_retry_after)
+from pyriot.testing import FakeTransport
+from pyriot.wrapper import EUROPE_WEST, NORTH_AMERICA, PyRiot
+
+from .helpers import AsyncPyRiot, AsyncTestCase, asyncio, requires_async
+
+def failing(statuses):
+    """
+    Route handler answering with the given statuses first, then a summoner.
+    """
+    statuses = list(statuses)
+
+    def handler(match, query):
+        if statuses:
+            return statuses.pop(0), {}
+        return {'5': {'id': 5, 'name': 'summoner5', 'profileIconId': 0, 'revisionDate': 0, 'summonerLevel': 30}}
+    return handler
+
+class FlakyTransport(FakeTransport):
+    def __init__(self, errors):
+        FakeTransport.__init__(self)
+        self.errors = errors
+
+    def get(self, region, url, **kwargs):
+        if self.errors:
+            self.errors -= 1
+            raise requests.ConnectionError('connection reset')
+        return FakeTransport.get(self, region, url, **kwargs)
+
+class RetryPolicyTest(unittest.TestCase):
+    def test_parse_retry_after(self):
+        self.assertEqual(parse_retry_after('5'), 5.0)
+        self.assertEqual(parse_retry_after('-1'), 0.0)
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after('soon'))
+        self.assertEqual(parse_retry_after('Thu, 01 Jan 1970 00:01:40 GMT', now=40), 60.0)
+
+    def test_exponential_backoff(self):
+        policy = RetryPolicy(max_attempts=3, backoff=0.1, jitter=False)
+        started = time.time()
+        self.assertEqual(policy.retry_delay(1, started, 503), 0.1)
+        self.assertEqual(policy.retry_delay(2, started, 503), 0.2)
+        self.assertIsNone(policy.retry_delay(3, started, 503))
+
+    def test_only_retryable_failures(self):
+        policy = RetryPolicy(jitter=False)
+        started = time.time()
+        self.assertIsNone(policy.retry_delay(1, started, 404))
+        self.assertIsNotNone(policy.retry_delay(1, started))
+        self.assertIsNone(RetryPolicy(retry_errors=False).retry_delay(1, started))
+
+    def test_retry_after_and_deadline(self):
+        started = time.time()
+        self.assertEqual(RetryPolicy().retry_delay(1, started, 429, {'Retry-After': '2'}), 2.0)
+        self.assertIsNone(RetryPolicy(deadline=1).retry_delay(1, started, 429, {'Retry-After': '2'}))
+
+class ClientRetryTest(unittest.TestCase):
+    def test_server_errors_are_retried(self):
+        fake = FakeTransport()
+        fake.add_route(r'/summoner/5$', failing([503, 500]))
+        with PyRiot('test_key', rate_limits=(), retry=RetryPolicy(backoff=0.01, jitter=False), transport=fake) as priot:
+            self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+        self.assertEqual(fake.request_count, 3)
+
+    def test_gives_up_after_max_attempts(self):
+        fake = FakeTransport()
+        fake.add_route(r'/summoner/5$', failing([503] * 5))
+        retry = RetryPolicy(max_attempts=2, backoff=0.01, jitter=False)
+        with PyRiot('test_key', rate_limits=(), retry=retry, transport=fake) as priot:
+            with self.assertRaises(requests.HTTPError):
+                priot.summoner_get_by_id(NORTH_AMERICA, 5)
+        self.assertEqual(fake.request_count, 2)
+
+    def test_client_errors_are_not_retried(self):
+        fake = FakeTransport()
+        fake.add_route(r'/summoner/5$', failing([404]))
+        with PyRiot('test_key', rate_limits=(), transport=fake) as priot:
+            with self.assertRaises(requests.HTTPError):
+                priot.summoner_get_by_id(NORTH_AMERICA, 5)
+        self.assertEqual(fake.request_count, 1)
+
+    def test_connection_errors_are_retried(self):
+        transport = FlakyTransport(errors=2)
+        with PyRiot('test_key', rate_limits=(), retry=RetryPolicy(backoff=0.01, jitter=False), transport=transport) as priot:
+            self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+
+        transport = FlakyTransport(errors=1)
+        with PyRiot('test_key', rate_limits=(), retry=None, transport=transport) as priot:
+            with self.assertRaises(requests.ConnectionError):
+                priot.summoner_get_by_id(NORTH_AMERICA, 5)
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker(failure_threshold=2, recovery_time=10)
+        breaker.record_failure(NORTH_AMERICA)
+        breaker.record_success(NORTH_AMERICA)
+        breaker.record_failure(NORTH_AMERICA)
+        self.assertEqual(breaker.state(NORTH_AMERICA), CLOSED)
+
+        breaker.record_failure(NORTH_AMERICA)
+        self.assertEqual(breaker.state(NORTH_AMERICA), OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request(NORTH_AMERICA)
+        self.assertIsNone(breaker.before_request(EUROPE_WEST))
+
+    def test_half_open_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.1)
+        breaker.record_failure(NORTH_AMERICA)
+        time.sleep(0.15)
+
+        probe = breaker.before_request(NORTH_AMERICA)
+        self.assertIsNotNone(probe)
+        self.assertEqual(breaker.state(NORTH_AMERICA), HALF_OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request(NORTH_AMERICA)
+
+        breaker.record_success(NORTH_AMERICA)
+        self.assertEqual(breaker.state(NORTH_AMERICA), CLOSED)
+        self.assertIsNone(breaker.before_request(NORTH_AMERICA))
+
+    def test_failed_probe_reopens(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.1)
+        breaker.record_failure(NORTH_AMERICA)
+        time.sleep(0.15)
+
+        breaker.before_request(NORTH_AMERICA)
+        breaker.record_failure(NORTH_AMERICA)
+        self.assertEqual(breaker.state(NORTH_AMERICA), OPEN)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request(NORTH_AMERICA)
+
+    def test_ended_probe_lets_the_next_request_probe(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.1)
+        breaker.record_failure(NORTH_AMERICA)
+        time.sleep(0.15)
+
+        probe = breaker.before_request(NORTH_AMERICA)
+        # a stale id does not end the current probe
+        breaker.end_probe(NORTH_AMERICA, probe - 1)
+        with self.assertRaises(CircuitOpenError):
+            breaker.before_request(NORTH_AMERICA)
+
+        breaker.end_probe(NORTH_AMERICA, probe)
+        self.assertEqual(breaker.before_request(NORTH_AMERICA), probe + 1)
+
+    def test_probe_timeout(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.1, probe_timeout=0.1)
+        breaker.record_failure(NORTH_AMERICA)
+        time.sleep(0.15)
+
+        breaker.before_request(NORTH_AMERICA)
+        time.sleep(0.15)
+        self.assertIsNotNone(breaker.before_request(NORTH_AMERICA))
+
+    def test_client_transitions(self):
+        fake = FakeTransport()
+        fake.add_route(r'/summoner/5$', failing([500, 500, 500]))
+        breaker = CircuitBreaker(failure_threshold=2, recovery_time=0.2)
+        with PyRiot('test_key', rate_limits=(), retry=None, circuit_breaker=breaker, transport=fake) as priot:
+            for _ in range(2):
+                with self.assertRaises(requests.HTTPError):
+                    priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            with self.assertRaises(CircuitOpenError):
+                priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            self.assertEqual(fake.request_count, 2)
+
+            # the failed probe reopens the circuit
+            time.sleep(0.25)
+            with self.assertRaises(requests.HTTPError):
+                priot.summoner_get_by_id(NORTH_AMERICA, 5)
+            self.assertEqual(breaker.state(NORTH_AMERICA), OPEN)
+
+            time.sleep(0.25)
+            self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+            self.assertEqual(breaker.state(NORTH_AMERICA), CLOSED)
+
+@requires_async
+class AsyncCircuitBreakerTest(AsyncTestCase):
+    def test_cancelled_probe_releases_the_circuit(self):
+        breaker = CircuitBreaker(failure_threshold=1, recovery_time=0.1)
+        breaker.record_failure(NORTH_AMERICA)
+        time.sleep(0.15)
+
+        priot = AsyncPyRiot('test_key', rate_limits=(), circuit_breaker=breaker)
+        # the probe waits on the limiter, where it is cancelled before sending
+        priot.rate_limiter.block('test_key', NORTH_AMERICA, 10)
+        task = self.loop.create_task(priot.summoner_get_by_id(NORTH_AMERICA, 5))
+        self.run_async(asyncio.sleep(0.05))
+        task.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            self.run_async(task)
+        self.run_async(priot.close())
+
+        self.assertEqual(breaker.state(NORTH_AMERICA), HALF_OPEN)
+        self.assertIsNotNone(breaker.before_request(NORTH_AMERICA))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,62 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from pyriot.static_data import StaticData
+from pyriot.testing import STATIC_DATA_VERSION, FakeTransport, static_versions_payload
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+class StaticDataTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.fake = FakeTransport()
+        self.priot = PyRiot('test_key', rate_limits=(), transport=self.fake)
+
+    def tearDown(self):
+        self.priot.close()
+        shutil.rmtree(self.directory)
+
+    def test_lookups(self):
+        static = StaticData(self.priot, NORTH_AMERICA)
+        self.assertEqual(static.champion(1)['name'], 'Champion1')
+        self.assertEqual(static.champion_by_name('CHAMPION1')['id'], 1)
+        self.assertEqual(static.summoner_spell(4)['name'], 'Flash')
+        self.assertEqual(static.item('1001')['name'], 'Item1001')
+        self.assertEqual(static.rune_by_name('rune5000')['id'], 5000)
+        self.assertEqual(static.mastery(4100)['name'], 'Talent4100')
+        self.assertIsNone(static.champion(999))
+        self.assertEqual(static.version, STATIC_DATA_VERSION)
+        # the versions and one request per dataset
+        self.assertEqual(self.fake.request_count, 6)
+
+    def test_snapshots_are_reused(self):
+        StaticData(self.priot, NORTH_AMERICA, directory=self.directory).champion(1)
+        self.assertEqual(os.listdir(self.directory), ['static-na-default-{0}.json.gz'.format(STATIC_DATA_VERSION)])
+        sent = self.fake.request_count
+
+        static = StaticData(self.priot, NORTH_AMERICA, directory=self.directory)
+        self.assertEqual(static.champion(1)['name'], 'Champion1')
+        self.assertEqual(static.snapshot_versions(), [STATIC_DATA_VERSION])
+        self.assertEqual(self.fake.request_count, sent)
+
+    def test_pinned_version(self):
+        static = StaticData(self.priot, NORTH_AMERICA, directory=self.directory, version='4.4.2')
+        static.champion(1)
+        self.assertEqual(static.version, '4.4.2')
+        self.assertEqual(static.snapshot_versions(), ['4.4.2'])
+
+    def test_refresh(self):
+        static = StaticData(self.priot, NORTH_AMERICA)
+        static.load()
+        self.assertFalse(static.refresh())
+
+        self.fake.add_route(r'/versions$', lambda match, query: ['4.5.1'] + static_versions_payload())
+        self.assertTrue(static.refresh())
+        self.assertEqual(static.version, '4.5.1')
+        self.assertEqual(static.champion(1)['name'], 'Champion1')
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,166 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import unittest
+
+import requests
+
+from pyriot.cache import ResponseCache
+from pyriot.sync import ConditionalFetcher, GameSyncState, MemoryStore, RecentGamesSync, SQLiteStore
+from pyriot.testing import FakeTransport, game_payload, summoner_payload
+from pyriot.wrapper import NORTH_AMERICA, PyRiot
+
+class FakeLadder(object):
+    """
+    Summoners whose revision dates and recent games the tests change between syncs.
+    """
+    def __init__(self, summoner_ids):
+        self.revision_dates = dict((summoner_id, 1000) for summoner_id in summoner_ids)
+        self.games = dict((summoner_id, [summoner_id * 10 + index for index in range(3)])
+                          for summoner_id in summoner_ids)
+        self.failing = set()
+
+        self.transport = FakeTransport()
+        self.transport.add_route(r'/summoner/(?P<ids>[\d,]+)$', self.summoners)
+        self.transport.add_route(r'/game/by-summoner/(?P<id>\d+)/recent$', self.recent_games)
+
+    def summoners(self, match, query):
+        summoners = dict()
+        for summoner_id in match.group('ids').split(','):
+            summoner = summoner_payload(int(summoner_id))
+            summoner['revisionDate'] = self.revision_dates[int(summoner_id)]
+            summoners[summoner_id] = summoner
+        return summoners
+
+    def recent_games(self, match, query):
+        summoner_id = int(match.group('id'))
+        if summoner_id in self.failing:
+            return 500, {}
+        games = [game_payload(summoner_id, game_id) for game_id in self.games[summoner_id]]
+        return {'games': games, 'summonerId': summoner_id}
+
+    def play(self, summoner_id):
+        self.games[summoner_id].append(max(self.games[summoner_id]) + 1)
+        self.revision_dates[summoner_id] += 1
+
+def game_ids(games):
+    return dict((summoner_id, [game.game_id for game in summoner_games])
+                for summoner_id, summoner_games in games.items())
+
+class RecentGamesSyncTest(unittest.TestCase):
+    def setUp(self):
+        self.ladder = FakeLadder([1, 2])
+
+    def client(self, **kwargs):
+        return PyRiot('test_key', rate_limits=(), retry=None, transport=self.ladder.transport, **kwargs)
+
+    def test_only_new_games_are_returned(self):
+        with self.client() as priot:
+            games_sync = RecentGamesSync(priot)
+            self.assertEqual(game_ids(games_sync.sync(NORTH_AMERICA, [1, 2])),
+                             {1: [10, 11, 12], 2: [20, 21, 22]})
+            self.assertEqual(games_sync.state(NORTH_AMERICA, 1).game_id, 12)
+
+            self.ladder.play(2)
+            self.assertEqual(game_ids(games_sync.sync(NORTH_AMERICA, [1, 2])), {2: [23]})
+            self.assertEqual((games_sync.checked, games_sync.fetched), (4, 3))
+
+    def test_unchanged_summoners_are_not_fetched(self):
+        with self.client() as priot:
+            games_sync = RecentGamesSync(priot)
+            games_sync.sync(NORTH_AMERICA, [1, 2])
+            sent = self.ladder.transport.request_count
+
+            self.assertEqual(games_sync.sync(NORTH_AMERICA, [1, 2]), {})
+            # only the revision date check
+            self.assertEqual(self.ladder.transport.request_count, sent + 1)
+
+    def test_failed_fetch_keeps_every_state(self):
+        with self.client() as priot:
+            games_sync = RecentGamesSync(priot)
+            self.ladder.failing.add(2)
+            with self.assertRaises(requests.HTTPError):
+                games_sync.sync(NORTH_AMERICA, [1, 2])
+            self.assertIsNone(games_sync.state(NORTH_AMERICA, 1))
+            self.assertIsNone(games_sync.state(NORTH_AMERICA, 2))
+
+            # the next sync returns the games of summoner 1 again
+            self.ladder.failing.clear()
+            self.assertEqual(game_ids(games_sync.sync(NORTH_AMERICA, [1, 2])),
+                             {1: [10, 11, 12], 2: [20, 21, 22]})
+
+    def test_changes_are_seen_through_a_response_cache(self):
+        with self.client(cache=ResponseCache()) as priot:
+            games_sync = RecentGamesSync(priot)
+            games_sync.sync(NORTH_AMERICA, [1, 2])
+
+            self.ladder.play(1)
+            self.assertEqual(game_ids(games_sync.sync(NORTH_AMERICA, [1, 2])), {1: [13]})
+
+    def test_reset(self):
+        with self.client() as priot:
+            games_sync = RecentGamesSync(priot)
+            games_sync.sync(NORTH_AMERICA, [1])
+            games_sync.reset(NORTH_AMERICA, 1)
+            self.assertEqual(game_ids(games_sync.sync(NORTH_AMERICA, [1])), {1: [10, 11, 12]})
+
+class ConditionalFetcherTest(unittest.TestCase):
+    def setUp(self):
+        self.ladder = FakeLadder([1, 2])
+        self.ladder.transport.add_route(r'/team/by-summoner/2$', lambda match, query: (404, {}))
+
+    def test_unchanged_summoners_are_served_from_snapshots(self):
+        with PyRiot('test_key', rate_limits=(), cache=ResponseCache(), transport=self.ladder.transport) as priot:
+            fetcher = ConditionalFetcher(priot, endpoints=('stats_summary', 'teams'))
+            results = fetcher.fetch(NORTH_AMERICA, [1, 2])
+            self.assertEqual(len(results[1]['stats_summary']), 4)
+            self.assertIsNone(results[2]['teams'])
+            self.assertEqual(fetcher.fetched['teams'], 2)
+
+            results = fetcher.fetch(NORTH_AMERICA, [1, 2])
+            self.assertEqual(len(results[1]['teams']), 2)
+            self.assertEqual(fetcher.served['teams'], 2)
+
+            self.ladder.revision_dates[1] += 1
+            fetcher.fetch(NORTH_AMERICA, [1, 2])
+            self.assertEqual((fetcher.fetched['teams'], fetcher.served['teams']), (3, 3))
+
+    def test_unknown_endpoint(self):
+        with PyRiot('test_key', rate_limits=(), transport=self.ladder.transport) as priot:
+            with self.assertRaises(ValueError):
+                ConditionalFetcher(priot).fetch(NORTH_AMERICA, [1], endpoints=['_get'])
+            with self.assertRaises(ValueError):
+                ConditionalFetcher(priot).fetch(NORTH_AMERICA, [1], endpoints=['teams', 'close'])
+        self.assertEqual(self.ladder.transport.request_count, 0)
+
+class StoreTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'sync.db')
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_memory_store(self):
+        store = MemoryStore()
+        store.set(('recent_games', NORTH_AMERICA, 1), GameSyncState(1, 2, 3))
+        self.assertEqual(store.get(('recent_games', NORTH_AMERICA, 1)), GameSyncState(1, 2, 3))
+        store.delete(('recent_games', NORTH_AMERICA, 1))
+        self.assertIsNone(store.get(('recent_games', NORTH_AMERICA, 1)))
+
+    def test_sqlite_store_is_kept_across_instances(self):
+        ladder = FakeLadder([1])
+        with PyRiot('test_key', rate_limits=(), transport=ladder.transport) as priot:
+            store = SQLiteStore(self.path)
+            RecentGamesSync(priot, store).sync(NORTH_AMERICA, [1])
+            store.close()
+
+            store = SQLiteStore(self.path)
+            self.assertEqual(len(store), 1)
+            self.assertEqual(RecentGamesSync(priot, store).sync(NORTH_AMERICA, [1]), {})
+            store.close()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,155 @@
+# -*- coding: utf-8 -*-
+
+import os
+import shutil
+import tempfile
+import time
+import unittest
+
+from pyriot.testing import FakeTransport
+from pyriot.transport import RecordingTransport, ReplayMissError, ReplayTransport, read_archive, request_key
+from pyriot.wrapper import EUROPE_WEST, NORTH_AMERICA, RAW_BYTES, PyRiot
+
+from .helpers import AsyncPyRiot, AsyncTestCase, asyncio, requires_async
+
+SUMMONER_URL = 'http://any.host/api/lol/na/v1.4/summoner/{0}?api_key=key'
+
+class RecordReplayTest(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.path = os.path.join(self.directory, 'traffic.jsonl.gz')
+        self.fake = FakeTransport()
+        self.calls = 0
+
+        def changing(match, query):
+            self.calls += 1
+            return [{'id': 1, 'name': 'call{0}'.format(self.calls)}]
+        self.fake.add_route(r'/team/by-summoner/\d+$', changing)
+        self.fake.add_route(r'/league/by-summoner/\d+$', lambda match, query: (404, {}))
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def record(self, *calls):
+        bodies = []
+        with PyRiot('secret_key', rate_limits=(), transport=RecordingTransport(self.fake, self.path)) as priot:
+            for endpoint, region, args in calls:
+                bodies.append(getattr(priot, endpoint)(region, *args, raw=RAW_BYTES))
+        return bodies
+
+    def test_round_trip(self):
+        recorded = self.record(('summoner_get_by_id', NORTH_AMERICA, (5,)),
+                               ('summoner_get_by_id', EUROPE_WEST, (5,)),
+                               ('champions', NORTH_AMERICA, ()))
+
+        exchanges = list(read_archive(self.path))
+        self.assertEqual([exchange['request'] for exchange in exchanges],
+                         ['/api/lol/na/v1.4/summoner/5', '/api/lol/euw/v1.4/summoner/5',
+                          '/api/lol/na/v1.2/champion?freeToPlay=False'])
+        self.assertFalse([exchange for exchange in exchanges if 'secret_key' in repr(exchange)])
+
+        replay = ReplayTransport(self.path)
+        self.assertEqual(len(replay), 3)
+        with PyRiot('other_key', base_url='http://other.host/api/lol', rate_limits=(), transport=replay) as priot:
+            replayed = [priot.summoner_get_by_id(NORTH_AMERICA, 5, raw=RAW_BYTES),
+                        priot.summoner_get_by_id(EUROPE_WEST, 5, raw=RAW_BYTES),
+                        priot.champions(NORTH_AMERICA, raw=RAW_BYTES)]
+            summoner = priot.summoner_get_by_id(NORTH_AMERICA, 5)
+
+        self.assertEqual(replayed, recorded)
+        self.assertEqual(summoner.id, 5)
+        self.assertEqual(self.fake.request_count, 3)
+
+    def test_errors_are_replayed(self):
+        self.fake.add_route(r'/summoner/\d+$', lambda match, query: (500, {}))
+        with self.assertRaises(Exception):
+            self.record(('leagues', NORTH_AMERICA, (5,)))
+
+        with PyRiot('test_key', rate_limits=(), retry=None, transport=ReplayTransport(self.path)) as priot:
+            with self.assertRaises(Exception) as error:
+                priot.leagues(NORTH_AMERICA, 5)
+        self.assertEqual(error.exception.response.status_code, 404)
+
+    def test_miss(self):
+        self.record(('summoner_get_by_id', NORTH_AMERICA, (5,)))
+        replay = ReplayTransport(self.path)
+        with PyRiot('test_key', rate_limits=(), transport=replay) as priot:
+            with self.assertRaises(ReplayMissError):
+                priot.summoner_get_by_id(NORTH_AMERICA, 6)
+            with self.assertRaises(ReplayMissError):
+                priot.summoner_get_by_id(EUROPE_WEST, 5)
+        self.assertEqual(replay.misses, 2)
+
+    def test_repeated_requests_loop_or_repeat_the_last(self):
+        self.record(*[('teams', NORTH_AMERICA, (5,))] * 2)
+        url = 'http://any.host/api/lol/na/v2.2/team/by-summoner/5?api_key=key'
+
+        replay = ReplayTransport(self.path)
+        self.assertEqual([replay.get(NORTH_AMERICA, url).json()[0]['name'] for _ in range(3)],
+                         ['call1', 'call2', 'call1'])
+        replay.rewind()
+        self.assertEqual(replay.get(NORTH_AMERICA, url).json()[0]['name'], 'call1')
+
+        replay = ReplayTransport(self.path, loop=False)
+        self.assertEqual([replay.get(NORTH_AMERICA, url).json()[0]['name'] for _ in range(3)],
+                         ['call1', 'call2', 'call2'])
+
+    def test_time_scale(self):
+        self.fake.latency = 0.2
+        self.record(('summoner_get_by_id', NORTH_AMERICA, (5,)))
+        url = SUMMONER_URL.format(5)
+
+        started = time.time()
+        response = ReplayTransport(self.path).get(NORTH_AMERICA, url)
+        self.assertLess(time.time() - started, 0.1)
+        self.assertEqual(response.elapsed.total_seconds(), 0)
+
+        started = time.time()
+        response = ReplayTransport(self.path, time_scale=0.5).get(NORTH_AMERICA, url)
+        self.assertGreaterEqual(time.time() - started, 0.09)
+        self.assertGreaterEqual(response.elapsed.total_seconds(), 0.09)
+
+    def test_pace_keeps_the_recorded_spacing(self):
+        recording = RecordingTransport(self.fake, self.path)
+        for summoner_id in (5, 6):
+            recording.get(NORTH_AMERICA, SUMMONER_URL.format(summoner_id))
+            time.sleep(0.3)
+        recording.close()
+        self.assertGreaterEqual([exchange['at'] for exchange in read_archive(self.path)][1], 0.3)
+
+        for pace, spacing in ((False, 0), (True, 0.3)):
+            replay = ReplayTransport(self.path, time_scale=1, pace=pace)
+            started = time.time()
+            replay.get(NORTH_AMERICA, SUMMONER_URL.format(5))
+            replay.get(NORTH_AMERICA, SUMMONER_URL.format(6))
+            self.assertGreaterEqual(time.time() - started, spacing)
+            self.assertLess(time.time() - started, spacing + 0.2)
+
+    def test_request_key(self):
+        self.assertEqual(request_key('https://na.api.pvp.net/api/lol/na/v1.1/summoner/5?api_key=key'),
+                         '/api/lol/na/v1.1/summoner/5')
+
+@requires_async
+class AsyncReplayTest(AsyncTestCase):
+    def test_replay_recorded_traffic(self):
+        directory = tempfile.mkdtemp()
+        try:
+            path = os.path.join(directory, 'traffic.jsonl.gz')
+            with PyRiot('test_key', rate_limits=(), transport=RecordingTransport(FakeTransport(), path)) as priot:
+                recorded = [priot.summoner_get_by_id(NORTH_AMERICA, summoner_id).name for summoner_id in range(3)]
+
+            replay = ReplayTransport(path)
+            priot = AsyncPyRiot('other_key', rate_limits=(), transport=replay)
+            summoners = self.run_async(asyncio.gather(*[priot.summoner_get_by_id(NORTH_AMERICA, summoner_id)
+                                                        for summoner_id in range(3)]))
+            with self.assertRaises(ReplayMissError):
+                self.run_async(priot.summoner_get_by_id(NORTH_AMERICA, 3))
+            self.run_async(priot.close())
+        finally:
+            shutil.rmtree(directory)
+
+        self.assertEqual([summoner.name for summoner in summoners], recorded)
+        self.assertEqual((replay.count, replay.misses), (3, 1))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,194 @@
+# -*- coding: utf-8 -*-
+
+import time
+import unittest
+
+import requests
+
+from pyriot import api_classes
+from pyriot.metrics import MetricsRegistry
+from pyriot.resilience import RetryPolicy
+from pyriot.testing import FakeRiotServer, FakeTransport, summoner_id_for_name
+from pyriot.wrapper import NORTH_AMERICA, RAW_BYTES, RAW_JSON, PyRiot
+
+from .helpers import AsyncPyRiot, AsyncTestCase, AsyncTransport, aiohttp, asyncio, requires_async
+
+def client(transport=None, **kwargs):
+    kwargs.setdefault('rate_limits', ())
+    return PyRiot('test_key', transport=transport or FakeTransport(), **kwargs)
+
+class EndpointTest(unittest.TestCase):
+    def setUp(self):
+        self.fake = FakeTransport()
+        self.priot = client(self.fake)
+
+    def tearDown(self):
+        self.priot.close()
+
+    def test_champions(self):
+        champions = self.priot.champions(NORTH_AMERICA)
+        self.assertEqual(len(champions), 120)
+        self.assertIsInstance(champions[1], api_classes.Champion)
+        self.assertEqual(champions[1].id, 1)
+
+    def test_recent_games(self):
+        games = self.priot.recent_games(NORTH_AMERICA, 5)
+        self.assertEqual(len(games), 10)
+        self.assertEqual([game.game_id for game in games], list(range(50, 60)))
+        self.assertTrue(games[0].fellow_players)
+
+    def test_leagues(self):
+        leagues = self.priot.leagues(NORTH_AMERICA, 5)
+        self.assertEqual(list(leagues), ['5'])
+        self.assertTrue(leagues['5'].entries)
+
+    def test_stats(self):
+        summaries = self.priot.stats_summary(NORTH_AMERICA, 5)
+        self.assertEqual(len(summaries), 4)
+        self.assertIsInstance(summaries[0], api_classes.PlayerStatsSummary)
+
+        ranked = self.priot.stats_ranked(NORTH_AMERICA, 5)
+        self.assertIsInstance(ranked, api_classes.PlayerRankedStats)
+        self.assertEqual(ranked.champions[0].name, 'Champion1')
+
+    def test_pages(self):
+        masteries = self.priot.summoner_masteries(NORTH_AMERICA, 5)
+        runes = self.priot.summoner_runes(NORTH_AMERICA, 5)
+        self.assertEqual(len(masteries), 3)
+        self.assertEqual(len(runes), 3)
+        self.assertTrue(masteries[0].current)
+        self.assertTrue(runes[0].slots)
+
+    def test_summoners(self):
+        summoner = self.priot.summoner_get_by_id(NORTH_AMERICA, 5)
+        self.assertEqual((summoner.id, summoner.name), (5, 'summoner5'))
+
+        summoner = self.priot.summoner_get_by_name(NORTH_AMERICA, 'evangs')
+        self.assertEqual((summoner.id, summoner.name), (summoner_id_for_name('evangs'), 'evangs'))
+
+        self.assertEqual(self.priot.summoner_get_names_for_ids(NORTH_AMERICA, '5,6'), {5: 'summoner5', 6: 'summoner6'})
+
+    def test_bulk_summoners_are_chunked(self):
+        summoners = self.priot.summoners_by_ids(NORTH_AMERICA, range(1, 101))
+        self.assertEqual(sorted(summoners), list(range(1, 101)))
+        self.assertEqual(self.fake.request_count, 3)
+
+        by_name = self.priot.summoners_by_names(NORTH_AMERICA, ['a', 'b', 'a'])
+        self.assertEqual(sorted(by_name), ['a', 'b'])
+
+    def test_teams(self):
+        teams = self.priot.teams(NORTH_AMERICA, 5)
+        self.assertEqual([team.full_id for team in teams], ['TEAM-5-0', 'TEAM-5-1'])
+
+    def test_raw_modes(self):
+        body = self.priot.summoner_get_by_id(NORTH_AMERICA, 5, raw=RAW_BYTES)
+        self.assertIsInstance(body, bytes)
+        content = self.priot.summoner_get_by_id(NORTH_AMERICA, 5, raw=RAW_JSON)
+        self.assertEqual(content['5']['name'], 'summoner5')
+
+        # a raw client returns bodies unless a call asks for objects
+        with PyRiot('test_key', rate_limits=(), raw=RAW_JSON, transport=self.fake) as raw_priot:
+            self.assertEqual(raw_priot.teams(NORTH_AMERICA, 5)[0]['fullId'], 'TEAM-5-0')
+            self.assertEqual(raw_priot.teams(NORTH_AMERICA, 5, raw=False)[0].full_id, 'TEAM-5-0')
+
+        with self.assertRaises(ValueError):
+            self.priot.summoner_get_by_id(NORTH_AMERICA, 5, raw='xml')
+
+    def test_not_found_raises(self):
+        self.fake.add_route(r'/summoner/7$', lambda match, query: (404, {}))
+        with self.assertRaises(requests.HTTPError) as raised:
+            self.priot.summoner_get_by_id(NORTH_AMERICA, 7)
+        self.assertEqual(raised.exception.response.status_code, 404)
+
+    def test_over_http(self):
+        with FakeRiotServer() as server:
+            with PyRiot('test_key', base_url=server.base_url, rate_limits=()) as priot:
+                self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+            self.assertEqual(server.request_count, 1)
+
+class BatchTest(unittest.TestCase):
+    def test_results_in_order_with_errors_in_place(self):
+        fake = FakeTransport(latency=0.1)
+        fake.add_route(r'/team/by-summoner/\d+$', lambda match, query: (404, {}))
+        with client(fake, retry=None) as priot:
+            summoner, leagues, teams = priot.batch([
+                    ('summoner_get_by_id', NORTH_AMERICA, 5),
+                    ('leagues', NORTH_AMERICA, 5),
+                    ('teams', NORTH_AMERICA, 5)])
+        self.assertEqual(summoner.name, 'summoner5')
+        self.assertEqual(list(leagues), ['5'])
+        self.assertIsInstance(teams, requests.HTTPError)
+
+    def test_unknown_endpoint_sends_nothing(self):
+        fake = FakeTransport()
+        with client(fake) as priot:
+            for endpoint in ('_get', 'close', 'map', 'request', 'batch'):
+                with self.assertRaises(ValueError):
+                    priot.batch([('leagues', NORTH_AMERICA, 5), (endpoint, NORTH_AMERICA)])
+            self.assertEqual(fake.request_count, 0)
+            self.assertEqual(priot.summoner_get_by_id(NORTH_AMERICA, 5).name, 'summoner5')
+
+@requires_async
+class AsyncEndpointTest(AsyncTestCase):
+    def test_over_http(self):
+        with FakeRiotServer() as server:
+            priot = AsyncPyRiot('test_key', base_url=server.base_url, rate_limits=())
+            summoner, teams = self.run_async(asyncio.gather(
+                    priot.summoner_get_by_id(NORTH_AMERICA, 5),
+                    priot.teams(NORTH_AMERICA, 5)))
+            with self.assertRaises(aiohttp.ClientResponseError) as raised:
+                self.run_async(priot.summoner_get_by_id(NORTH_AMERICA, 'missing'))
+            self.run_async(priot.close())
+
+        self.assertEqual(summoner.name, 'summoner5')
+        self.assertEqual(len(teams), 2)
+        self.assertEqual(raised.exception.status, 404)
+
+    def test_blocking_transport(self):
+        fake = FakeTransport(latency=0.2)
+        fake.add_route(r'/team/by-summoner/\d+$', lambda match, query: (404, {}))
+        metrics = MetricsRegistry()
+        priot = AsyncPyRiot('test_key', rate_limits=(), transport=fake, metrics=metrics)
+
+        started = time.time()
+        summoners = self.run_async(asyncio.gather(*[priot.summoner_get_by_id(NORTH_AMERICA, summoner_id)
+                                                    for summoner_id in range(5)]))
+        self.assertLess(time.time() - started, 0.6)
+        with self.assertRaises(requests.HTTPError) as raised:
+            self.run_async(priot.teams(NORTH_AMERICA, 5))
+        self.run_async(priot.close())
+
+        self.assertEqual([summoner.id for summoner in summoners], list(range(5)))
+        self.assertEqual(raised.exception.response.status_code, 404)
+        self.assertEqual(fake.request_count, 6)
+        self.assertEqual(metrics.requests[('summoner_get_by_id', NORTH_AMERICA, '200')], 5)
+        self.assertGreaterEqual(metrics.stages[('summoner_get_by_id', NORTH_AMERICA, 'first_byte')].sum, 1.0)
+
+    def test_coroutine_transport(self):
+        transport = AsyncTransport(failures=1)
+        priot = AsyncPyRiot('test_key', rate_limits=(), transport=transport,
+                            retry=RetryPolicy(max_attempts=2, backoff=0))
+        summoner = self.run_async(priot.summoner_get_by_id(NORTH_AMERICA, 5))
+        self.run_async(priot.close())
+
+        self.assertEqual(summoner.name, 'summoner5')
+        self.assertEqual(transport.attempts, 2)
+        self.assertTrue(transport.closed)
+        self.assertIsNone(priot._session)
+
+    def test_batch(self):
+        fake = FakeTransport()
+        fake.add_route(r'/team/by-summoner/\d+$', lambda match, query: (404, {}))
+        priot = AsyncPyRiot('test_key', rate_limits=(), retry=None, transport=fake)
+        with self.assertRaises(ValueError):
+            self.run_async(priot.batch([('leagues', NORTH_AMERICA, 5), ('close', NORTH_AMERICA)]))
+        self.assertEqual(fake.request_count, 0)
+
+        summoner, teams = self.run_async(priot.batch([('summoner_get_by_id', NORTH_AMERICA, 5),
+                                                      ('teams', NORTH_AMERICA, 5)]))
+        self.run_async(priot.close())
+        self.assertEqual(summoner.name, 'summoner5')
+        self.assertIsInstance(teams, requests.HTTPError)
+
+if __name__ == '__main__':
+    unittest.main()